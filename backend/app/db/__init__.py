@@ -1,12 +1,37 @@
 # backend/app/db/__init__.py
 
-from .session import engine, SessionLocal, get_db, DATABASE_URL
+from .session import (
+    engine,
+    SessionLocal,
+    get_db,
+    get_sync_db,
+    async_engine,
+    AsyncSessionLocal,
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    async_pool_stats,
+    sync_pool_stats,
+    db_pool_status,
+    create_schema,
+    warm_pool,
+    dispose_engines,
+)
 from .base import Base
 
 __all__ = [
     "engine",
     "SessionLocal",
     "get_db",
+    "get_sync_db",
+    "async_engine",
+    "AsyncSessionLocal",
     "DATABASE_URL",
+    "ASYNC_DATABASE_URL",
+    "async_pool_stats",
+    "sync_pool_stats",
+    "db_pool_status",
+    "create_schema",
+    "warm_pool",
+    "dispose_engines",
     "Base",
 ]
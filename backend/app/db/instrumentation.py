@@ -0,0 +1,131 @@
+# backend/app/db/instrumentation.py
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+# Opt-in N+1 inspector: per-request X-DB-Queries / X-DB-Time-ms headers and a
+# log line for every statement shape repeated DB_REPEATED_STATEMENT_THRESHOLD
+# times or more. DB_QUERY_BUDGET (0 = off) logs a warning for any request
+# that executes more statements than that.
+DB_QUERY_INSPECTOR = os.getenv("DB_QUERY_INSPECTOR", "false").strip().lower() in ("1", "true", "yes", "on")
+DB_REPEATED_STATEMENT_THRESHOLD = int(os.getenv("DB_REPEATED_STATEMENT_THRESHOLD", "5"))
+DB_QUERY_BUDGET = int(os.getenv("DB_QUERY_BUDGET", "0"))
+
+# Bound-parameter lists ("IN (?, ?, ?)", "VALUES ($1, $2)") collapse to one
+# placeholder so the same query with a different number of ids is one shape.
+_PARAM_LIST = re.compile(r"\(\s*(?:\?|\$\d+|%\(\w+\)s|%s|:\w+)(?:\s*,\s*(?:\?|\$\d+|%\(\w+\)s|%s|:\w+))*\s*\)")
+_ROW_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    shape = _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+    return _ROW_LIST.sub("(?)", shape)
+
+
+class QueryStats:
+    """
+    SQL statements executed (and time spent in them) within one request or
+    count_queries() block. Statement shapes are only tracked when asked for.
+    Nested stats also count into their parent.
+    """
+
+    __slots__ = ("count", "seconds", "shapes", "parent")
+
+    def __init__(self, track_shapes: bool = False, parent: "QueryStats | None" = None):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter() if track_shapes else None
+        self.parent = parent
+
+    def repeated(self, threshold: int = DB_REPEATED_STATEMENT_THRESHOLD):
+        """[(shape, times)] for shapes executed at least threshold times, most frequent first."""
+        if not self.shapes:
+            return []
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+# Set per request by the HTTP middleware. Holds a mutable QueryStats so the
+# handler task (and SQLAlchemy's greenlets, which inherit the context) can
+# add to it.
+_request_stats: ContextVar[QueryStats | None] = ContextVar("db_request_stats", default=None)
+
+# Called as listener(statement, seconds) after every statement on an
+# instrumented engine, e.g. to feed process-wide metrics.
+statement_listeners = []
+
+
+def begin_request(track_shapes: bool = False):
+    """Start collecting stats for the current request; returns a reset token."""
+    return _request_stats.set(QueryStats(track_shapes, parent=_request_stats.get()))
+
+
+def end_request(token) -> QueryStats:
+    stats = _request_stats.get() or QueryStats()
+    _request_stats.reset(token)
+    return stats
+
+
+def current_stats() -> QueryStats | None:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _request_stats.get()
+    shape = None
+    while stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        if stats.shapes is not None:
+            shape = shape or statement_shape(statement)
+            stats.shapes[shape] += 1
+        stats = stats.parent
+    for listener in statement_listeners:
+        listener(statement, elapsed)
+
+
+def instrument_engine(engine):
+    """
+    Hook cursor execution events on a sync Engine (for an AsyncEngine pass
+    async_engine.sync_engine). Safe to call more than once.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def count_queries():
+    """
+    Count statements executed inside the block (including those of any
+    request handled in the same context, e.g. through httpx's ASGITransport):
+
+        with count_queries() as stats:
+            await client.get("/vendor/dashboard")
+        print(stats.count, stats.repeated(2))
+    """
+    token = begin_request(track_shapes=True)
+    try:
+        yield _request_stats.get()
+    finally:
+        _request_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Fail with the repeated statement shapes if the block runs more than limit statements."""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        details = "".join(f"\n  {n}x {shape}" for shape, n in stats.repeated(2))
+        raise AssertionError(f"expected at most {limit} queries, got {stats.count}{details}")
@@ -0,0 +1,111 @@
+# backend/app/db/pool.py
+import os
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Pool settings (apply to both the async and the sync engine).
+# Ignored for SQLite, which uses SQLAlchemy's SQLite-specific pools.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").strip().lower() in ("1", "true", "yes", "on")
+
+
+class PoolStats:
+    """
+    Checkout counters for one engine's pool. Wait time is measured around
+    the pool's own queue get, i.e. how long a request waited for a free
+    connection (including opening a new one). Listeners are called with the
+    wait in seconds after every checkout, e.g. to feed a histogram.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.listeners = []
+
+    def record(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+        for listener in self.listeners:
+            listener(waited, timed_out)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg = self.wait_total / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_total * 1000, 3),
+                "wait_ms_avg": round(avg * 1000, 3),
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+            }
+
+
+def _timed(base, stats: PoolStats):
+    """
+    Subclass of a QueuePool variant that times each checkout into stats.
+    Pool.recreate() instantiates self.__class__, so stats survive dispose().
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = base._do_get(self)
+        except exc.TimeoutError:
+            stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        stats.record(time.perf_counter() - start)
+        return conn
+
+    return type(f"Timed{base.__name__}", (base,), {"_do_get": _do_get, "stats": stats})
+
+
+def engine_pool_kwargs(url, stats: PoolStats, is_async: bool) -> dict:
+    """
+    create_engine / create_async_engine keyword arguments for url.
+    """
+    if url.get_backend_name() == "sqlite":
+        return {"pool_pre_ping": DB_POOL_PRE_PING}
+    return {
+        "poolclass": _timed(AsyncAdaptedQueuePool if is_async else QueuePool, stats),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def pool_status(engine, stats: PoolStats) -> dict:
+    """
+    Live pool occupancy plus checkout counters for one (sync) engine.
+    """
+    pool = engine.pool
+    out = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        out.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": DB_MAX_OVERFLOW,
+            "timeout_s": DB_POOL_TIMEOUT,
+            "recycle_s": DB_POOL_RECYCLE,
+            "pre_ping": DB_POOL_PRE_PING,
+        })
+    out.update(stats.snapshot())
+    return out
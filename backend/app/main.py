@@ -1,12 +1,57 @@
 # backend/app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-import time, os
-from .db import Base, engine
-from .routers import auth_router, vendor_router, user_router
+from fastapi.responses import JSONResponse
+import logging, time, os
+from sqlalchemy.orm import configure_mappers
+from . import db
+from .db import Base
+from .db import instrumentation as db_instrumentation
+from .routers import auth_router, vendor_router, user_router, internal_router
+from . import services as auth
+from .services import metrics_service
 from fastapi.staticfiles import StaticFiles
 
-app = FastAPI()
+# no-op if the server (or a test harness) already configured logging
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger("app.access")
+inspector_logger = logging.getLogger("app.db.inspector")
+startup_logger = logging.getLogger("app.startup")
+
+# Start-up behaviour. Nothing here touches the database or the filesystem at
+# import time; it all runs in the lifespan below.
+#   DB_CREATE_ALL=1          create missing tables on start-up (dev/tests only,
+#                            PostgreSQL or SQLite; production schemas come from
+#                            `alembic upgrade head`, which also adds the search
+#                            indexes / FTS tables create_all leaves out)
+#   DB_WARMUP_CONNECTIONS=N  pre-open N pooled connections before serving
+UPLOADS_DIR = os.getenv("UPLOADS_DIR", os.path.join(os.getcwd(), "uploads"))
+DB_CREATE_ALL = os.getenv("DB_CREATE_ALL", "false").strip().lower() in ("1", "true", "yes", "on")
+DB_WARMUP_CONNECTIONS = int(os.getenv("DB_WARMUP_CONNECTIONS", "0"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start = time.perf_counter()
+    os.makedirs(UPLOADS_DIR, exist_ok=True)
+    # resolve relationships/mappers now instead of on the first request
+    configure_mappers()
+    if DB_CREATE_ALL:
+        await db.create_schema(Base.metadata)
+    if DB_WARMUP_CONNECTIONS:
+        await db.warm_pool(DB_WARMUP_CONNECTIONS)
+    auth.start_password_pool()
+    auth.start_session_reaper()
+    startup_logger.info("startup completed in %.2fms", (time.perf_counter() - start) * 1000)
+    yield
+    await auth.stop_session_reaper()
+    auth.shutdown_password_pool()
+    await auth.close_session_store()
+    await db.dispose_engines()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow only your dev frontend origin(s)
 origins = [
@@ -14,10 +59,8 @@ origins = [
     "http://127.0.0.1:3000"
 ]
 
-# static uploads dir
-uploads_dir = os.path.join(os.getcwd(), "uploads")
-os.makedirs(uploads_dir, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=uploads_dir), name="uploads")
+# static uploads dir (created by the lifespan, hence check_dir=False)
+app.mount("/uploads", StaticFiles(directory=UPLOADS_DIR, check_dir=False), name="uploads")
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,27 +68,76 @@ app.add_middleware(
     allow_credentials=True,      # required for cookies
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Queries", "X-DB-Time-ms", "ETag"],
 )
 
-# very small middleware to log every request
+@app.exception_handler(auth.PasswordHasherBusy)
+async def password_hasher_busy(request: Request, exc: auth.PasswordHasherBusy):
+    # every hashing slot is taken: shed load instead of queueing without bound
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+# metrics + access log for every request
+metrics_service.install()
+
+
+def _route_template(request: Request) -> str:
+    """
+    Templated path of the matched route (e.g. /vendor/assessment/{assessment_id})
+    so metrics are not labelled with raw URLs.
+    """
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
 @app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start = time.time()
-    client = request.client.host if request.client else "unknown"
-    print(f"--> {request.method} {request.url.path} from {client}")
+async def observe_requests(request: Request, call_next):
+    method = request.method
+    start = time.perf_counter()
+    status_code = 500
+    stats_token = db_instrumentation.begin_request(track_shapes=db_instrumentation.DB_QUERY_INSPECTOR)
+    metrics_service.HTTP_IN_FLIGHT.labels(method).inc()
     try:
         response = await call_next(request)
-    except Exception as e:
-        print(f"!!! exception handling {request.method} {request.url.path}: {e}")
+        status_code = response.status_code
+        if db_instrumentation.DB_QUERY_INSPECTOR:
+            stats = db_instrumentation.current_stats()
+            response.headers["X-DB-Queries"] = str(stats.count)
+            response.headers["X-DB-Time-ms"] = f"{stats.seconds * 1000:.2f}"
+        return response
+    except Exception:
+        metrics_service.HTTP_EXCEPTIONS.labels(method, _route_template(request)).inc()
+        logger.exception("exception handling %s %s", method, request.url.path)
         raise
-    duration = (time.time() - start) * 1000
-    print(f"<-- {request.method} {request.url.path} completed_in={duration:.2f}ms status={response.status_code}")
-    return response
+    finally:
+        duration = time.perf_counter() - start
+        stats = db_instrumentation.end_request(stats_token)
+        metrics_service.HTTP_IN_FLIGHT.labels(method).dec()
+        metrics_service.observe_request(method, _route_template(request), status_code, duration, stats)
+        logger.info(
+            "%s %s status=%s completed_in=%.2fms db_queries=%d db_time=%.2fms",
+            method, request.url.path, status_code, duration * 1000, stats.count, stats.seconds * 1000,
+        )
+        if db_instrumentation.DB_QUERY_INSPECTOR:
+            _inspect_queries(method, _route_template(request), stats)
+
 
-# create tables (dev only)
-Base.metadata.create_all(bind=engine)
+def _inspect_queries(method: str, route: str, stats):
+    """Log likely N+1 patterns and query-budget overruns for one request."""
+    for shape, times in stats.repeated():
+        inspector_logger.warning("%s %s: statement repeated %dx: %s", method, route, times, shape)
+    budget = db_instrumentation.DB_QUERY_BUDGET
+    if budget and stats.count > budget:
+        inspector_logger.warning(
+            "%s %s: %d queries exceeds DB_QUERY_BUDGET=%d", method, route, stats.count, budget
+        )
 
 # include routers (only once each)
 app.include_router(auth_router.router)
 app.include_router(vendor_router.router)
-app.include_router(user_router.router)
\ No newline at end of file
+app.include_router(user_router.router)
+app.include_router(internal_router.router)
\ No newline at end of file
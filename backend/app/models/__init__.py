@@ -6,6 +6,7 @@ from .sessiontoken import SessionToken
 from .assessment import Assessment
 from .candidate import Candidate
 from .assessment_candidate import AssessmentCandidate
+from .skill import Skill, AssessmentSkill
 
 # expose a sensible __all__
 __all__ = [
@@ -15,4 +16,6 @@ __all__ = [
     "Assessment",
     "Candidate",
     "AssessmentCandidate",
+    "Skill",
+    "AssessmentSkill",
 ]
@@ -1,7 +1,7 @@
 # backend/app/models/assessment.py
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy import text
@@ -11,6 +11,10 @@ from sqlalchemy.dialects.postgresql import UUID
 
 class Assessment(Base):
     __tablename__ = "assessment"
+    __table_args__ = (
+        # vendor dashboard: a vendor's assessments ordered by created_at
+        Index("ix_assessment_vendor_id_created_at", "vendor_id", "created_at"),
+    )
     # UUID primary key (matches your DB)
     assessment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
@@ -32,6 +36,22 @@ class Assessment(Base):
 
     status = Column(String, nullable=False, server_default='draft')
     updated_at = Column(TIMESTAMP(timezone=True), onupdate=func.now())
+    # bumped on every change to the assessment, its links or linked
+    # candidates (repository.touch_assessments); feeds the read ETags
+    version = Column(Integer, nullable=False, server_default="1")
+
+    # linked candidates, total and per status; maintained in the same
+    # transaction as the link/status writes, repaired by
+    # repository.reconcile_candidate_counters
+    candidates_total = Column(Integer, nullable=False, server_default="0")
+    invited_count = Column(Integer, nullable=False, server_default="0")
+    interviewed_count = Column(Integer, nullable=False, server_default="0")
+    shortlisted_count = Column(Integer, nullable=False, server_default="0")
+    rejected_count = Column(Integer, nullable=False, server_default="0")
+
+    # distinct normalized skills linked in assessment_skill (the |A| of the
+    # skill-match Jaccard score); maintained by repository.set_assessment_skills
+    skill_count = Column(Integer, nullable=False, server_default="0")
 
     vendor = relationship("Vendor", back_populates="assessments")
     # relationship to AssessmentCandidate (child rows)
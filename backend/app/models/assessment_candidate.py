@@ -1,14 +1,28 @@
 # backend/app/models/assessment_candidate.py
 import uuid
-from sqlalchemy import Column, Float, String, TIMESTAMP, Text, ForeignKey
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import Column, Float, String, TIMESTAMP, Text, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db import Base
 
+# how long an invitation link stays valid
+INVITE_VALIDITY = timedelta(days=10)
+
 class AssessmentCandidate(Base):
     __tablename__ = "assessment_candidate"
+    __table_args__ = (
+        # one link per (assessment, candidate); target of ON CONFLICT in link inserts
+        UniqueConstraint("assessment_id", "candidate_uuid", name="uq_assessment_candidate_link"),
+        # keyset pages / export within an assessment (invited_date, id order)
+        Index(
+            "ix_assessment_candidate_assessment_invited",
+            "assessment_id",
+            "invited_date",
+            "assessment_candidate_id",
+        ),
+    )
 
     assessment_candidate_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
 
@@ -16,16 +30,29 @@ class AssessmentCandidate(Base):
     assessment_id = Column(UUID(as_uuid=True), ForeignKey("assessment.assessment_id", ondelete="CASCADE"), nullable=False)
 
     # use candidate_uuid as FK (this matches DB)
-    candidate_uuid = Column(UUID(as_uuid=True), ForeignKey("candidate.candidate_uuid", ondelete="CASCADE"), nullable=False)
+    candidate_uuid = Column(UUID(as_uuid=True), ForeignKey("candidate.candidate_uuid", ondelete="CASCADE"), nullable=False, index=True)
 
     status = Column(String(50), nullable=False, server_default="invited")
     score = Column(Float, nullable=True)
     submitted_at = Column(TIMESTAMP(timezone=True), nullable=True)
     is_feedback = Column(Text, nullable=True)
-    invited_date = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    # Python-side default first: keyset cursors need sub-second precision,
+    # which SQLite's CURRENT_TIMESTAMP lacks
+    invited_date = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
     session_jti = Column(String(255), nullable=True)
     invite_token = Column(String(255), unique=True, nullable=True)
-    invite_expiry = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text("(now() + interval '10 days')"))
+    # computed in Python so create_all works on every dialect; databases
+    # built by migration 0001 also have the equivalent server default
+    invite_expiry = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc) + INVITE_VALIDITY,
+    )
 
     candidate = relationship(
         "Candidate",
@@ -11,7 +11,8 @@ class Candidate(Base):
     __tablename__ = "candidate"
     id = Column(Integer, primary_key=True, index=True)  # legacy serial id (keep for UI/backwards compat)
     name = Column(String, nullable=False)
-    email = Column(String, nullable=False)
+    # stored trimmed + lower-cased (repository.normalize_email); unique so adds can upsert on it
+    email = Column(String, unique=True, index=True, nullable=False)
     # new UUID column - added during DB migration; default assigned by SQLAlchemy if DB default missing
     candidate_uuid = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4)
     phone = Column(String(30), nullable=True)
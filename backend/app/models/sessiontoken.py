@@ -6,8 +6,11 @@ from app.db import Base
 class SessionToken(Base):
     __tablename__ = "sessions"
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String, unique=True, index=True, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=True)
+    # jti claim, or sha256 hex of the JWT for tokens issued before jti
+    token_key = Column(String(64), unique=True, index=True, nullable=True)
+    # legacy: full JWT, only set on rows created before token_key (migration 0003)
+    token = Column(String, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    expires_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True, index=True)
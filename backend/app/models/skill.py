@@ -0,0 +1,25 @@
+# backend/app/models/skill.py
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.db import Base
+
+
+class Skill(Base):
+    __tablename__ = "skill"
+
+    id = Column(Integer, primary_key=True)
+    # canonical form (repository.normalize_skill): lower-case, aliases resolved
+    name = Column(String(100), unique=True, nullable=False)
+
+
+class AssessmentSkill(Base):
+    __tablename__ = "assessment_skill"
+    __table_args__ = (
+        # inverted index: skill -> assessments, the driving side of skill matching
+        Index("ix_assessment_skill_skill_id", "skill_id", "assessment_id"),
+    )
+
+    assessment_id = Column(
+        UUID(as_uuid=True), ForeignKey("assessment.assessment_id", ondelete="CASCADE"), primary_key=True
+    )
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True)
@@ -14,12 +14,58 @@ from .vendors import (
 from .candidates import (
     create_candidate,
     get_candidate_by_email,
+    upsert_candidate,
+    normalize_email,
 )
 from .assessments import (
     create_assessment,
     get_assessment_by_identifier,
+    get_assessment_with_links,
     link_candidate_to_assessment,
+    add_candidate_to_assessment,
+    import_candidates_to_assessment,
+    IMPORT_BATCH_SIZE,
     get_assessment_with_candidates,
+    list_assessment_candidates,
+    first_candidate_pages,
+    list_assessments_for_vendor,
+    touch_assessments,
+    touch_candidate_assessments,
+    linked_assessment_ids,
+    get_assessment_version,
+    list_assessment_versions,
+    adjust_candidate_counters,
+    set_candidate_status,
+    set_candidate_statuses,
+    candidate_count,
+    list_assessment_summaries,
+    reconcile_candidate_counters,
+    STATUS_COUNTER_COLUMNS,
+    COUNTER_COLUMNS,
+    DEFAULT_CANDIDATE_PAGE_SIZE,
+    MAX_CANDIDATE_PAGE_SIZE,
+    iter_candidate_pipeline,
+    PIPELINE_EXPORT_COLUMNS,
+)
+from .search import (
+    search_candidates,
+    search_assessments,
+    normalize_query,
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    MAX_SEARCH_OFFSET,
+    MIN_QUERY_LENGTH,
+)
+from .skills import (
+    normalize_skill,
+    parse_skills,
+    get_skill_ids,
+    ensure_skills,
+    set_assessment_skills,
+    match_assessments,
+    backfill_assessment_skills,
+    SKILL_ALIASES,
+    MAX_MATCH_SKILLS,
 )
 
 __all__ = [
@@ -31,8 +77,49 @@ __all__ = [
     "list_assessments_for_vendor",
     "create_candidate",
     "get_candidate_by_email",
+    "upsert_candidate",
+    "normalize_email",
     "create_assessment",
     "get_assessment_by_identifier",
+    "get_assessment_with_links",
     "link_candidate_to_assessment",
+    "add_candidate_to_assessment",
+    "import_candidates_to_assessment",
+    "IMPORT_BATCH_SIZE",
     "get_assessment_with_candidates",
+    "list_assessment_candidates",
+    "first_candidate_pages",
+    "touch_assessments",
+    "touch_candidate_assessments",
+    "linked_assessment_ids",
+    "get_assessment_version",
+    "list_assessment_versions",
+    "adjust_candidate_counters",
+    "set_candidate_status",
+    "set_candidate_statuses",
+    "candidate_count",
+    "list_assessment_summaries",
+    "reconcile_candidate_counters",
+    "STATUS_COUNTER_COLUMNS",
+    "COUNTER_COLUMNS",
+    "DEFAULT_CANDIDATE_PAGE_SIZE",
+    "MAX_CANDIDATE_PAGE_SIZE",
+    "iter_candidate_pipeline",
+    "PIPELINE_EXPORT_COLUMNS",
+    "search_candidates",
+    "search_assessments",
+    "normalize_query",
+    "DEFAULT_SEARCH_LIMIT",
+    "MAX_SEARCH_LIMIT",
+    "MAX_SEARCH_OFFSET",
+    "MIN_QUERY_LENGTH",
+    "normalize_skill",
+    "parse_skills",
+    "get_skill_ids",
+    "ensure_skills",
+    "set_assessment_skills",
+    "match_assessments",
+    "backfill_assessment_skills",
+    "SKILL_ALIASES",
+    "MAX_MATCH_SKILLS",
 ]
@@ -1,11 +1,70 @@
 # backend/app/repository/assessments.py
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
 from uuid import UUID as UUIDClass
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
 from .. import models
+from .candidates import candidate_upsert_changes, candidate_upsert_statement, normalize_email, upsert_candidate
+from .dialect import insert_for
 
+# Page size bounds for keyset-paginated candidate listings
+DEFAULT_CANDIDATE_PAGE_SIZE = 50
+MAX_CANDIDATE_PAGE_SIZE = 200
 
-def create_assessment(db: Session, title: str, description: str, vendor_id: int):
+# Rows per batched statement in bulk candidate imports
+IMPORT_BATCH_SIZE = 1000
+
+# AssessmentCandidate columns every candidate listing needs, even with a
+# sparse fieldset: keys, status and the keyset sort key
+LINK_COLUMNS = (
+    models.AssessmentCandidate.assessment_id,
+    models.AssessmentCandidate.candidate_uuid,
+    models.AssessmentCandidate.status,
+    models.AssessmentCandidate.invited_date,
+)
+
+
+# ────────────────────────────────────────────────────────────
+# Sparse loading: columns / candidate_columns arguments below restrict the
+# Assessment / Candidate columns loaded (None loads whole rows). Columns
+# left out must not be touched afterwards: async sessions cannot lazy-load.
+# ────────────────────────────────────────────────────────────
+
+def _assessment_options(columns):
+  return (load_only(*columns),) if columns is not None else ()
+
+
+def _links_from_assessment(candidate_columns):
+  """Options loading Assessment.candidates and each link's Candidate."""
+  links = selectinload(models.Assessment.candidates)
+  candidate = links.selectinload(models.AssessmentCandidate.candidate)
+  if candidate_columns is None:
+      return (candidate,)
+  # candidate_uuid is the join key of link -> candidate
+  return (
+      links.load_only(*LINK_COLUMNS),
+      candidate.load_only(models.Candidate.candidate_uuid, *candidate_columns),
+  )
+
+
+def _link_row_options(candidate_columns):
+  """Options for queries selecting AssessmentCandidate rows directly."""
+  candidate = joinedload(models.AssessmentCandidate.candidate)
+  if candidate_columns is None:
+      return (candidate,)
+  return (
+      load_only(*LINK_COLUMNS),
+      candidate.load_only(models.Candidate.candidate_uuid, *candidate_columns),
+  )
+
+
+async def create_assessment(db: AsyncSession, title: str, description: str, vendor_id: int):
   """
   (Currently not used by your new /vendor/create-assessment route,
   but safe to keep as a basic helper.)
@@ -16,12 +75,12 @@ def create_assessment(db: Session, title: str, description: str, vendor_id: int)
       vendor_id=vendor_id,
   )
   db.add(assessment)
-  db.commit()
-  db.refresh(assessment)
+  await db.commit()
+  await db.refresh(assessment)
   return assessment
 
 
-def get_assessment_by_identifier(db: Session, assessment_identifier: str):
+async def get_assessment_by_identifier(db: AsyncSession, assessment_identifier: str, columns=None):
   """
   Resolve an Assessment by its UUID string (assessment_id).
   Legacy numeric IDs removed to keep things clean.
@@ -32,85 +91,754 @@ def get_assessment_by_identifier(db: Session, assessment_identifier: str):
       return None
 
   return (
-      db.query(models.Assessment)
-      .filter(models.Assessment.assessment_id == aid)
-      .first()
+      await db.execute(
+          select(models.Assessment)
+          .options(*_assessment_options(columns))
+          .where(models.Assessment.assessment_id == aid)
+      )
+  ).scalars().first()
+
+
+async def get_assessment_with_links(
+  db: AsyncSession,
+  assessment_id: UUIDClass,
+  vendor_id: int | None = None,
+  columns=None,
+  candidate_columns=None,
+):
+  """
+  One Assessment with .candidates and each link's .candidate eagerly loaded
+  (async sessions cannot lazy-load). Restricted to vendor_id when given.
+  """
+  stmt = (
+      select(models.Assessment)
+      .options(*_assessment_options(columns), *_links_from_assessment(candidate_columns))
+      .where(models.Assessment.assessment_id == assessment_id)
+  )
+  if vendor_id is not None:
+      stmt = stmt.where(models.Assessment.vendor_id == vendor_id)
+  return (await db.execute(stmt)).scalars().first()
+
+
+# ────────────────────────────────────────────────────────────
+# Change tracking: Assessment.version feeds the read ETags, so every write
+# that changes what /vendor/dashboard or /vendor/assessment/{id} returns
+# bumps it in the same transaction. The candidate counters on Assessment
+# are kept the same way.
+# ────────────────────────────────────────────────────────────
+
+# candidate status -> Assessment counter column
+STATUS_COUNTER_COLUMNS = {
+    "invited": "invited_count",
+    "interviewed": "interviewed_count",
+    "shortlisted": "shortlisted_count",
+    "rejected": "rejected_count",
+}
+COUNTER_COLUMNS = ("candidates_total", *STATUS_COUNTER_COLUMNS.values())
+
+async def touch_assessments(db: AsyncSession, assessment_ids):
+  """
+  Bump version of the given assessments. Rows are locked in assessment_id
+  order, so writers touching overlapping sets (imports of shared
+  candidates) queue instead of deadlocking; call it before any other
+  assessment update in the transaction. updated_at is left alone: the
+  assessment itself did not change. Does not commit.
+  """
+  A = models.Assessment
+  ids = sorted(set(assessment_ids))
+  for start in range(0, len(ids), IMPORT_BATCH_SIZE):
+      locked = (
+          select(A.assessment_id)
+          .where(A.assessment_id.in_(ids[start:start + IMPORT_BATCH_SIZE]))
+          .order_by(A.assessment_id)
+          .with_for_update()
+      )
+      await db.execute(
+          update(A)
+          .where(A.assessment_id.in_(locked))
+          # explicit, or the column's onupdate would set it to now()
+          .values(version=A.version + 1, updated_at=A.updated_at)
+          .execution_options(synchronize_session=False)
+      )
+
+
+async def linked_assessment_ids(db: AsyncSession, candidate_uuids) -> set:
+  """Ids of every assessment (any vendor's) linked to one of candidate_uuids."""
+  AC = models.AssessmentCandidate
+  uuids = list(candidate_uuids)
+  if not uuids:
+      return set()
+  return set((await db.execute(
+      select(AC.assessment_id).where(AC.candidate_uuid.in_(uuids)).distinct()
+  )).scalars())
+
+
+async def touch_candidate_assessments(db: AsyncSession, candidate_uuids):
+  """
+  Bump every assessment linked to one of candidate_uuids: candidate rows
+  are shared, so a change to one changes the payload of all their
+  assessments. Only pass candidates whose fields actually changed
+  (candidate_upsert_changes). Does not commit.
+  """
+  await touch_assessments(db, await linked_assessment_ids(db, candidate_uuids))
+
+
+async def adjust_candidate_counters(db: AsyncSession, assessment_id: UUIDClass, deltas: dict):
+  """
+  Add deltas ({counter column: +/-n}) to one assessment's counters and bump
+  its version, as one UPDATE (the row lock orders concurrent writers).
+  updated_at is left alone, as in touch_assessments. Does not commit.
+  """
+  A = models.Assessment
+  values = {column: getattr(A, column) + delta for column, delta in deltas.items() if delta}
+  if not values:
+      return
+  await db.execute(
+      update(A)
+      .where(A.assessment_id == assessment_id)
+      # explicit, or the column's onupdate would set it to now()
+      .values(version=A.version + 1, updated_at=A.updated_at, **values)
+      .execution_options(synchronize_session=False)
+  )
+
+
+def _linked_deltas(count: int) -> dict:
+  # new links always start as "invited"
+  return {"candidates_total": count, "invited_count": count}
+
+
+async def set_candidate_status(db: AsyncSession, link: models.AssessmentCandidate, new_status: str):
+  """
+  Change one link's status and move it between the per-status counters.
+  The caller should have loaded link FOR UPDATE so concurrent changes
+  cannot both move it out of the same old status. Does not commit.
+  Returns the previous status.
+  """
+  old_status = link.status
+  if old_status == new_status:
+      return old_status
+  link.status = new_status
+  deltas = {STATUS_COUNTER_COLUMNS[new_status]: 1}
+  if old_status in STATUS_COUNTER_COLUMNS:
+      deltas[STATUS_COUNTER_COLUMNS[old_status]] = -1
+  await adjust_candidate_counters(db, link.assessment_id, deltas)
+  return old_status
+
+
+async def set_candidate_statuses(db: AsyncSession, assessment_id: UUIDClass, changes: dict) -> dict:
+  """
+  Batch form of set_candidate_status for one assessment: changes maps
+  candidate_uuid -> new status. The links are read FOR UPDATE (in
+  candidate_uuid order, so overlapping batches cannot deadlock), then
+  updated with one UPDATE per target status and a single counter/version
+  adjustment. Does not commit.
+  Returns {candidate_uuid: previous status} for the links that exist.
+  """
+  AC = models.AssessmentCandidate
+  if not changes:
+      return {}
+  previous = dict(
+      (await db.execute(
+          select(AC.candidate_uuid, AC.status)
+          .where(AC.assessment_id == assessment_id, AC.candidate_uuid.in_(list(changes)))
+          .order_by(AC.candidate_uuid)
+          .with_for_update()
+      )).all()
+  )
+
+  by_status = {}
+  deltas = {}
+  for cand_uuid, old_status in previous.items():
+      new_status = changes[cand_uuid]
+      if old_status == new_status:
+          continue
+      by_status.setdefault(new_status, []).append(cand_uuid)
+      column = STATUS_COUNTER_COLUMNS[new_status]
+      deltas[column] = deltas.get(column, 0) + 1
+      if old_status in STATUS_COUNTER_COLUMNS:
+          column = STATUS_COUNTER_COLUMNS[old_status]
+          deltas[column] = deltas.get(column, 0) - 1
+
+  for new_status, cand_uuids in by_status.items():
+      await db.execute(
+          update(AC)
+          .where(AC.assessment_id == assessment_id, AC.candidate_uuid.in_(cand_uuids))
+          .values(status=new_status)
+          .execution_options(synchronize_session=False)
+      )
+  await adjust_candidate_counters(db, assessment_id, deltas)
+  return previous
+
+
+def candidate_count(assessment: models.Assessment, status: str | None = None) -> int:
+  """Linked candidates of an assessment (with status, if given), from its counters."""
+  if status is None:
+      return assessment.candidates_total
+  return getattr(assessment, STATUS_COUNTER_COLUMNS[status])
+
+
+async def get_assessment_version(db: AsyncSession, assessment_id: UUIDClass, vendor_id: int | None = None):
+  """version of one assessment, or None if it does not exist (for vendor_id)."""
+  A = models.Assessment
+  stmt = select(A.version).where(A.assessment_id == assessment_id)
+  if vendor_id is not None:
+      stmt = stmt.where(A.vendor_id == vendor_id)
+  return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def list_assessment_versions(db: AsyncSession, vendor_id: int):
+  """[(assessment_id, version)] of a vendor's assessments, in dashboard order."""
+  A = models.Assessment
+  return (
+      await db.execute(
+          select(A.assessment_id, A.version)
+          .where(A.vendor_id == vendor_id)
+          .order_by(A.created_at, A.assessment_id)
+      )
+  ).all()
+
+
+async def _insert_links(db: AsyncSession, assessment_id: UUIDClass, candidate_uuids):
+  """
+  INSERT ... ON CONFLICT DO NOTHING on (assessment_id, candidate_uuid).
+  Returns the set of candidate_uuids that were newly linked.
+  """
+  AC = models.AssessmentCandidate
+  if not candidate_uuids:
+      return set()
+  # set here, not by the server default: SQLite's CURRENT_TIMESTAMP has no
+  # fraction of a second and would sort before the keyset cursor's bound
+  invited = datetime.now(timezone.utc)
+  stmt = (
+      insert_for(db, AC)
+      .values([
+          {
+              "assessment_candidate_id": uuid.uuid4(),
+              "assessment_id": assessment_id,
+              "candidate_uuid": cand_uuid,
+              "status": "invited",
+              "invited_date": invited,
+          }
+          for cand_uuid in candidate_uuids
+      ])
+      .on_conflict_do_nothing(index_elements=[AC.assessment_id, AC.candidate_uuid])
+      .returning(AC.candidate_uuid)
   )
+  return set((await db.execute(stmt)).scalars())
 
 
-def link_candidate_to_assessment(
-  db: Session,
+async def link_candidate_to_assessment(
+  db: AsyncSession,
   assessment_identifier: str,
   candidate_uuid: str,
 ):
   """
   Link an existing Candidate (by candidate_uuid) to an Assessment (by assessment_id UUID).
   If link already exists, it is returned unchanged.
+
+  Existence of both sides is enforced by the foreign keys rather than by
+  re-loading them; None is returned for malformed ids or missing rows.
   """
+  AC = models.AssessmentCandidate
 
-  # Resolve assessment
   try:
       aid = UUIDClass(assessment_identifier)
+      cand_uuid = UUIDClass(candidate_uuid)
   except ValueError:
       return None
 
-  assessment = (
-      db.query(models.Assessment)
-      .filter(models.Assessment.assessment_id == aid)
-      .first()
-  )
-  if not assessment:
+  try:
+      if await _insert_links(db, aid, [cand_uuid]):
+          await adjust_candidate_counters(db, aid, _linked_deltas(1))
+      await db.commit()
+  except IntegrityError:
+      await db.rollback()
       return None
 
-  # Resolve candidate
+  return (
+      await db.execute(
+          select(AC).where(AC.assessment_id == aid, AC.candidate_uuid == cand_uuid)
+      )
+  ).scalar_one_or_none()
+
+
+async def add_candidate_to_assessment(
+  db: AsyncSession,
+  assessment_id: UUIDClass,
+  name: str,
+  email: str,
+  phone: str = None,
+  resume_path: str = None,
+):
+  """
+  Upsert a candidate by email and link it to an assessment as one
+  transaction with a single commit. Concurrent adds of the same email (or
+  the same link) converge on one row thanks to the unique constraints.
+
+  Returns (candidate, linked); linked is False if the candidate was
+  already on the assessment.
+  """
+  C = models.Candidate
+  new_fields = {"phone": phone, "resume_path": resume_path}
   try:
-      cand_uuid = UUIDClass(candidate_uuid)
-  except ValueError:
-      return None
+      current = None
+      if phone or resume_path:
+          current = (await db.execute(
+              select(C.phone, C.resume_path).where(C.email == normalize_email(email)).with_for_update()
+          )).first()
+      candidate = await upsert_candidate(db, name, email, phone=phone, resume_path=resume_path)
+      linked = bool(await _insert_links(db, assessment_id, [candidate.candidate_uuid]))
 
-  candidate = (
-      db.query(models.Candidate)
-      .filter(models.Candidate.candidate_uuid == cand_uuid)
-      .first()
-  )
-  if not candidate:
-      return None
+      # an existing candidate that changed shows differently on every
+      # assessment it is linked to (other vendors' included)
+      touched = set()
+      if current is not None and candidate_upsert_changes(new_fields, current):
+          touched = await linked_assessment_ids(db, [candidate.candidate_uuid])
+      if linked:
+          touched.add(assessment_id)
+      await touch_assessments(db, touched)
+      if linked:
+          await adjust_candidate_counters(db, assessment_id, _linked_deltas(1))
+      await db.commit()
+  except Exception:
+      await db.rollback()
+      raise
+  return candidate, linked
+
+
+async def import_candidates_to_assessment(
+  db: AsyncSession,
+  assessment_id: UUIDClass,
+  rows: list,
+  batch_size: int = IMPORT_BATCH_SIZE,
+):
+  """
+  Bulk version of the add-candidate flow: upsert candidates by email and link
+  them all to one assessment, in a single transaction.
+
+  rows are dicts with name, email and optional phone / resume_url. Work is
+  done in batches of batch_size; each batch is one SELECT to classify
+  new vs existing emails, one multi-row INSERT ... ON CONFLICT for the
+  candidates and one for the links.
+
+  Returns one result dict per input row:
+    {"row": i, "email": ..., "status": "created" | "updated" | "duplicate" | "error",
+     "candidate_uuid": ..., "linked": bool, "detail": ...}
+  "linked" is False when the candidate was already on the assessment.
+  """
+  C = models.Candidate
+
+  results = []
+  seen = set()
+  pending = []  # (result, cleaned row) for rows that reach the database
+
+  for i, raw in enumerate(rows):
+      name = str(raw.get("name") or "").strip()
+      email = normalize_email(str(raw.get("email") or ""))
+      result = {"row": i, "email": email or None, "status": None,
+                "candidate_uuid": None, "linked": False, "detail": None}
+      results.append(result)
+
+      if not name or not email:
+          result["status"] = "error"
+          result["detail"] = "Name and email are required"
+          continue
+      if email in seen:
+          result["status"] = "duplicate"
+          result["detail"] = "Email appears earlier in this import"
+          continue
+      seen.add(email)
+
+      pending.append((result, {
+          "name": name,
+          "email": email,
+          "phone": str(raw.get("phone") or "").strip() or None,
+          "resume_path": str(raw.get("resume_url") or raw.get("resume_path") or "").strip() or None,
+      }))
+
+  # batches in email order: concurrent imports lock shared candidate rows
+  # in the same order throughout
+  pending.sort(key=lambda item: item[1]["email"])
+
+  linked_total = 0
+  touched = set()  # assessments showing a candidate this import changed
+  try:
+      for start in range(0, len(pending), batch_size):
+          batch = pending[start:start + batch_size]
+          by_email = {row["email"]: result for result, row in batch}
+
+          existing = {
+              email: (cand_uuid, (phone, resume_path))
+              for email, cand_uuid, phone, resume_path in await db.execute(
+                  select(C.email, C.candidate_uuid, C.phone, C.resume_path)
+                  .where(C.email.in_(list(by_email)))
+                  .order_by(C.email)
+                  .with_for_update()
+              )
+          }
+          changed = [
+              row["email"] for _, row in batch
+              if row["email"] in existing and candidate_upsert_changes(row, existing[row["email"]][1])
+          ]
+          for email, (cand_uuid, _) in existing.items():
+              by_email[email]["candidate_uuid"] = cand_uuid
+              by_email[email]["status"] = "updated"
+
+          # RETURNING has the new candidates (and changed ones)
+          upserted = await db.execute(
+              candidate_upsert_statement(db, [row for _, row in batch])
+              .returning(C.email, C.candidate_uuid)
+          )
+          for email, cand_uuid in upserted:
+              result = by_email[email]
+              result["candidate_uuid"] = cand_uuid
+              result["status"] = "updated" if email in existing else "created"
+          # created by a concurrent writer after the read above, and unchanged by ours
+          missing = [email for email, result in by_email.items() if result["candidate_uuid"] is None]
+          if missing:
+              for email, cand_uuid in await db.execute(
+                  select(C.email, C.candidate_uuid).where(C.email.in_(missing))
+              ):
+                  by_email[email]["candidate_uuid"] = cand_uuid
+                  by_email[email]["status"] = "updated"
+
+          linked = await _insert_links(db, assessment_id, [r["candidate_uuid"] for r in by_email.values()])
+          for result in by_email.values():
+              result["linked"] = result["candidate_uuid"] in linked
+          linked_total += len(linked)
+          touched |= await linked_assessment_ids(db, [by_email[email]["candidate_uuid"] for email in changed])
+
+      # assessment rows are only locked here, all at once and in id order
+      if linked_total:
+          touched.add(assessment_id)
+      await touch_assessments(db, touched)
+      await adjust_candidate_counters(db, assessment_id, _linked_deltas(linked_total))
+
+      await db.commit()
+  except Exception:
+      await db.rollback()
+      raise
+
+  for result in results:
+      if result["candidate_uuid"] is not None:
+          result["candidate_uuid"] = str(result["candidate_uuid"])
+  return results
+
+
+async def list_assessments_for_vendor(db: AsyncSession, vendor_id: int, columns=None):
+  return (
+      await db.execute(
+          select(models.Assessment)
+          .options(*_assessment_options(columns))
+          .where(models.Assessment.vendor_id == vendor_id)
+          .order_by(models.Assessment.created_at)
+      )
+  ).scalars().all()
+
+
+async def get_assessment_with_candidates(db: AsyncSession, vendor_id: int, columns=None, candidate_columns=None):
+  """
+  Used by /vendor/dashboard to fetch all assessments for a vendor together
+  with their AssessmentCandidate links and the linked Candidate rows.
+
+  The whole vendor -> assessment -> assessment_candidate -> candidate graph
+  is loaded with selectin eager loading: one SELECT per level, with the
+  child tables fetched through IN (...) batches of up to 500 parent keys.
+  The query count therefore stays fixed instead of growing with every
+  assessment and candidate on the page.
+  """
+  return (
+      await db.execute(
+          select(models.Assessment)
+          .options(*_assessment_options(columns), *_links_from_assessment(candidate_columns))
+          .where(models.Assessment.vendor_id == vendor_id)
+          .order_by(models.Assessment.created_at)
+      )
+  ).scalars().all()
+
+
+# ────────────────────────────────────────────────────────────
+# Keyset pagination over AssessmentCandidate
+# Ordered by (invited_date, assessment_candidate_id); the cursor is the
+# sort key of the last row of the previous page.
+# ────────────────────────────────────────────────────────────
+
+def clamp_candidate_page_size(limit: int | None) -> int:
+  if not limit or limit < 1:
+      return DEFAULT_CANDIDATE_PAGE_SIZE
+  return min(limit, MAX_CANDIDATE_PAGE_SIZE)
+
+
+def encode_candidate_cursor(ac: models.AssessmentCandidate) -> str:
+  raw = json.dumps({
+      "d": ac.invited_date.isoformat(),
+      "id": str(ac.assessment_candidate_id),
+  })
+  return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_candidate_cursor(cursor: str):
+  """
+  Returns (invited_date, assessment_candidate_id).
+  Raises ValueError for anything that is not a cursor we issued.
+  """
+  try:
+      padded = cursor + "=" * (-len(cursor) % 4)
+      data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+      return datetime.fromisoformat(data["d"]), UUIDClass(data["id"])
+  except (KeyError, TypeError, ValueError) as e:
+      raise ValueError("Invalid cursor") from e
+
+
+def _candidate_links_query(assessment_ids, status: str | None = None):
+  AC = models.AssessmentCandidate
+  stmt = select(AC).where(AC.assessment_id.in_(assessment_ids))
+  if status:
+      stmt = stmt.where(AC.status == status)
+  return stmt
 
-  # Check if link already exists
-  existing = (
-      db.query(models.AssessmentCandidate)
-      .filter(
-          models.AssessmentCandidate.assessment_id == assessment.assessment_id,
-          models.AssessmentCandidate.candidate_uuid == candidate.candidate_uuid,
+
+async def list_assessment_candidates(
+  db: AsyncSession,
+  assessment_id: UUIDClass,
+  limit: int | None = None,
+  cursor: str | None = None,
+  status: str | None = None,
+  candidate_columns=None,
+):
+  """
+  One page of AssessmentCandidate rows (with .candidate loaded) for an
+  assessment. Returns (rows, next_cursor); next_cursor is None on the last page.
+  Raises ValueError if the cursor is malformed.
+  """
+  AC = models.AssessmentCandidate
+  limit = clamp_candidate_page_size(limit)
+
+  stmt = (
+      _candidate_links_query([assessment_id], status)
+      .options(*_link_row_options(candidate_columns))
+      .order_by(AC.invited_date, AC.assessment_candidate_id)
+      .limit(limit + 1)
+  )
+  if cursor:
+      after_date, after_id = decode_candidate_cursor(cursor)
+      stmt = stmt.where(
+          tuple_(AC.invited_date, AC.assessment_candidate_id) > tuple_(after_date, after_id)
       )
-      .first()
+
+  rows = (await db.execute(stmt)).scalars().all()
+  if len(rows) > limit:
+      rows = rows[:limit]
+      return rows, encode_candidate_cursor(rows[-1])
+  return rows, None
+
+
+async def first_candidate_pages(
+  db: AsyncSession,
+  assessment_ids,
+  limit: int | None = None,
+  status: str | None = None,
+  candidate_columns=None,
+):
+  """
+  First page of candidates for many assessments in a single query, using
+  row_number() per assessment. Returns {assessment_id: (rows, next_cursor)}
+  with an entry for every requested id.
+  """
+  AC = models.AssessmentCandidate
+  limit = clamp_candidate_page_size(limit)
+  pages = {aid: ([], None) for aid in assessment_ids}
+  if not pages:
+      return pages
+
+  rn = func.row_number().over(
+      partition_by=AC.assessment_id,
+      order_by=(AC.invited_date, AC.assessment_candidate_id),
+  ).label("rn")
+  ranked = (
+      _candidate_links_query(list(pages), status)
+      .with_only_columns(AC.assessment_candidate_id, rn)
+      .subquery()
   )
-  if existing:
-      return existing
-
-  # Create new link
-  ac = models.AssessmentCandidate(
-      assessment_id=assessment.assessment_id,
-      candidate_uuid=candidate.candidate_uuid,
-      status="invited",
+  stmt = (
+      select(AC)
+      .join(ranked, ranked.c.assessment_candidate_id == AC.assessment_candidate_id)
+      .where(ranked.c.rn <= limit + 1)
+      .options(*_link_row_options(candidate_columns))
+      .order_by(AC.assessment_id, AC.invited_date, AC.assessment_candidate_id)
   )
-  db.add(ac)
-  db.commit()
-  db.refresh(ac)
-  return ac
 
+  grouped = {aid: [] for aid in pages}
+  for ac in (await db.execute(stmt)).scalars():
+      grouped[ac.assessment_id].append(ac)
 
-def list_assessments_for_vendor(db: Session, vendor_id: int):
+  for aid, rows in grouped.items():
+      if len(rows) > limit:
+          rows = rows[:limit]
+          pages[aid] = (rows, encode_candidate_cursor(rows[-1]))
+      else:
+          pages[aid] = (rows, None)
+  return pages
+
+
+async def list_assessment_summaries(db: AsyncSession, vendor_id: int):
+  """
+  A vendor's assessments with their candidate counters, in dashboard order.
+  Reads only the assessment table.
+  """
+  A = models.Assessment
   return (
-      db.query(models.Assessment)
-      .filter(models.Assessment.vendor_id == vendor_id)
-      .all()
-  )
+      await db.execute(
+          select(
+              A.assessment_id,
+              A.title,
+              A.status,
+              A.required_candidates,
+              A.version,
+              *(getattr(A, column) for column in COUNTER_COLUMNS),
+          )
+          .where(A.vendor_id == vendor_id)
+          .order_by(A.created_at, A.assessment_id)
+      )
+  ).all()
+
+
+async def reconcile_candidate_counters(db: AsyncSession, assessment_ids=None, batch_size: int = 500) -> int:
+  """
+  Recount assessment_candidate for the given assessments (default: all)
+  and rewrite the counters that drifted, bumping their version.
+
+  Works in batches of batch_size assessments, one transaction each. A batch
+  locks its assessment rows before counting; link and status writes update
+  those same rows after changing assessment_candidate, so they either
+  commit before the count or apply their delta on top of it. Commits.
+  Returns the number of assessments repaired.
+  """
+  A = models.Assessment
+  AC = models.AssessmentCandidate
+  wanted = sorted(set(assessment_ids)) if assessment_ids is not None else None
+  repaired = 0
+  last_id = None
+
+  while True:
+      stmt = select(A.assessment_id, *(getattr(A, column) for column in COUNTER_COLUMNS))
+      if wanted is not None:
+          chunk = [aid for aid in wanted if last_id is None or aid > last_id][:batch_size]
+          if not chunk:
+              break
+          stmt = stmt.where(A.assessment_id.in_(chunk))
+      elif last_id is not None:
+          stmt = stmt.where(A.assessment_id > last_id)
+      rows = (
+          await db.execute(stmt.order_by(A.assessment_id).limit(batch_size).with_for_update())
+      ).all()
+      if wanted is None and not rows:
+          await db.commit()
+          break
+
+      ids = [row[0] for row in rows]
+      actual = {aid: dict.fromkeys(COUNTER_COLUMNS, 0) for aid in ids}
+      counted = await db.execute(
+          select(AC.assessment_id, AC.status, func.count())
+          .where(AC.assessment_id.in_(ids))
+          .group_by(AC.assessment_id, AC.status)
+      )
+      for aid, status, n in counted:
+          actual[aid]["candidates_total"] += n
+          if status in STATUS_COUNTER_COLUMNS:
+              actual[aid][STATUS_COUNTER_COLUMNS[status]] += n
+
+      for aid, *stored in rows:
+          expected = actual[aid]
+          if tuple(stored) != tuple(expected[column] for column in COUNTER_COLUMNS):
+              await db.execute(
+                  update(A)
+                  .where(A.assessment_id == aid)
+                  .values(version=A.version + 1, updated_at=A.updated_at, **expected)
+                  .execution_options(synchronize_session=False)
+              )
+              repaired += 1
+      await db.commit()
 
+      if wanted is not None:
+          last_id = chunk[-1]
+      else:
+          last_id = ids[-1]
+          if len(rows) < batch_size:
+              break
+  return repaired
 
-def get_assessment_with_candidates(db: Session, vendor_id: int):
+
+# ────────────────────────────────────────────────────────────
+# Streaming export of a vendor's candidate pipeline
+# ────────────────────────────────────────────────────────────
+
+PIPELINE_EXPORT_COLUMNS = [
+    "assessment_id",
+    "assessment_title",
+    "candidate_uuid",
+    "name",
+    "email",
+    "phone",
+    "resume_path",
+    "status",
+    "score",
+    "invited_date",
+    "submitted_at",
+]
+
+
+async def iter_candidate_pipeline(
+  db: AsyncSession,
+  vendor_id: int,
+  assessment_id: UUIDClass | None = None,
+  status: str | None = None,
+  invited_from: datetime | None = None,
+  invited_to: datetime | None = None,
+  batch_size: int = 1000,
+):
   """
-  Used by /vendor/dashboard to fetch all assessments for a vendor.
-  The router walks a.candidates relationship to build JSON.
+  Yield one row per (assessment, candidate) link owned by the vendor, in
+  PIPELINE_EXPORT_COLUMNS order.
+
+  Rows are fetched through a server-side cursor in batches of batch_size
+  (yield_per), so memory use does not depend on how many links exist.
+  The caller owns the session and must keep it open while iterating.
   """
-  return list_assessments_for_vendor(db, vendor_id)
+  AC = models.AssessmentCandidate
+  A = models.Assessment
+  C = models.Candidate
+
+  stmt = (
+      select(
+          A.assessment_id,
+          A.title,
+          C.candidate_uuid,
+          C.name,
+          C.email,
+          C.phone,
+          C.resume_path,
+          AC.status,
+          AC.score,
+          AC.invited_date,
+          AC.submitted_at,
+      )
+      .select_from(AC)
+      .join(A, A.assessment_id == AC.assessment_id)
+      .join(C, C.candidate_uuid == AC.candidate_uuid)
+      .where(A.vendor_id == vendor_id)
+      .order_by(AC.assessment_id, AC.invited_date, AC.assessment_candidate_id)
+  )
+  if assessment_id is not None:
+      stmt = stmt.where(AC.assessment_id == assessment_id)
+  if status:
+      stmt = stmt.where(AC.status == status)
+  if invited_from is not None:
+      stmt = stmt.where(AC.invited_date >= invited_from)
+  if invited_to is not None:
+      stmt = stmt.where(AC.invited_date < invited_to)
+
+  result = await db.stream(stmt.execution_options(yield_per=batch_size))
+  async for partition in result.partitions():
+      for row in partition:
+          yield tuple(row)
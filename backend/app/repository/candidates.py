@@ -1,18 +1,100 @@
 # backend/app/repository/candidates.py
-from sqlalchemy.orm import Session
+import uuid
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from .. import models
+from .dialect import insert_for
 
-def create_candidate(db: Session, name: str, email: str, phone: str = None, resume_path: str = None):
+
+def normalize_email(email: str) -> str:
+    """Candidate emails are stored trimmed and lower-cased (unique index on candidate.email)."""
+    return (email or "").strip().lower()
+
+
+async def create_candidate(db: AsyncSession, name: str, email: str, phone: str = None, resume_path: str = None):
     candidate = models.Candidate(
         name=name,
-        email=email,
+        email=normalize_email(email),
         phone=phone,
         resume_path=resume_path
     )
     db.add(candidate)
-    db.commit()
-    db.refresh(candidate)
+    await db.commit()
+    await db.refresh(candidate)
     return candidate
 
-def get_candidate_by_email(db: Session, email: str):
-    return db.query(models.Candidate).filter(models.Candidate.email == email).first()
+async def get_candidate_by_email(db: AsyncSession, email: str):
+    return (
+        await db.execute(
+            select(models.Candidate).where(models.Candidate.email == normalize_email(email))
+        )
+    ).scalars().first()
+
+
+def candidate_upsert_statement(db: AsyncSession, rows: list):
+    """
+    INSERT ... ON CONFLICT (email) DO UPDATE for one or more candidate rows.
+    An existing candidate keeps its name; phone / resume_path are only
+    replaced when the new row provides them, and the row is only written
+    when one of them differs (candidate_upsert_changes), so RETURNING
+    leaves out existing candidates that did not change.
+
+    Rows are de-duplicated by email (the first one wins) and sorted by it:
+    concurrent upserts then lock the candidate rows they share in the same
+    order instead of deadlocking.
+    """
+    C = models.Candidate
+    by_email = {}
+    for row in rows:
+        by_email.setdefault(normalize_email(row["email"]), row)
+    stmt = insert_for(db, C).values([
+        {
+            "candidate_uuid": uuid.uuid4(),
+            "name": row["name"],
+            "email": email,
+            "phone": row.get("phone"),
+            "resume_path": row.get("resume_path"),
+        }
+        for email, row in sorted(by_email.items())
+    ])
+    phone = func.coalesce(stmt.excluded.phone, C.phone)
+    resume_path = func.coalesce(stmt.excluded.resume_path, C.resume_path)
+    return stmt.on_conflict_do_update(
+        index_elements=[C.email],
+        set_={"phone": phone, "resume_path": resume_path},
+        where=or_(phone.is_distinct_from(C.phone), resume_path.is_distinct_from(C.resume_path)),
+    )
+
+
+def candidate_upsert_changes(row: dict, current) -> bool:
+    """
+    Whether candidate_upsert_statement with row changes an existing
+    candidate whose (phone, resume_path) are current.
+    """
+    phone, resume_path = current
+    return (
+        (row.get("phone") is not None and row["phone"] != phone)
+        or (row.get("resume_path") is not None and row["resume_path"] != resume_path)
+    )
+
+
+async def upsert_candidate(db: AsyncSession, name: str, email: str, phone: str = None, resume_path: str = None):
+    """
+    Create the candidate or update phone/resume on the existing one, in one
+    statement that is safe against concurrent adds of the same email (plus
+    a read when the existing candidate was left unchanged).
+    Does not commit; the caller owns the transaction.
+    """
+    stmt = candidate_upsert_statement(db, [{
+        "name": name,
+        "email": email,
+        "phone": phone,
+        "resume_path": resume_path,
+    }]).returning(models.Candidate)
+    candidate = (
+        await db.scalars(stmt, execution_options={"populate_existing": True})
+    ).one_or_none()
+    if candidate is None:
+        # nothing to update: the row exists (and is locked by the upsert)
+        candidate = await get_candidate_by_email(db, email)
+    return candidate
@@ -0,0 +1,16 @@
+# backend/app/repository/dialect.py
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def insert_for(db, model):
+    """
+    Dialect-specific INSERT for model so callers can use
+    on_conflict_do_update / on_conflict_do_nothing (PostgreSQL and SQLite).
+    db may be a Session or an AsyncSession.
+    """
+    name = db.get_bind().dialect.name
+    if name == "postgresql":
+        return postgresql.insert(model)
+    if name == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"Upserts are not supported on {name}")
@@ -0,0 +1,226 @@
+# backend/app/repository/search.py
+#
+# Vendor-scoped search over candidates (name, email, phone) and assessments
+# (title, description, skills), backed by the indexes of migration 0007:
+#
+#   PostgreSQL  pg_trgm GIN indexes. Matches are substrings (ILIKE) or fuzzy
+#               word matches (q <% column, word_similarity >=
+#               pg_trgm.word_similarity_threshold, 0.6 by default), so
+#               prefixes and small typos both hit; ranked by similarity.
+#   SQLite      FTS5 tables kept in sync by triggers, queried with prefix
+#               terms and ranked by bm25. No typo tolerance; for local use.
+#               bm25 clamps the weight of a term found in half the rows or
+#               more to 1e-6, so scores are reported relative to the best
+#               match (1.0) rather than raw.
+#               Without the FTS tables (schema from DB_CREATE_ALL) it falls
+#               back to unindexed LIKE scans.
+#
+# Results are (row, score) pairs, best first; score is only comparable
+# within one result list.
+import logging
+import re
+
+from sqlalchemy import case, column, exists, func, literal, literal_column, or_, select, table
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+# deep offsets re-rank every match; past this, narrow the query instead
+MAX_SEARCH_OFFSET = 1000
+MIN_QUERY_LENGTH = 2
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+_candidate_fts = table("candidate_fts", column("rowid"))
+_assessment_fts = table("assessment_fts", column("assessment_id"))
+# the bare table name, as FTS5's MATCH and bm25() take it
+_candidate_fts_ref = literal_column("candidate_fts")
+_assessment_fts_ref = literal_column("assessment_fts")
+
+
+def normalize_query(raw: str) -> str:
+    """Trim, lower-case and collapse whitespace in a search string."""
+    return " ".join((raw or "").lower().split())
+
+
+def _like_pattern(q: str) -> str:
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_query(q: str) -> str:
+    # every term must match, each as a prefix: "jo smi" -> "jo"* "smi"*
+    return " ".join(f'"{term}"*' for term in _TERM.findall(q))
+
+
+def _ilike(col, pattern):
+    return col.ilike(pattern, escape="\\")
+
+
+def _relative_score(rank):
+    # bm25 is negative, lower is better; FTS5 only allows it in the MATCH
+    # query itself, hence the window over the subquery's column
+    return (rank / func.min(rank).over()).label("score")
+
+
+async def _fetch(db: AsyncSession, stmt, limit: int, offset: int) -> list:
+    return [tuple(r) for r in (await db.execute(stmt.limit(limit).offset(offset))).all()]
+
+
+def _vendor_owns_candidate(vendor_id: int):
+    AC = models.AssessmentCandidate
+    A = models.Assessment
+    return exists().where(
+        AC.candidate_uuid == models.Candidate.candidate_uuid,
+        A.assessment_id == AC.assessment_id,
+        A.vendor_id == vendor_id,
+    )
+
+
+async def search_candidates(
+    db: AsyncSession, vendor_id: int, q: str, limit: int = DEFAULT_SEARCH_LIMIT, offset: int = 0
+) -> list:
+    """
+    Candidates linked to any of the vendor's assessments whose name, email
+    or phone match q. Returns [(Candidate, score)], best first.
+    """
+    C = models.Candidate
+    q = normalize_query(q)
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        pattern = _like_pattern(q)
+        term = literal(q)
+        score = (
+            func.greatest(func.word_similarity(term, C.name), func.word_similarity(term, C.email))
+            # exact prefixes first
+            + case((or_(_ilike(C.name, pattern[1:]), _ilike(C.email, pattern[1:])), 1.0), else_=0.0)
+        ).label("score")
+        stmt = (
+            select(C, score)
+            .where(
+                or_(
+                    _ilike(C.name, pattern),
+                    _ilike(C.email, pattern),
+                    _ilike(C.phone, pattern),
+                    term.op("<%")(C.name),
+                    term.op("<%")(C.email),
+                ),
+                _vendor_owns_candidate(vendor_id),
+            )
+            .order_by(score.desc(), C.id)
+        )
+        return await _fetch(db, stmt, limit, offset)
+
+    if dialect == "sqlite":
+        match = _fts_query(q)
+        if match:
+            hits = (
+                select(_candidate_fts.c.rowid.label("id"), func.bm25(_candidate_fts_ref).label("rank"))
+                .where(_candidate_fts_ref.op("MATCH")(match))
+                .subquery()
+            )
+            stmt = (
+                select(C, _relative_score(hits.c.rank))
+                .join(C, C.id == hits.c.id)
+                .where(_vendor_owns_candidate(vendor_id))
+                .order_by(hits.c.rank, C.id)
+            )
+            try:
+                return await _fetch(db, stmt, limit, offset)
+            except OperationalError as e:
+                if "no such table" not in str(e):
+                    raise
+                logger.warning("candidate_fts missing (run alembic upgrade head); searching without an index")
+
+    pattern = _like_pattern(q)
+    stmt = (
+        select(C, literal(0.0).label("score"))
+        .where(
+            or_(_ilike(C.name, pattern), _ilike(C.email, pattern), _ilike(C.phone, pattern)),
+            _vendor_owns_candidate(vendor_id),
+        )
+        .order_by(C.name, C.id)
+    )
+    return await _fetch(db, stmt, limit, offset)
+
+
+async def search_assessments(
+    db: AsyncSession, vendor_id: int, q: str, limit: int = DEFAULT_SEARCH_LIMIT, offset: int = 0
+) -> list:
+    """
+    The vendor's assessments whose title, description or skills match q.
+    Returns [(Assessment, score)], best first; title matches outrank
+    skills, which outrank description.
+    """
+    A = models.Assessment
+    q = normalize_query(q)
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        pattern = _like_pattern(q)
+        term = literal(q)
+        score = (
+            func.greatest(
+                func.word_similarity(term, A.title),
+                func.word_similarity(term, A.skills) * 0.8,
+                func.word_similarity(term, A.description) * 0.5,
+            )
+            + case((_ilike(A.title, pattern[1:]), 1.0), else_=0.0)
+        ).label("score")
+        stmt = (
+            select(A, score)
+            .where(
+                A.vendor_id == vendor_id,
+                or_(
+                    _ilike(A.title, pattern),
+                    _ilike(A.skills, pattern),
+                    _ilike(A.description, pattern),
+                    term.op("<%")(A.title),
+                    term.op("<%")(A.skills),
+                ),
+            )
+            .order_by(score.desc(), A.created_at, A.assessment_id)
+        )
+        return await _fetch(db, stmt, limit, offset)
+
+    if dialect == "sqlite":
+        match = _fts_query(q)
+        if match:
+            # assessment_id is indexed too (for the triggers); search the text only
+            match = f"{{title description skills}} : ({match})"
+            # column weights for bm25: assessment_id, title, description, skills
+            rank = func.bm25(_assessment_fts_ref, 0.0, 4.0, 1.0, 2.0)
+            hits = (
+                select(_assessment_fts.c.assessment_id, rank.label("rank"))
+                .where(_assessment_fts_ref.op("MATCH")(match))
+                .subquery()
+            )
+            stmt = (
+                select(A, _relative_score(hits.c.rank))
+                .join(A, A.assessment_id == hits.c.assessment_id)
+                .where(A.vendor_id == vendor_id)
+                .order_by(hits.c.rank, A.created_at, A.assessment_id)
+            )
+            try:
+                return await _fetch(db, stmt, limit, offset)
+            except OperationalError as e:
+                if "no such table" not in str(e):
+                    raise
+                logger.warning("assessment_fts missing (run alembic upgrade head); searching without an index")
+
+    pattern = _like_pattern(q)
+    stmt = (
+        select(A, literal(0.0).label("score"))
+        .where(
+            A.vendor_id == vendor_id,
+            or_(_ilike(A.title, pattern), _ilike(A.skills, pattern), _ilike(A.description, pattern)),
+        )
+        .order_by(A.created_at, A.assessment_id)
+    )
+    return await _fetch(db, stmt, limit, offset)
@@ -0,0 +1,252 @@
+# backend/app/repository/skills.py
+#
+# Normalized skill index (migration 0008). Assessment.skills stays the
+# free text the vendor typed; every write to it also rewrites the
+# assessment's rows in assessment_skill, which link to one skill row per
+# normalized name. Matching reads the (skill_id, assessment_id) index as an
+# inverted index: only posting lists of the requested skills are touched,
+# however many assessments exist.
+import re
+from uuid import UUID as UUIDClass
+
+from sqlalchemy import case, delete, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+from .dialect import insert_for
+
+MAX_SKILL_LENGTH = 100
+MAX_MATCH_SKILLS = 50
+
+# common spellings -> canonical name; keys and values are already normalized
+SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "kube": "kubernetes",
+    "golang": "go",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "pg": "postgresql",
+    "mssql": "sql server",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "csharp": "c#",
+    "c sharp": "c#",
+    "cpp": "c++",
+    "amazon web services": "aws",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "ml": "machine learning",
+    "tf": "terraform",
+}
+
+# separators between skills in the free-text column
+_SPLIT = re.compile(r"[,;|\n]+")
+# punctuation trimmed from either end; "+" and "#" are kept (c++, c#)
+_TRIM = " \t\r.:-*•·'\"()[]{}"
+
+
+def normalize_skill(raw: str):
+    """
+    Canonical form of one skill name (lower-case, single spaces, aliases
+    resolved), or None if nothing is left.
+    """
+    name = " ".join((raw or "").lower().split()).strip(_TRIM)
+    if not name:
+        return None
+    name = SKILL_ALIASES.get(name, name)
+    return name[:MAX_SKILL_LENGTH]
+
+
+def parse_skills(value) -> list:
+    """
+    Normalized, de-duplicated skills from the free-text column
+    ("Python, K8s; SQL") or a list of names, in first-seen order.
+    """
+    if not value:
+        return []
+    parts = _SPLIT.split(value) if isinstance(value, str) else value
+    out = {}
+    for part in parts:
+        name = normalize_skill(part if isinstance(part, str) else str(part))
+        if name:
+            out[name] = None
+    return list(out)
+
+
+async def get_skill_ids(db: AsyncSession, names: list) -> dict:
+    """{name: skill id} for the normalized names that exist in the vocabulary."""
+    if not names:
+        return {}
+    S = models.Skill
+    return dict((await db.execute(select(S.name, S.id).where(S.name.in_(names)))).all())
+
+
+async def ensure_skills(db: AsyncSession, names: list) -> dict:
+    """
+    {name: skill id} for normalized names, adding missing ones to the
+    vocabulary (ON CONFLICT DO NOTHING, so concurrent writers are fine).
+    Does not commit.
+    """
+    ids = await get_skill_ids(db, names)
+    missing = [name for name in names if name not in ids]
+    if missing:
+        await db.execute(
+            insert_for(db, models.Skill)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[models.Skill.name])
+        )
+        ids.update(await get_skill_ids(db, missing))
+    return ids
+
+
+async def set_assessment_skills(db: AsyncSession, assessment_id: UUIDClass, skills) -> list:
+    """
+    Make the assessment's assessment_skill rows (and skill_count) match
+    skills, free text or a list. Does not commit.
+    Returns the normalized names.
+    """
+    AS = models.AssessmentSkill
+    names = parse_skills(skills)
+    ids = await ensure_skills(db, names)
+    wanted = set(ids.values())
+
+    current = set((await db.execute(select(AS.skill_id).where(AS.assessment_id == assessment_id))).scalars())
+    stale = current - wanted
+    if stale:
+        await db.execute(delete(AS).where(AS.assessment_id == assessment_id, AS.skill_id.in_(stale)))
+    added = wanted - current
+    if added:
+        await db.execute(
+            insert_for(db, AS)
+            .values([{"assessment_id": assessment_id, "skill_id": skill_id} for skill_id in added])
+            .on_conflict_do_nothing(index_elements=[AS.assessment_id, AS.skill_id])
+        )
+    if stale or added:
+        await db.execute(
+            update(models.Assessment)
+            .where(models.Assessment.assessment_id == assessment_id)
+            # explicit, or the column's onupdate would set it to now()
+            .values(skill_count=len(wanted), updated_at=models.Assessment.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+    return names
+
+
+async def match_assessments(
+    db: AsyncSession,
+    skills: list,
+    vendor_id: int = None,
+    status: str = None,
+    min_overlap: int = 1,
+    limit: int = 20,
+    offset: int = 0,
+) -> list:
+    """
+    Assessments needing any of skills (free text or a list, normalized
+    here), ranked by overlap (how many of them the assessment needs), then
+    Jaccard similarity |A ∩ Q| / |A ∪ Q|, then newest first. Skills outside
+    the vocabulary match nothing but still count in |Q|.
+    Returns [(Assessment, overlap, jaccard)].
+    """
+    A = models.Assessment
+    AS = models.AssessmentSkill
+    skills = parse_skills(skills)
+    ids = list((await get_skill_ids(db, skills)).values())
+    if not ids or min_overlap > len(ids):
+        return []
+
+    # posting lists of the requested skills only, counted per assessment;
+    # filters go inside so a vendor's query can start from its assessments
+    hits = (
+        select(AS.assessment_id, func.count().label("overlap"))
+        .where(AS.skill_id.in_(ids))
+        .group_by(AS.assessment_id)
+    )
+    if vendor_id is not None or status is not None:
+        hits = hits.join(A, A.assessment_id == AS.assessment_id)
+        if vendor_id is not None:
+            hits = hits.where(A.vendor_id == vendor_id)
+        if status is not None:
+            hits = hits.where(A.status == status)
+    if min_overlap > 1:
+        hits = hits.having(func.count() >= min_overlap)
+    hits = hits.subquery()
+
+    # |A ∪ Q|; a skill_count not yet backfilled falls back to |Q|
+    union = case(
+        (A.skill_count >= hits.c.overlap, A.skill_count + len(skills) - hits.c.overlap),
+        else_=len(skills),
+    )
+    jaccard = (hits.c.overlap * literal(1.0) / union).label("jaccard")
+    stmt = (
+        select(A, hits.c.overlap, jaccard)
+        .join(hits, hits.c.assessment_id == A.assessment_id)
+        .order_by(hits.c.overlap.desc(), jaccard.desc(), A.created_at.desc(), A.assessment_id)
+    )
+    rows = (await db.execute(stmt.limit(limit).offset(offset))).all()
+    return [(a, overlap, float(score)) for a, overlap, score in rows]
+
+
+async def backfill_assessment_skills(db: AsyncSession, batch_size: int = 500, only_missing: bool = True) -> int:
+    """
+    Index the free-text skills of existing assessments, batch_size
+    assessments per transaction, in assessment_id order. With only_missing
+    (the default) assessments that already have skill rows are skipped, so
+    an interrupted run can simply be restarted; without it every
+    assessment's rows are rebuilt. Commits.
+    Returns the number of assessments indexed.
+    """
+    A = models.Assessment
+    AS = models.AssessmentSkill
+    indexed = 0
+    last_id = None
+
+    while True:
+        stmt = select(A.assessment_id, A.skills).where(A.skills.is_not(None), A.skills != "")
+        if only_missing:
+            stmt = stmt.where(A.skill_count == 0)
+        if last_id is not None:
+            stmt = stmt.where(A.assessment_id > last_id)
+        rows = (await db.execute(stmt.order_by(A.assessment_id).limit(batch_size))).all()
+        if not rows:
+            break
+
+        parsed = {aid: parse_skills(text) for aid, text in rows}
+        if not only_missing:
+            # names may normalize differently now (e.g. a new alias)
+            await db.execute(delete(AS).where(AS.assessment_id.in_(list(parsed))))
+        ids = await ensure_skills(db, list(dict.fromkeys(name for names in parsed.values() for name in names)))
+        links = [
+            {"assessment_id": aid, "skill_id": ids[name]}
+            for aid, names in parsed.items()
+            for name in names
+        ]
+        if links:
+            await db.execute(
+                insert_for(db, AS).values(links).on_conflict_do_nothing(index_elements=[AS.assessment_id, AS.skill_id])
+            )
+        # recount rather than trust len(names): a re-run may find rows already there
+        counted = (
+            select(func.count()).select_from(AS).where(AS.assessment_id == A.assessment_id).scalar_subquery()
+        )
+        await db.execute(
+            update(A)
+            .where(A.assessment_id.in_(list(parsed)))
+            .values(skill_count=counted, updated_at=A.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        indexed += sum(1 for names in parsed.values() if names)
+        last_id = rows[-1][0]
+
+    return indexed
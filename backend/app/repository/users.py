@@ -1,18 +1,29 @@
 # backend/app/repository/users.py
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from .. import models
 from app import services as auth
 
-def create_user(db: Session, email: str, password: str):
-    hashed = auth.get_password_hash(password)
+async def create_user(db: AsyncSession, email: str, password: str):
+    # hashing is CPU-bound; runs in the password process pool
+    hashed = await auth.hash_password_async(password)
     user = models.User(email=email, password_hash=hashed)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = db.query(models.User).filter(models.User.email == email).first()
-    if user and auth.verify_password(password, user.password_hash):
-        return user
-    return None
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    user = (
+        await db.execute(select(models.User).where(models.User.email == email))
+    ).scalars().first()
+    if not user:
+        return None
+    ok, new_hash = await auth.verify_and_update_async(password, user.password_hash)
+    if not ok:
+        return None
+    if new_hash:
+        # stored hash predates the current PASSWORD_HASH_ROUNDS
+        user.password_hash = new_hash
+        await db.commit()
+    return user
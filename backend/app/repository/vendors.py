@@ -1,19 +1,29 @@
 # backend/app/repository/vendors.py
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from .. import models
 from app import services as auth
 
-def create_vendor(db: Session, company_name: str, email: str, password: str):
-    hashed = auth.get_password_hash(password)
+async def create_vendor(db: AsyncSession, company_name: str, email: str, password: str):
+    # hashing is CPU-bound; runs in the password process pool
+    hashed = await auth.hash_password_async(password)
     vendor = models.Vendor(company_name=company_name, email=email, password_hash=hashed)
     db.add(vendor)
-    db.commit()
-    db.refresh(vendor)
+    await db.commit()
+    await db.refresh(vendor)
     return vendor
 
-def authenticate_vendor(db: Session, email: str, password: str):
-    vendor = db.query(models.Vendor).filter(models.Vendor.email == email).first()
-    if vendor and auth.verify_password(password, vendor.password_hash):
-        return vendor
-    return None
-
+async def authenticate_vendor(db: AsyncSession, email: str, password: str):
+    vendor = (
+        await db.execute(select(models.Vendor).where(models.Vendor.email == email))
+    ).scalars().first()
+    if not vendor:
+        return None
+    ok, new_hash = await auth.verify_and_update_async(password, vendor.password_hash)
+    if not ok:
+        return None
+    if new_hash:
+        # stored hash predates the current PASSWORD_HASH_ROUNDS
+        vendor.password_hash = new_hash
+        await db.commit()
+    return vendor
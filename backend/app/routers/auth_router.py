@@ -10,7 +10,8 @@ from fastapi import (
     Request,
     status,
 )
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 
 from .. import schemas, db
@@ -33,19 +34,19 @@ class VendorLoginPayload(BaseModel):
 # ────────────────────────────────────────────────────────────
 
 @router.post("/vendor/register")
-def vendor_register(
+async def vendor_register(
     payload: schemas.VendorCreate,
-    database: Session = Depends(db.get_db),
+    database: AsyncSession = Depends(db.get_db),
 ):
     existing = (
-        database.query(crud.models.Vendor)
-        .filter(crud.models.Vendor.email == payload.email)
-        .first()
-    )
+        await database.execute(
+            select(crud.models.Vendor).where(crud.models.Vendor.email == payload.email)
+        )
+    ).scalars().first()
     if existing:
         raise HTTPException(status_code=400, detail="Vendor already exists")
 
-    vendor = crud.create_vendor(
+    vendor = await crud.create_vendor(
         database,
         payload.company_name,
         payload.email,
@@ -59,18 +60,18 @@ def vendor_register(
 # ────────────────────────────────────────────────────────────
 
 @router.post("/vendor/login")
-def vendor_login(
+async def vendor_login(
     payload: VendorLoginPayload,
     response: Response,
-    database: Session = Depends(db.get_db),
+    database: AsyncSession = Depends(db.get_db),
 ):
-    vendor = crud.authenticate_vendor(database, payload.email, payload.password)
+    vendor = await crud.authenticate_vendor(database, payload.email, payload.password)
     if not vendor:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     # create token with vendor subject
     token, expire = auth.create_access_token({"sub": f"vendor:{vendor.id}"})
-    auth.persist_token(database, token, vendor_id=vendor.id, expires_at=expire)
+    await auth.persist_token(database, token, vendor_id=vendor.id, expires_at=expire)
 
     # HttpOnly cookie so frontend doesn't need to manage token manually
     response.set_cookie(
@@ -95,10 +96,10 @@ def vendor_login(
 # ────────────────────────────────────────────────────────────
 
 @router.post("/logout")
-def logout(
+async def logout(
     request: Request,
     response: Response,
-    database: Session = Depends(db.get_db),
+    database: AsyncSession = Depends(db.get_db),
 ):
     token = request.cookies.get("access_token")
 
@@ -108,10 +109,10 @@ def logout(
     # remove from DB session store if present
     if token:
         try:
-            auth.remove_token(database, token)
+            await auth.remove_token(database, token)
         except Exception:
             # Don't fail logout if DB cleanup fails
-            database.rollback()
+            await database.rollback()
 
     return {"ok": True, "detail": "Logged out successfully"}
 
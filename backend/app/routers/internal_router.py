@@ -0,0 +1,59 @@
+# backend/app/routers/internal_router.py
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from app import db
+from app import services as auth
+from app.services import metrics_service
+
+# Callers must send INTERNAL_API_TOKEN as X-Internal-Token. Unset, every
+# /internal route answers 403: these are never public.
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+
+def require_internal_token(request: Request):
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=403, detail="Internal endpoints are disabled (INTERNAL_API_TOKEN unset)")
+    supplied = request.headers.get("x-internal-token", "")
+    if not hmac.compare_digest(supplied, INTERNAL_API_TOKEN):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get("/stats")
+def internal_stats():
+    """
+    Operational counters for sizing in-process caches and the DB pools.
+    """
+    return {
+        "principal_cache": auth.principal_cache.stats(),
+        "db_pool": db.db_pool_status(),
+        "session_reaper": auth.reaper_stats.snapshot(),
+        "session_store": auth.get_session_store().stats(),
+    }
+
+
+@router.get("/db-pool")
+def internal_db_pool():
+    """
+    Pool occupancy (checked out / overflow) and per-checkout wait times.
+    """
+    return db.db_pool_status()
+
+
+@router.get("/metrics")
+def internal_metrics():
+    """
+    Prometheus text exposition: per-route latency histograms, status codes,
+    in-flight requests, per-request DB query counts/time and pool gauges.
+    """
+    body, content_type = metrics_service.render()
+    return Response(content=body, media_type=content_type)
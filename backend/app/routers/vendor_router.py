@@ -1,19 +1,25 @@
 # vendor/backend/app/routers/vendor_router.py
 
+import csv
+import hashlib
+import io
+import json
+import logging
 import os
 import shutil
 import uuid
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID as UUIDClass
 
 from fastapi import (
     APIRouter, Depends, HTTPException, Request, Response, status, Body,
-    UploadFile, File, Form, Response
+    UploadFile, File, Form, Response, Query
 )
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import func, text
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import db, schemas, models
 from app.services import decode_token
@@ -21,15 +27,241 @@ from app import repository as crud
 from app import services as auth
 
 router = APIRouter(prefix="/vendor", tags=["vendor"])
+logger = logging.getLogger(__name__)
+
+CANDIDATE_STATUSES = {"invited", "interviewed", "shortlisted", "rejected"}
+
+
+def _normalize_status(raw: Optional[str]) -> str:
+    """
+    Lower-case/trim a candidate status and map the UI's "interview" to "interviewed".
+    """
+    raw = (raw or "").strip().lower()
+    return "interviewed" if raw == "interview" else raw
+
+
+def _status_filter(raw: Optional[str]) -> Optional[str]:
+    """
+    Validate an optional ?status= query filter.
+    """
+    if raw is None or not raw.strip():
+        return None
+    value = _normalize_status(raw)
+    if value not in CANDIDATE_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Allowed values: {sorted(CANDIDATE_STATUSES)}")
+    return value
+
+
+# Bump when the dashboard / assessment payload shape changes, so clients
+# don't get 304s for bodies cached under the old shape.
+ETAG_SCHEMA = "1"
+
+
+def _etag(*parts) -> str:
+    """
+    Weak ETag over the version stamps and anything else that shapes the body
+    (query string, vendor fields). Cheap: no candidate rows involved.
+    """
+    digest = hashlib.sha1(json.dumps([ETAG_SCHEMA, *parts], default=str).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _cache_headers(etag: str) -> dict:
+    # private: per-vendor data; no-cache: revalidate with If-None-Match every time
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    A 304 response if If-None-Match already names etag, else None.
+    Weak comparison (RFC 9110 §13.1.2), so the W/ prefix is ignored.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return None
+
+
+# ────────────────────────────────────────────────────────────
+# Sparse fieldsets (?fields= / ?include=) for dashboard and assessment reads
+# ────────────────────────────────────────────────────────────
+
+# assessment field -> Assessment columns it reads (assessment_id is always loaded)
+ASSESSMENT_FIELD_COLUMNS = {
+    "id": (),
+    "assessment_id": (),
+    "title": ("title",),
+    "description": ("description",),
+    "skills": ("skills",),
+    "duration": ("duration",),
+    "work_experience": ("work_experience",),
+    "vendor_id": ("vendor_id",),
+    "status": ("status",),
+    "required_candidates": ("required_candidates",),
+    "candidates_count": crud.COUNTER_COLUMNS,
+}
+
+# candidate field -> Candidate columns it reads (status comes from the link)
+CANDIDATE_FIELD_COLUMNS = {
+    "id": ("id",),
+    "candidate_uuid": (),
+    "name": ("name",),
+    "email": ("email",),
+    "phone": ("phone",),
+    "resume_path": ("resume_path",),
+    "status": (),
+}
+CANDIDATE_FIELDS = tuple(CANDIDATE_FIELD_COLUMNS)
+
+INCLUDES = {"candidates"}
+
+# default shapes (no ?fields=)
+DASHBOARD_FIELDS = (
+    "id", "assessment_id", "title", "description", "skills", "duration",
+    "work_experience", "vendor_id", "status", "required_candidates", "candidates_count",
+)
+ASSESSMENT_DETAIL_FIELDS = (
+    "assessment_id", "title", "description", "skills", "duration",
+    "work_experience", "vendor_id", "required_candidates", "candidates_count",
+)
+
+
+class FieldSelection:
+    """
+    What one read should load and return: assessment fields, and candidate
+    fields (None: no candidate list at all). columns / candidate_columns
+    are the matching load_only arguments (None: whole rows, the default
+    shape).
+    """
+
+    def __init__(self, fields: tuple, candidate_fields: Optional[tuple], sparse: bool):
+        self.fields = fields
+        self.candidate_fields = candidate_fields
+        self.columns = None
+        self.candidate_columns = None
+        if sparse:
+            self.columns = [models.Assessment.assessment_id] + [
+                getattr(models.Assessment, column)
+                for field in fields for column in ASSESSMENT_FIELD_COLUMNS[field]
+            ]
+            if candidate_fields is not None:
+                self.candidate_columns = [
+                    getattr(models.Candidate, column)
+                    for field in candidate_fields for column in CANDIDATE_FIELD_COLUMNS[field]
+                ]
+
+
+def _field_selection(fields: Optional[str], include: Optional[str], default_fields: tuple) -> FieldSelection:
+    """
+    Parse ?fields= and ?include=.
+
+    fields lists assessment fields plus candidates.<field> entries
+    ("candidates" alone means every candidate field); include=candidates
+    adds the candidate list with every field. Without fields the endpoint's
+    default shape is returned, and the candidate list is only left out
+    when include is given without "candidates". assessment_id is always
+    returned. Unknown names are a 400.
+    """
+    includes = {name.strip() for name in (include or "").split(",") if name.strip()}
+    unknown = includes - INCLUDES
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include {sorted(unknown)}. Allowed values: {sorted(INCLUDES)}")
+
+    if fields is None:
+        wants_candidates = include is None or "candidates" in includes
+        return FieldSelection(default_fields, CANDIDATE_FIELDS if wants_candidates else None, sparse=False)
+
+    picked, candidate_picked = ["assessment_id"], []
+    all_candidate_fields = "candidates" in includes
+    for name in (part.strip() for part in fields.split(",")):
+        if not name:
+            continue
+        if name == "candidates":
+            all_candidate_fields = True
+        elif name.startswith("candidates."):
+            field = name[len("candidates."):]
+            if field not in CANDIDATE_FIELD_COLUMNS:
+                raise HTTPException(status_code=400, detail=f"Unknown field {name!r}. Candidate fields: {list(CANDIDATE_FIELDS)}")
+            if field not in candidate_picked:
+                candidate_picked.append(field)
+        elif name in ASSESSMENT_FIELD_COLUMNS:
+            if name not in picked:
+                picked.append(name)
+        else:
+            raise HTTPException(status_code=400, detail=f"Unknown field {name!r}. Allowed values: {list(ASSESSMENT_FIELD_COLUMNS)}")
+
+    if all_candidate_fields:
+        candidate_fields = CANDIDATE_FIELDS
+    elif candidate_picked:
+        candidate_fields = tuple(candidate_picked)
+    else:
+        candidate_fields = None
+    return FieldSelection(tuple(picked), candidate_fields, sparse=True)
+
+
+# Response models are built with model_construct (values come straight from
+# typed columns, nothing to validate) and serialized by FastAPI through
+# pydantic-core: UUIDs and datetimes are encoded natively, and
+# response_model_exclude_unset drops the fields a sparse fieldset left out.
+
+def _assessment_values(a: models.Assessment, fields: tuple, status_filter: Optional[str] = None) -> dict:
+    out = {}
+    for field in fields:
+        if field in ("id", "assessment_id"):
+            out[field] = a.assessment_id
+        elif field == "required_candidates":
+            out[field] = int(a.required_candidates or 0)
+        elif field == "candidates_count":
+            out[field] = crud.candidate_count(a, status_filter)
+        else:
+            out[field] = getattr(a, field)
+    return out
+
+
+def _candidate_out(ac_rel: models.AssessmentCandidate, fields: tuple = CANDIDATE_FIELDS) -> schemas.CandidateOut:
+    cand = ac_rel.candidate
+    out = {}
+    for field in fields:
+        if field == "status":
+            out[field] = ac_rel.status
+        else:
+            out[field] = getattr(cand, field)
+    return schemas.CandidateOut.model_construct(**out)
+
+
+async def _get_owned_assessment(database: AsyncSession, assessment_id: str, vendor_id: int) -> models.Assessment:
+    """
+    Resolve an assessment the vendor owns, or raise 400 (bad id) / 404.
+    """
+    try:
+        aid = UUIDClass(assessment_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid assessment ID format")
+
+    assessment = (
+        await database.execute(
+            select(models.Assessment).where(
+                models.Assessment.assessment_id == aid,
+                models.Assessment.vendor_id == vendor_id,
+            )
+        )
+    ).scalars().first()
+
+    if not assessment:
+        raise HTTPException(status_code=404, detail="Assessment not found or unauthorized")
+    return assessment
 
 
 # ────────────────────────────────────────────────────────────
 # ✅ AUTH DEPENDENCY: Get Current Vendor from Cookie Token
 # ────────────────────────────────────────────────────────────
 
-def get_current_vendor(
+async def get_current_vendor(
     request: Request,
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ) -> models.Vendor:
 
     token = request.cookies.get("access_token")
@@ -37,6 +269,11 @@ def get_current_vendor(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
+    # Recently verified token: skip JWT decode, session and vendor lookups
+    cached = auth.principal_cache.get(token, "vendor")
+    if cached is not None:
+        return await auth.restore_principal(database, models.Vendor, cached)
+
     payload = decode_token(token)
 
     if not payload:
@@ -53,14 +290,15 @@ def get_current_vendor(
         raise HTTPException(status_code=401, detail="Malformed vendor token")
 
     # Verify active session in DB
-    session = auth.get_session(database, token)
+    session = await auth.get_session(database, token, claims=payload)
     if not session:
         raise HTTPException(status_code=401, detail="Session expired or invalid")
 
-    vendor = database.query(models.Vendor).get(vendor_id)
+    vendor = await database.get(models.Vendor, vendor_id)
     if not vendor:
         raise HTTPException(status_code=404, detail="Vendor not found")
 
+    auth.principal_cache.put(token, "vendor", vendor, token_exp=payload.get("exp"))
     return vendor
 
 
@@ -68,69 +306,309 @@ def get_current_vendor(
 # ✅ GET Dashboard: Vendor Info + Assessments + Candidate Count
 # ────────────────────────────────────────────────────────────
 
-@router.get("/dashboard")
-def vendor_dashboard(
+@router.get("/dashboard", response_model=schemas.DashboardOut, response_model_exclude_unset=True)
+async def vendor_dashboard(
+    request: Request,
+    response: Response,
+    candidates_limit: Optional[int] = Query(None, ge=1, le=crud.MAX_CANDIDATE_PAGE_SIZE),
+    status: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    include: Optional[str] = Query(None),
     current_vendor: models.Vendor = Depends(get_current_vendor),
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
     Get vendor profile and all assessments with linked candidates count.
+
+    Without candidates_limit every linked candidate is returned (legacy shape).
+    With candidates_limit each assessment carries only the first page of
+    candidates plus a next_cursor for /vendor/assessment/{id}/candidates.
+
+    fields / include select a sparse fieldset, e.g.
+    ?fields=title,candidates_count for a list view (no candidates loaded) or
+    ?fields=title,candidates.name,candidates.status. Only the columns
+    needed are read from the database.
+
+    Sends an ETag; a matching If-None-Match gets 304 without loading any
+    candidates.
     """
 
-    assessments = crud.get_assessment_with_candidates(database, current_vendor.id)
+    status_filter = _status_filter(status)
+    selection = _field_selection(fields, include, DASHBOARD_FIELDS)
+
+    # versions before the payload: a write in between yields a stale tag
+    # (one extra 200 later), never a 304 for changed data
+    etag = _etag(
+        "dashboard",
+        current_vendor.id,
+        current_vendor.company_name,
+        current_vendor.email,
+        await crud.list_assessment_versions(database, current_vendor.id),
+        sorted(request.query_params.multi_items()),
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response.headers.update(_cache_headers(etag))
+
+    candidate_fields = selection.candidate_fields
+
+    if candidate_fields is None:
+        # no candidate list requested: assessments only
+        assessments = await crud.list_assessments_for_vendor(database, current_vendor.id, selection.columns)
+        pages = None
+    elif candidates_limit is None:
+        assessments = await crud.get_assessment_with_candidates(
+            database, current_vendor.id, selection.columns, selection.candidate_columns
+        )
+        pages = {
+            a.assessment_id: (
+                [ac for ac in a.candidates or [] if ac.candidate
+                 and (status_filter is None or ac.status == status_filter)],
+                None,
+            )
+            for a in assessments
+        }
+    else:
+        assessments = await crud.list_assessments_for_vendor(database, current_vendor.id, selection.columns)
+        ids = [a.assessment_id for a in assessments]
+        pages = await crud.first_candidate_pages(
+            database, ids, candidates_limit, status_filter, selection.candidate_columns
+        )
+
     out = []
 
     for a in assessments or []:
-        candidates = []
-        for ac_rel in a.candidates or []:
-            cand = getattr(ac_rel, "candidate", None)
-            if not cand:
-                continue
-
-            candidates.append({
-                "id": cand.id,
-                "candidate_uuid": str(cand.candidate_uuid) if cand.candidate_uuid else None,
-                "name": cand.name,
-                "email": cand.email,
-                "phone": cand.phone,
-                "resume_path": cand.resume_path,
-                "status": ac_rel.status
-            })
+        item = _assessment_values(a, selection.fields, status_filter)
+        if pages is not None:
+            rows, next_cursor = pages[a.assessment_id]
+            item["candidates"] = [_candidate_out(ac_rel, candidate_fields) for ac_rel in rows if ac_rel.candidate]
+            if candidates_limit is not None:
+                item["next_cursor"] = next_cursor
+        out.append(schemas.DashboardAssessmentOut.model_construct(**item))
+
+    return schemas.DashboardOut.model_construct(
+        vendor=schemas.DashboardVendorOut.model_construct(
+            id=current_vendor.id,
+            company_name=current_vendor.company_name,
+            email=current_vendor.email,
+        ),
+        assessments=out,
+    )
+
+
+# ────────────────────────────────────────────────────────────
+# ✅ GET Assessment Summary: Candidate Counts per Status
+# ────────────────────────────────────────────────────────────
 
+@router.get("/assessments/summary")
+async def assessments_summary(
+    request: Request,
+    response: Response,
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    Candidate counts (total and per status) for each of the vendor's
+    assessments plus vendor-wide totals. One query on the assessment
+    table's counter columns; assessment_candidate is never read.
+    """
+
+    rows = await crud.list_assessment_summaries(database, current_vendor.id)
+
+    etag = _etag("summary", current_vendor.id, [(r.assessment_id, r.version) for r in rows])
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response.headers.update(_cache_headers(etag))
+
+    totals = dict.fromkeys(crud.COUNTER_COLUMNS, 0)
+    out = []
+    for r in rows:
+        counts = {column: getattr(r, column) for column in crud.COUNTER_COLUMNS}
+        for column, n in counts.items():
+            totals[column] += n
         out.append({
-            "id": str(a.assessment_id),
-            "assessment_id": str(a.assessment_id),
-            "title": a.title,
-            "description": a.description,
-            "skills": a.skills,
-            "duration": a.duration,
-            "work_experience": a.work_experience,
-            "vendor_id": a.vendor_id,
-            "status": a.status,
-            "required_candidates": int(a.required_candidates or 0),
-            "candidates_count": len(candidates),
-            "candidates": candidates
+            "assessment_id": str(r.assessment_id),
+            "title": r.title,
+            "status": r.status,
+            "required_candidates": int(r.required_candidates or 0),
+            "candidates_count": counts["candidates_total"],
+            "status_counts": {
+                status: counts[column] for status, column in crud.STATUS_COUNTER_COLUMNS.items()
+            },
         })
 
     return {
-        "vendor": {
-            "id": current_vendor.id,
-            "company_name": current_vendor.company_name,
-            "email": current_vendor.email
+        "ok": True,
+        "assessments": out,
+        "totals": {
+            "assessments": len(out),
+            "candidates_count": totals["candidates_total"],
+            "status_counts": {
+                status: totals[column] for status, column in crud.STATUS_COUNTER_COLUMNS.items()
+            },
         },
-        "assessments": out
     }
 
 
+# ────────────────────────────────────────────────────────────
+# ✅ Search Candidates / Assessments
+# ────────────────────────────────────────────────────────────
+
+def _search_query(q: str) -> str:
+    query = crud.normalize_query(q)
+    if len(query) < crud.MIN_QUERY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Search query needs at least {crud.MIN_QUERY_LENGTH} characters")
+    return query
+
+
+def _next_offset(rows: list, limit: int, offset: int) -> Optional[int]:
+    # one extra row is fetched to tell whether another page exists
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    return offset + limit
+
+
+@router.get("/search/candidates", response_model=schemas.CandidateSearchOut, response_model_exclude_unset=True)
+async def search_candidates(
+    q: str = Query(..., max_length=200),
+    limit: int = Query(crud.DEFAULT_SEARCH_LIMIT, ge=1, le=crud.MAX_SEARCH_LIMIT),
+    offset: int = Query(0, ge=0, le=crud.MAX_SEARCH_OFFSET),
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    Candidates linked to the vendor's assessments, matched on name, email
+    or phone (prefix and typo tolerant on Postgres), best match first.
+    """
+
+    query = _search_query(q)
+    rows = await crud.search_candidates(database, current_vendor.id, query, limit=limit + 1, offset=offset)
+    next_offset = _next_offset(rows, limit, offset)
+
+    return schemas.CandidateSearchOut.model_construct(
+        ok=True,
+        query=query,
+        results=[
+            schemas.CandidateSearchHit.model_construct(
+                id=c.id,
+                candidate_uuid=c.candidate_uuid,
+                name=c.name,
+                email=c.email,
+                phone=c.phone,
+                resume_path=c.resume_path,
+                score=round(float(score), 4),
+            )
+            for c, score in rows
+        ],
+        next_offset=next_offset,
+    )
+
+
+@router.get("/search/assessments", response_model=schemas.AssessmentSearchOut, response_model_exclude_unset=True)
+async def search_assessments(
+    q: str = Query(..., max_length=200),
+    limit: int = Query(crud.DEFAULT_SEARCH_LIMIT, ge=1, le=crud.MAX_SEARCH_LIMIT),
+    offset: int = Query(0, ge=0, le=crud.MAX_SEARCH_OFFSET),
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    The vendor's assessments matched on title, description or skills,
+    best match first.
+    """
+
+    query = _search_query(q)
+    rows = await crud.search_assessments(database, current_vendor.id, query, limit=limit + 1, offset=offset)
+    next_offset = _next_offset(rows, limit, offset)
+
+    return schemas.AssessmentSearchOut.model_construct(
+        ok=True,
+        query=query,
+        results=[
+            schemas.AssessmentSearchHit.model_construct(
+                assessment_id=a.assessment_id,
+                title=a.title,
+                skills=a.skills,
+                status=a.status,
+                candidates_count=a.candidates_total,
+                score=round(float(score), 4),
+            )
+            for a, score in rows
+        ],
+        next_offset=next_offset,
+    )
+
+
+# ────────────────────────────────────────────────────────────
+# ✅ Match Assessments by Required Skills
+# ────────────────────────────────────────────────────────────
+
+@router.get("/assessments/match", response_model=schemas.AssessmentMatchOut)
+async def match_assessments(
+    skills: List[str] = Query(..., description="skill names, comma-separated and/or repeated"),
+    status: Optional[str] = Query(None, description="only assessments in this status, e.g. open"),
+    require_all: bool = Query(False, description="only assessments needing every listed skill"),
+    limit: int = Query(crud.DEFAULT_SEARCH_LIMIT, ge=1, le=crud.MAX_SEARCH_LIMIT),
+    offset: int = Query(0, ge=0, le=crud.MAX_SEARCH_OFFSET),
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    The vendor's assessments that need any of the given skills, ranked by
+    how many of them they need, then by Jaccard similarity of the skill sets.
+    Skills are normalized as on create (case, aliases such as k8s).
+    """
+
+    names = crud.parse_skills(",".join(skills))
+    if not names:
+        raise HTTPException(status_code=400, detail="No skills given")
+    if len(names) > crud.MAX_MATCH_SKILLS:
+        raise HTTPException(status_code=400, detail=f"At most {crud.MAX_MATCH_SKILLS} skills per query")
+
+    known = await crud.get_skill_ids(database, names)
+    rows = await crud.match_assessments(
+        database,
+        names,
+        vendor_id=current_vendor.id,
+        status=status.strip().lower() if status and status.strip() else None,
+        min_overlap=len(names) if require_all else 1,
+        limit=limit + 1,
+        offset=offset,
+    )
+    next_offset = _next_offset(rows, limit, offset)
+
+    return schemas.AssessmentMatchOut.model_construct(
+        ok=True,
+        skills=names,
+        unknown_skills=[name for name in names if name not in known],
+        results=[
+            schemas.AssessmentMatchHit.model_construct(
+                assessment_id=a.assessment_id,
+                title=a.title,
+                skills=a.skills,
+                status=a.status,
+                candidates_count=a.candidates_total,
+                matched_skills=overlap,
+                score=round(score, 4),
+            )
+            for a, overlap, score in rows
+        ],
+        next_offset=next_offset,
+    )
+
+
 # ────────────────────────────────────────────────────────────
 # ✅ Create New Assessment with Safe Skill & Duration Parsing
 # ────────────────────────────────────────────────────────────
 
 @router.post("/create-assessment")
-def create_assessment(
+async def create_assessment(
     payload: dict = Body(...),
     current_vendor: models.Vendor = Depends(get_current_vendor),
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
     Create a new assessment for authenticated vendor.
@@ -174,8 +652,10 @@ def create_assessment(
         assessment.required_candidates = required_candidates
 
     database.add(assessment)
-    database.commit()
-    database.refresh(assessment)
+    await database.flush()
+    await crud.set_assessment_skills(database, assessment.assessment_id, skills)
+    await database.commit()
+    await database.refresh(assessment)
 
     return {
         "ok": True,
@@ -199,10 +679,10 @@ def create_assessment(
 # ────────────────────────────────────────────────────────────
 
 @router.post("/logout")
-def logout_vendor(
+async def logout_vendor(
     request: Request,
     response: Response,
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
     Logout and clear vendor session + cookie.
@@ -214,13 +694,11 @@ def logout_vendor(
 
     if token:
         try:
-            session_row = database.query(models.SessionToken).filter_by(token=token).first()
-            if session_row:
-                database.delete(session_row)
-                database.commit()
-        except Exception as e:
-            print("❌ Logout Error:", e)
-            database.rollback()
+            await auth.remove_token(database, token)
+        except Exception:
+            # the cookie is gone either way; don't fail the logout
+            logger.exception("removing session on logout failed")
+            await database.rollback()
 
     return {"ok": True, "detail": "Logged out successfully"}
 
@@ -229,12 +707,16 @@ def logout_vendor(
 # ✅ Add or Link Candidate to Vendor Assessment
 # ────────────────────────────────────────────────────────────
 
-@router.post("/assessment/{assessment_id}/add-candidate")
-def add_candidate_to_assessment(
+@router.post(
+    "/assessment/{assessment_id}/add-candidate",
+    response_model=schemas.AddCandidateOut,
+    response_model_exclude_unset=True,
+)
+async def add_candidate_to_assessment(
     assessment_id: str,
     payload: dict = Body(...),
     current_vendor: models.Vendor = Depends(get_current_vendor),
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
     Add or reuse a candidate and link to vendor's assessment.
@@ -248,111 +730,235 @@ def add_candidate_to_assessment(
     if not name or not email:
         raise HTTPException(status_code=400, detail="Name and email are required")
 
-    # Validate UUID format
-    try:
-        aid = UUIDClass(assessment_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid assessment ID format")
-
     # Verify vendor owns assessment
-    assessment = database.query(models.Assessment).filter_by(
-        assessment_id=aid,
-        vendor_id=current_vendor.id
-    ).first()
+    assessment = await _get_owned_assessment(database, assessment_id, current_vendor.id)
 
-    if not assessment:
-        raise HTTPException(status_code=404, detail="Assessment not found or unauthorized")
+    # ✅ Create or update candidate and link it (one transaction)
+    candidate, _ = await crud.add_candidate_to_assessment(
+        database,
+        assessment.assessment_id,
+        name,
+        email,
+        phone=phone,
+        resume_path=resume_url
+    )
 
-    # ✅ Create or update candidate
-    candidate = crud.get_candidate_by_email(database, email)
+    return schemas.AddCandidateOut.model_construct(
+        ok=True,
+        candidate=schemas.CandidateOut.model_construct(
+            id=candidate.id,
+            candidate_uuid=candidate.candidate_uuid,
+            name=candidate.name,
+            email=candidate.email,
+            phone=candidate.phone,
+            resume_path=candidate.resume_path,
+        ),
+    )
 
-    if not candidate:
-        candidate = crud.create_candidate(database, name, email, phone=phone, resume_path=resume_url)
-    else:
-        if phone:
-            candidate.phone = phone
-        if resume_url:
-            candidate.resume_path = resume_url
 
-        database.add(candidate)
-        database.commit()
-        database.refresh(candidate)
+# ────────────────────────────────────────────────────────────
+# ✅ Bulk Import Candidates (CSV upload or JSON array)
+# ────────────────────────────────────────────────────────────
+
+MAX_IMPORT_ROWS = 50_000
 
-    # ✅ Link candidate
-    crud.link_candidate_to_assessment(
-        database,
-        str(assessment.assessment_id),
-        candidate_uuid=str(candidate.candidate_uuid)
+
+def _parse_candidate_csv(raw: bytes) -> list:
+    text_body = raw.decode("utf-8-sig")
+    reader = csv.DictReader(io.StringIO(text_body))
+    return [
+        {(k or "").strip().lower(): v for k, v in row.items()}
+        for row in reader
+    ]
+
+
+@router.post("/assessment/{assessment_id}/import-candidates")
+async def import_candidates(
+    assessment_id: str,
+    request: Request,
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    Upsert many candidates by email and link them all to a vendor-owned
+    assessment in one transaction.
+
+    Accepts a multipart upload (field "file") or a text/csv body with a
+    name,email,phone,resume_url header row, or a JSON array of objects
+    (optionally wrapped as {"candidates": [...]}). Returns per-row results.
+    """
+
+    content_type = (request.headers.get("content-type") or "").lower()
+    try:
+        if content_type.startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or not hasattr(upload, "read"):
+                raise HTTPException(status_code=400, detail="Missing CSV file field 'file'")
+            rows = _parse_candidate_csv(await upload.read())
+        elif "csv" in content_type:
+            rows = _parse_candidate_csv(await request.body())
+        else:
+            body = await request.json()
+            rows = body.get("candidates") if isinstance(body, dict) else body
+    except (UnicodeDecodeError, ValueError, csv.Error):
+        raise HTTPException(status_code=400, detail="Could not parse import body")
+
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise HTTPException(status_code=400, detail="Expected a list of candidate objects")
+    if not rows:
+        raise HTTPException(status_code=400, detail="No candidates to import")
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_IMPORT_ROWS} rows per import")
+
+    assessment = await _get_owned_assessment(database, assessment_id, current_vendor.id)
+
+    results = await crud.import_candidates_to_assessment(
+        database, assessment.assessment_id, rows
     )
 
-    return {
-        "ok": True,
-        "candidate": {
-            "id": candidate.id,
-            "candidate_uuid": str(candidate.candidate_uuid),
-            "name": candidate.name,
-            "email": candidate.email,
-            "phone": candidate.phone,
-            "resume_path": candidate.resume_path
-        }
+    summary = {
+        "total": len(results),
+        "created": sum(1 for r in results if r["status"] == "created"),
+        "updated": sum(1 for r in results if r["status"] == "updated"),
+        "duplicates": sum(1 for r in results if r["status"] == "duplicate"),
+        "errors": sum(1 for r in results if r["status"] == "error"),
+        "linked": sum(1 for r in results if r["linked"]),
     }
 
+    return {"ok": True, "summary": summary, "results": results}
+
 
 # ────────────────────────────────────────────────────────────
 # ✅ Get a Single Assessment with Candidates
 # ────────────────────────────────────────────────────────────
 
-@router.get("/assessment/{assessment_id}")
-def get_assessment(
+@router.get(
+    "/assessment/{assessment_id}",
+    response_model=schemas.AssessmentDetailOut,
+    response_model_exclude_unset=True,
+)
+async def get_assessment(
     assessment_id: str,
-    database: Session = Depends(db.get_db)
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=crud.MAX_CANDIDATE_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    include: Optional[str] = Query(None),
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
     Get one assessment and its linked candidates.
+
+    Passing limit/cursor/status switches the candidate list to keyset
+    pagination and adds next_cursor to the response.
+
+    fields / include select a sparse fieldset as on /vendor/dashboard;
+    without candidate fields the candidate list is neither loaded nor
+    returned.
+
+    Sends an ETag; a matching If-None-Match gets 304 after a single
+    version lookup.
     """
 
-    assessment = None
     try:
         aid = UUIDClass(assessment_id)
-        assessment = database.query(models.Assessment).filter_by(assessment_id=aid).first()
     except ValueError:
-        assessment = database.query(models.Assessment).filter_by(assessment_id=assessment_id).first()
+        raise HTTPException(status_code=404, detail="Assessment not found")
 
-    if not assessment:
+    selection = _field_selection(fields, include, ASSESSMENT_DETAIL_FIELDS)
+    candidate_fields = selection.candidate_fields
+
+    version = await crud.get_assessment_version(database, aid)
+    if version is None:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
-    candidates = []
+    etag = _etag("assessment", str(aid), version, sorted(request.query_params.multi_items()))
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    response.headers.update(_cache_headers(etag))
 
-    for ac_rel in assessment.candidates or []:
-        cand = getattr(ac_rel, "candidate", None)
-        if not cand:
-            continue
+    paginated = limit is not None or cursor is not None or status is not None
+    next_cursor = None
 
-        candidates.append({
-            "id": cand.id,
-            "candidate_uuid": str(cand.candidate_uuid),
-            "name": cand.name,
-            "email": cand.email,
-            "phone": cand.phone,
-            "resume_path": cand.resume_path,
-            "status": ac_rel.status
-        })
+    status_filter = _status_filter(status) if paginated else None
 
-    return {
+    if paginated or candidate_fields is None:
+        assessment = await crud.get_assessment_by_identifier(database, assessment_id, selection.columns)
+    else:
+        assessment = await crud.get_assessment_with_links(
+            database, aid, columns=selection.columns, candidate_columns=selection.candidate_columns
+        )
+
+    if not assessment:
+        raise HTTPException(status_code=404, detail="Assessment not found")
+
+    body = {
         "ok": True,
-        "assessment": {
-            "assessment_id": str(assessment.assessment_id),
-            "title": assessment.title,
-            "description": assessment.description,
-            "skills": assessment.skills,
-            "duration": assessment.duration,
-            "work_experience": assessment.work_experience,
-            "vendor_id": assessment.vendor_id,
-            "required_candidates": assessment.required_candidates,
-            "candidates_count": len(candidates)
-        },
-        "candidates": candidates
+        "assessment": schemas.AssessmentOut.model_construct(
+            **_assessment_values(assessment, selection.fields, status_filter)
+        ),
     }
+    if candidate_fields is None:
+        return schemas.AssessmentDetailOut.model_construct(**body)
+
+    if paginated:
+        try:
+            rows, next_cursor = await crud.list_assessment_candidates(
+                database, assessment.assessment_id, limit, cursor, status_filter, selection.candidate_columns
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    else:
+        rows = assessment.candidates or []
+
+    body["candidates"] = [_candidate_out(ac_rel, candidate_fields) for ac_rel in rows if ac_rel.candidate]
+    if paginated:
+        body["next_cursor"] = next_cursor
+    return schemas.AssessmentDetailOut.model_construct(**body)
+
+
+# ────────────────────────────────────────────────────────────
+# ✅ Page Through an Assessment's Candidates (keyset cursor)
+# ────────────────────────────────────────────────────────────
+
+@router.get(
+    "/assessment/{assessment_id}/candidates",
+    response_model=schemas.CandidatePageOut,
+    response_model_exclude_unset=True,
+)
+async def list_assessment_candidates(
+    assessment_id: str,
+    limit: int = Query(crud.DEFAULT_CANDIDATE_PAGE_SIZE, ge=1, le=crud.MAX_CANDIDATE_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    One page of candidates linked to a vendor-owned assessment, ordered by
+    invited date. Pass the returned next_cursor to fetch the following page.
+    """
+
+    assessment = await _get_owned_assessment(database, assessment_id, current_vendor.id)
+
+    status_filter = _status_filter(status)
+
+    try:
+        rows, next_cursor = await crud.list_assessment_candidates(
+            database, assessment.assessment_id, limit, cursor, status_filter
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return schemas.CandidatePageOut.model_construct(
+        ok=True,
+        candidates=[_candidate_out(ac_rel) for ac_rel in rows if ac_rel.candidate],
+        next_cursor=next_cursor,
+    )
 
 
 # ────────────────────────────────────────────────────────────
@@ -360,44 +966,240 @@ def get_assessment(
 # ────────────────────────────────────────────────────────────
 
 @router.post("/assessment/{assessment_id}/candidate/{candidate_uuid}/status")
-def update_candidate_status(
+async def update_candidate_status(
     assessment_id: str,
     candidate_uuid: str,
     payload: dict = Body(...),
     current_vendor: models.Vendor = Depends(get_current_vendor),
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
     Update status of a candidate linked to vendor assessment.
     """
 
-    allowed = {"invited", "interviewed", "shortlisted", "rejected"}
-    raw = (payload.get("status") or "").strip().lower()
+    new_status = _normalize_status(payload.get("status"))
 
-    new_status = "interviewed" if raw == "interview" else raw
+    if new_status not in CANDIDATE_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Allowed values: {sorted(CANDIDATE_STATUSES)}")
 
-    if new_status not in allowed:
-        raise HTTPException(status_code=400, detail=f"Invalid status. Allowed values: {sorted(allowed)}")
+    try:
+        aid = UUIDClass(assessment_id)
+        cand_uuid = UUIDClass(candidate_uuid)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Candidate not linked to this assessment")
 
-    ac_row = database.query(models.AssessmentCandidate).filter_by(
-        assessment_id=assessment_id,
-        candidate_uuid=candidate_uuid
+    # link + owning vendor in one query (no lazy load of ac_row.assessment)
+    found = (
+        await database.execute(
+            select(models.AssessmentCandidate, models.Assessment.vendor_id)
+            .join(models.Assessment, models.Assessment.assessment_id == models.AssessmentCandidate.assessment_id)
+            .where(
+                models.AssessmentCandidate.assessment_id == aid,
+                models.AssessmentCandidate.candidate_uuid == cand_uuid,
+            )
+            # the counters move the link out of its old status: lock it
+            .with_for_update(of=models.AssessmentCandidate)
+        )
     ).first()
 
-    if not ac_row:
+    if not found:
         raise HTTPException(status_code=404, detail="Candidate not linked to this assessment")
 
-    if ac_row.assessment.vendor_id != current_vendor.id:
+    ac_row, owner_id = found
+    if owner_id != current_vendor.id:
         raise HTTPException(status_code=403, detail="Not permitted")
 
-    ac_row.status = new_status
-    database.add(ac_row)
-    database.commit()
-    database.refresh(ac_row)
+    await crud.set_candidate_status(database, ac_row, new_status)
+    await database.commit()
 
     return {"ok": True, "status": new_status}
 
 
+# ────────────────────────────────────────────────────────────
+# ✅ Batch Update Candidate Statuses
+# ────────────────────────────────────────────────────────────
+
+MAX_STATUS_UPDATES = 1000
+
+
+class CandidateStatusChange(BaseModel):
+    candidate_uuid: str
+    status: Optional[str] = None
+
+
+class CandidateStatusBatchPayload(BaseModel):
+    updates: List[CandidateStatusChange]
+
+
+@router.post("/assessment/{assessment_id}/candidates/status")
+async def update_candidate_statuses(
+    assessment_id: str,
+    payload: CandidateStatusBatchPayload,
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    Update the status of many candidates linked to one vendor assessment in
+    a single transaction. Statuses are normalised as in the single-candidate
+    endpoint; bad or unknown items are reported per item instead of failing
+    the batch. Outcomes: updated, unchanged, not_found, duplicate, error.
+    """
+
+    if not payload.updates:
+        raise HTTPException(status_code=400, detail="No status updates given")
+    if len(payload.updates) > MAX_STATUS_UPDATES:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_STATUS_UPDATES} updates per request")
+
+    assessment = await _get_owned_assessment(database, assessment_id, current_vendor.id)
+
+    results = []
+    changes = {}
+    for item in payload.updates:
+        result = {"candidate_uuid": item.candidate_uuid, "status": _normalize_status(item.status)}
+        results.append(result)
+        try:
+            cand_uuid = UUIDClass(item.candidate_uuid)
+        except ValueError:
+            result.update(outcome="error", detail="Invalid candidate UUID")
+            continue
+        if result["status"] not in CANDIDATE_STATUSES:
+            result.update(outcome="error", detail=f"Invalid status. Allowed values: {sorted(CANDIDATE_STATUSES)}")
+            continue
+        if cand_uuid in changes:
+            result.update(outcome="duplicate", detail="Candidate already updated earlier in this batch")
+            continue
+        result["candidate_uuid"] = str(cand_uuid)
+        result["_uuid"] = cand_uuid
+        changes[cand_uuid] = result["status"]
+
+    try:
+        previous = await crud.set_candidate_statuses(database, assessment.assessment_id, changes)
+        await database.commit()
+    except Exception:
+        await database.rollback()
+        raise
+
+    for result in results:
+        cand_uuid = result.pop("_uuid", None)
+        if cand_uuid is None:
+            continue
+        if cand_uuid not in previous:
+            result.update(outcome="not_found", detail="Candidate not linked to this assessment")
+        else:
+            result["previous_status"] = previous[cand_uuid]
+            result["outcome"] = "unchanged" if previous[cand_uuid] == result["status"] else "updated"
+
+    summary = {
+        "total": len(results),
+        "updated": sum(1 for r in results if r["outcome"] == "updated"),
+        "unchanged": sum(1 for r in results if r["outcome"] == "unchanged"),
+        "not_found": sum(1 for r in results if r["outcome"] == "not_found"),
+        "duplicates": sum(1 for r in results if r["outcome"] == "duplicate"),
+        "errors": sum(1 for r in results if r["outcome"] == "error"),
+    }
+
+    return {"ok": True, "summary": summary, "results": results}
+
+
+# ────────────────────────────────────────────────────────────
+# ✅ Export Candidate Pipeline (streamed NDJSON / CSV)
+# ────────────────────────────────────────────────────────────
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+EXPORT_BATCH_SIZE = 1000
+
+
+def _export_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def _stream_pipeline(vendor_id: int, export_format: str, filters: dict):
+    """
+    Async generator behind /vendor/export. It opens its own DB session because the
+    body is produced after the endpoint returns, and flushes output once
+    per EXPORT_BATCH_SIZE rows.
+    """
+    async with db.AsyncSessionLocal() as database:
+        rows = crud.iter_candidate_pipeline(
+            database, vendor_id, batch_size=EXPORT_BATCH_SIZE, **filters
+        )
+        columns = crud.PIPELINE_EXPORT_COLUMNS
+        buf = io.StringIO()
+
+        if export_format == "csv":
+            writer = csv.writer(buf)
+            writer.writerow(columns)
+            i = 0
+            async for row in rows:
+                i += 1
+                writer.writerow([_export_value(v) for v in row])
+                if i % EXPORT_BATCH_SIZE == 0:
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate(0)
+        else:
+            i = 0
+            async for row in rows:
+                i += 1
+                buf.write(json.dumps(dict(zip(columns, map(_export_value, row)))))
+                buf.write("\n")
+                if i % EXPORT_BATCH_SIZE == 0:
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate(0)
+
+        tail = buf.getvalue()
+        if tail:
+            yield tail
+
+
+@router.get("/export")
+async def export_pipeline(
+    format: str = Query("ndjson"),
+    assessment_id: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    invited_from: Optional[datetime] = Query(None),
+    invited_to: Optional[datetime] = Query(None),
+    current_vendor: models.Vendor = Depends(get_current_vendor),
+    database: AsyncSession = Depends(db.get_db)
+):
+    """
+    Stream every candidate linked to the vendor's assessments, one row per
+    assessment link, as NDJSON (default) or CSV.
+    Optional filters: assessment_id, status, invited_from <= invited_date < invited_to.
+    """
+
+    export_format = format.strip().lower()
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format. Allowed values: {sorted(EXPORT_FORMATS)}")
+
+    aid = None
+    if assessment_id:
+        # 404 for another vendor's assessment rather than an empty export
+        aid = (await _get_owned_assessment(database, assessment_id, current_vendor.id)).assessment_id
+
+    filters = {
+        "assessment_id": aid,
+        "status": _status_filter(status),
+        "invited_from": invited_from,
+        "invited_to": invited_to,
+    }
+
+    filename = f"candidates-{datetime.utcnow():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        _stream_pipeline(current_vendor.id, export_format, filters),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # ────────────────────────────────────────────────────────────
 # ✅ Vendor Change Password
 # ────────────────────────────────────────────────────────────
@@ -408,50 +1210,33 @@ class ChangePasswordPayload(BaseModel):
 
 
 @router.post("/change-password")
-def change_password(
+async def change_password(
     payload: ChangePasswordPayload,
+    request: Request,
+    response: Response,
     current_vendor: models.Vendor = Depends(get_current_vendor),
-    database: Session = Depends(db.get_db)
+    database: AsyncSession = Depends(db.get_db)
 ):
     """
-    Change authenticated vendor password securely.
+    Change authenticated vendor password securely. Ends the current
+    session: the vendor logs in again with the new password.
     """
 
-    # ✅ use the already imported auth services module
-    _auth = auth
-
     vendor = current_vendor
 
-    # Find password verification function on app.services
-    verify_fn = next(
-        (getattr(_auth, fn) for fn in ["verify_password", "check_password", "verify_pw"] if hasattr(_auth, fn)),
-        None
-    )
-
-    if not verify_fn:
-        raise HTTPException(
-            status_code=500,
-            detail="Password verification function missing in auth/services module",
-        )
-
-    if not verify_fn(payload.old_password, vendor.password_hash):
+    # hashing is CPU-bound; both calls run in the password process pool
+    ok, _ = await auth.verify_and_update_async(payload.old_password, vendor.password_hash)
+    if not ok:
         raise HTTPException(status_code=400, detail="Current password incorrect")
 
-    # Find password hashing function on app.services
-    hash_fn = next(
-        (getattr(_auth, fn) for fn in ["hash_password", "get_password_hash", "generate_password_hash", "create_password_hash"] if hasattr(_auth, fn)),
-        None
-    )
-
-    if not hash_fn:
-        raise HTTPException(
-            status_code=500,
-            detail="Password hashing function missing in auth/services module",
-        )
-
-    vendor.password_hash = hash_fn(payload.new_password)
+    vendor.password_hash = await auth.hash_password_async(payload.new_password)
     database.add(vendor)
-    database.commit()
-    database.refresh(vendor)
+    await database.commit()
+    await database.refresh(vendor)
+
+    await auth.remove_token(database, request.cookies.get("access_token"))
+    response.delete_cookie("access_token")
+    # cached snapshots still carry the old hash
+    auth.principal_cache.invalidate_principal("vendor", vendor.id)
 
     return {"ok": True, "detail": "Password updated successfully"}
@@ -1,8 +1,18 @@
 from .user import UserCreate
 from .vendor import VendorCreate
 from .token import TokenResponse
-from .assessment import AssessmentCreate, AssessmentOut
-from .candidate import CandidateOut
+from .assessment import (
+    AssessmentCreate,
+    AssessmentOut,
+    AssessmentDetailOut,
+    DashboardAssessmentOut,
+    DashboardVendorOut,
+    DashboardOut,
+    AssessmentMatchHit,
+    AssessmentMatchOut,
+)
+from .candidate import CandidateOut, AddCandidateOut, CandidatePageOut
+from .search import CandidateSearchHit, AssessmentSearchHit, CandidateSearchOut, AssessmentSearchOut
 
 __all__ = [
     "UserCreate",
@@ -10,5 +20,17 @@ __all__ = [
     "TokenResponse",
     "AssessmentCreate",
     "AssessmentOut",
+    "AssessmentDetailOut",
+    "DashboardAssessmentOut",
+    "DashboardVendorOut",
+    "DashboardOut",
+    "AssessmentMatchHit",
+    "AssessmentMatchOut",
     "CandidateOut",
+    "AddCandidateOut",
+    "CandidatePageOut",
+    "CandidateSearchHit",
+    "AssessmentSearchHit",
+    "CandidateSearchOut",
+    "AssessmentSearchOut",
 ]
@@ -1,8 +1,11 @@
 # backend/app/schemas/assessment.py
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
 from uuid import UUID
 
+from .candidate import CandidateOut
+
+
 class AssessmentCreate(BaseModel):
     title: str
     description: Optional[str] = None
@@ -11,16 +14,70 @@ class AssessmentCreate(BaseModel):
     work_experience: Optional[str] = None
     required_candidates: int = 0
 
+
 class AssessmentOut(BaseModel):
+    """The "assessment" object of /vendor/assessment/{id}."""
+    model_config = ConfigDict(from_attributes=True)
+
     assessment_id: UUID          # ✅ matches DB + frontend
-    title: str
+    title: Optional[str] = None
     description: Optional[str] = None
-    vendor_id: int
     skills: Optional[str] = None
-    duration: int
+    duration: Optional[int] = None
     work_experience: Optional[str] = None   # ✅ final name
-    required_candidates: int
+    vendor_id: Optional[int] = None
+    required_candidates: Optional[int] = None
     candidates_count: Optional[int] = None  # for the detail view
 
-    class Config:
-        orm_mode = True
+
+class AssessmentDetailOut(BaseModel):
+    ok: bool
+    assessment: AssessmentOut
+    candidates: Optional[List[CandidateOut]] = None
+    next_cursor: Optional[str] = None
+
+
+class DashboardAssessmentOut(BaseModel):
+    """One assessment on /vendor/dashboard (id duplicates assessment_id for the UI)."""
+    id: Optional[UUID] = None
+    assessment_id: UUID
+    title: Optional[str] = None
+    description: Optional[str] = None
+    skills: Optional[str] = None
+    duration: Optional[int] = None
+    work_experience: Optional[str] = None
+    vendor_id: Optional[int] = None
+    status: Optional[str] = None
+    required_candidates: Optional[int] = None
+    candidates_count: Optional[int] = None
+    candidates: Optional[List[CandidateOut]] = None
+    next_cursor: Optional[str] = None
+
+
+class DashboardVendorOut(BaseModel):
+    id: int
+    company_name: str
+    email: str
+
+
+class DashboardOut(BaseModel):
+    vendor: DashboardVendorOut
+    assessments: List[DashboardAssessmentOut]
+
+
+class AssessmentMatchHit(BaseModel):
+    assessment_id: UUID
+    title: str
+    skills: Optional[str] = None
+    status: Optional[str] = None
+    candidates_count: int
+    matched_skills: int  # |A ∩ Q|
+    score: float         # Jaccard |A ∩ Q| / |A ∪ Q|
+
+
+class AssessmentMatchOut(BaseModel):
+    ok: bool
+    skills: List[str]          # the query, normalized
+    unknown_skills: List[str]  # not in the skill vocabulary
+    results: List[AssessmentMatchHit]
+    next_offset: Optional[int] = None
@@ -1,11 +1,31 @@
-from pydantic import BaseModel
-from typing import Optional
+# backend/app/schemas/candidate.py
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from uuid import UUID
+
+# Response fields are optional because ?fields= may select any subset;
+# routes serialize with response_model_exclude_unset, so fields that were
+# not selected are left out rather than sent as null.
+
 
 class CandidateOut(BaseModel):
-    id: int
-    candidate_uuid: Optional[str] = None
-    name: str
-    email: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Optional[int] = None
+    candidate_uuid: Optional[UUID] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    resume_path: Optional[str] = None
+    status: Optional[str] = None  # of the assessment link
+
+
+class AddCandidateOut(BaseModel):
+    ok: bool
+    candidate: CandidateOut
+
 
-    class Config:
-        orm_mode = True
+class CandidatePageOut(BaseModel):
+    ok: bool
+    candidates: List[CandidateOut]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,33 @@
+# backend/app/schemas/search.py
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+
+from .candidate import CandidateOut
+
+
+class CandidateSearchHit(CandidateOut):
+    score: float
+
+
+class AssessmentSearchHit(BaseModel):
+    assessment_id: UUID
+    title: str
+    skills: Optional[str] = None
+    status: Optional[str] = None
+    candidates_count: int
+    score: float
+
+
+class CandidateSearchOut(BaseModel):
+    ok: bool
+    query: str
+    results: List[CandidateSearchHit]
+    next_offset: Optional[int] = None
+
+
+class AssessmentSearchOut(BaseModel):
+    ok: bool
+    query: str
+    results: List[AssessmentSearchHit]
+    next_offset: Optional[int] = None
@@ -3,12 +3,19 @@
 from .password_service import (
     verify_password,
     get_password_hash,
+    verify_and_update,
+    hash_password_async,
+    verify_and_update_async,
+    start_pool as start_password_pool,
+    shutdown_pool as shutdown_password_pool,
+    PasswordHasherBusy,
     pwd_context,
 )
 
 from .token_service import (
     create_access_token,
     decode_token,
+    token_key,
     SECRET_KEY,
     ALGORITHM,
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -18,18 +25,60 @@ from .session_service import (
     persist_token,
     remove_token,
     get_session,
+    session_is_live,
+)
+
+from .session_store import (
+    SessionRecord,
+    SessionStore,
+    get_store as get_session_store,
+    set_store as set_session_store,
+    close_store as close_session_store,
+)
+
+from .session_reaper import (
+    reaper_stats,
+    reap_expired_sessions,
+    start as start_session_reaper,
+    stop as stop_session_reaper,
+)
+
+from .principal_cache import (
+    principal_cache,
+    PrincipalCache,
+    restore as restore_principal,
 )
 
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "verify_and_update",
+    "hash_password_async",
+    "verify_and_update_async",
+    "start_password_pool",
+    "shutdown_password_pool",
+    "PasswordHasherBusy",
     "pwd_context",
     "create_access_token",
     "decode_token",
+    "token_key",
     "SECRET_KEY",
     "ALGORITHM",
     "ACCESS_TOKEN_EXPIRE_MINUTES",
     "persist_token",
     "remove_token",
     "get_session",
+    "session_is_live",
+    "SessionRecord",
+    "SessionStore",
+    "get_session_store",
+    "set_session_store",
+    "close_session_store",
+    "reaper_stats",
+    "reap_expired_sessions",
+    "start_session_reaper",
+    "stop_session_reaper",
+    "principal_cache",
+    "PrincipalCache",
+    "restore_principal",
 ]
@@ -0,0 +1,183 @@
+# backend/app/services/metrics_service.py
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from app import db
+from app.db import instrumentation
+from .principal_cache import principal_cache
+from .session_reaper import reaper_stats
+
+# Dedicated registry so only app metrics are exposed (no default process collectors)
+REGISTRY = CollectorRegistry(auto_describe=True)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100, 250)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by templated route and status code.",
+    ["method", "route", "status"],
+    registry=REGISTRY,
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by templated route.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    ["method"],
+    registry=REGISTRY,
+)
+HTTP_EXCEPTIONS = Counter(
+    "http_request_exceptions_total",
+    "Unhandled exceptions raised while handling a request.",
+    ["method", "route"],
+    registry=REGISTRY,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request.",
+    ["method", "route"],
+    buckets=QUERY_COUNT_BUCKETS,
+    registry=REGISTRY,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "SQL statements executed, by leading keyword.",
+    ["operation"],
+    registry=REGISTRY,
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time.",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    ["engine"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Pool checkouts that gave up after DB_POOL_TIMEOUT.",
+    ["engine"],
+    registry=REGISTRY,
+)
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK"}
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip()[:8].split(None, 1)
+    word = head[0].upper() if head else ""
+    return word if word in _OPERATIONS else "OTHER"
+
+
+def _on_statement(statement: str, seconds: float):
+    op = _operation(statement)
+    DB_QUERIES.labels(op).inc()
+    DB_QUERY_SECONDS.labels(op).observe(seconds)
+
+
+def _pool_listener(engine_name: str):
+    def listener(waited: float, timed_out: bool):
+        if timed_out:
+            DB_POOL_TIMEOUTS.labels(engine_name).inc()
+        else:
+            DB_POOL_CHECKOUT_WAIT.labels(engine_name).observe(waited)
+    return listener
+
+
+class _StateCollector:
+    """Read at scrape time: pool occupancy, principal cache and session reaper counters."""
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        pool = GaugeMetricFamily(
+            "db_pool_connections",
+            "Pooled connections by state.",
+            labels=["engine", "state"],
+        )
+        for engine_name, status in db.db_pool_status().items():
+            for state in ("checked_out", "checked_in", "overflow", "size"):
+                if state in status:
+                    pool.add_metric([engine_name, state], status[state])
+        yield pool
+
+        cache = principal_cache.stats()
+        family = GaugeMetricFamily(
+            "principal_cache",
+            "Authenticated-principal cache counters.",
+            labels=["stat"],
+        )
+        for stat in ("size", "hits", "misses", "evictions"):
+            family.add_metric([stat], cache[stat])
+        yield family
+
+        reaper = reaper_stats.snapshot()
+        yield CounterMetricFamily("session_reaper_deleted", "Expired sessions deleted by the reaper.", value=reaper["deleted_total"])
+        yield CounterMetricFamily("session_reaper_runs", "Completed session reaper runs.", value=reaper["runs"])
+        yield CounterMetricFamily("session_reaper_errors", "Failed session reaper runs.", value=reaper["errors"])
+        yield GaugeMetricFamily("session_reaper_last_deleted", "Sessions deleted by the last reaper run.", value=reaper["last_deleted"])
+        yield GaugeMetricFamily(
+            "session_reaper_last_duration_seconds", "Duration of the last reaper run.", value=reaper["last_duration_s"]
+        )
+        if reaper["last_run_at"] is not None:
+            yield GaugeMetricFamily(
+                "session_reaper_last_run_timestamp_seconds", "Unix time the last reaper run finished.", value=reaper["last_run_at"]
+            )
+        if reaper["table_rows"] is not None:
+            yield GaugeMetricFamily(
+                "sessions_table_rows", "Rows in the sessions table (estimate on Postgres), as of the last reaper run.",
+                value=reaper["table_rows"],
+            )
+
+
+def install():
+    """
+    Wire SQLAlchemy engine events and pool listeners into the registry.
+    Called once at app start-up.
+    """
+    instrumentation.instrument_engine(db.async_engine.sync_engine)
+    instrumentation.instrument_engine(db.engine)
+    if _on_statement not in instrumentation.statement_listeners:
+        instrumentation.statement_listeners.append(_on_statement)
+        db.async_pool_stats.listeners.append(_pool_listener("async"))
+        db.sync_pool_stats.listeners.append(_pool_listener("sync"))
+        REGISTRY.register(_StateCollector())
+
+
+def observe_request(method: str, route: str, status_code: int, seconds: float, stats):
+    HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+    HTTP_LATENCY.labels(method, route).observe(seconds)
+    REQUEST_DB_QUERIES.labels(method, route).observe(stats.count)
+    REQUEST_DB_SECONDS.labels(method, route).observe(stats.seconds)
+
+
+def render():
+    """Prometheus text exposition: (body, content type)."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
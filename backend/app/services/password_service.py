@@ -1,8 +1,35 @@
 # backend/app/services/password_service.py
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
-# Use pbkdf2_sha256 (no bcrypt dependency) — good for dev and secure
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# PBKDF2 work factor. Hashes made with different rounds still verify and are
+# transparently rehashed on the next successful login (verify_and_update).
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "29000"))
+# Worker processes for hashing; 0 runs it on threads instead (dev/tests).
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+# Hash/verify calls allowed in flight (running + queued) before callers wait,
+# and how long they wait for a slot before PasswordHasherBusy.
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(max(PASSWORD_HASH_WORKERS, 1) * 4)))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "2"))
+
+# Use pbkdf2_sha256 (no bcrypt dependency) — good for dev and secure.
+# min == max == default so any other rounds count flags needs_update.
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=PASSWORD_HASH_ROUNDS,
+)
+
+
+class PasswordHasherBusy(Exception):
+    """No hashing slot freed up within PASSWORD_HASH_QUEUE_TIMEOUT (maps to 503)."""
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -11,3 +38,68 @@ def verify_password(plain: str, hashed: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def verify_and_update(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """(matches, replacement hash if the stored one uses outdated settings)."""
+    return pwd_context.verify_and_update(plain, hashed)
+
+
+# ────────────────────────────────────────────────────────────
+# Bounded process pool
+# ────────────────────────────────────────────────────────────
+# PBKDF2 is pure CPU. Running it in request threads lets a login storm fill
+# the threadpool and slow every other route; separate processes keep it off
+# the API process's cores and GIL, and the slot semaphore caps the backlog.
+
+_executor: Optional[ProcessPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+
+def start_pool():
+    """Start the worker processes (from the app lifespan). Safe to call twice."""
+    global _executor
+    if _executor is None and PASSWORD_HASH_WORKERS > 0:
+        # spawn: forking a process that runs an event loop and DB pools is unsafe
+        _executor = ProcessPoolExecutor(
+            max_workers=PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        # spawn (and import in) the workers now rather than on the first login
+        for _ in range(PASSWORD_HASH_WORKERS):
+            _executor.submit(os.getpid)
+
+
+def shutdown_pool():
+    global _executor, _slots
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _slots = None
+
+
+async def _run(fn, *args):
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(PASSWORD_HASH_MAX_PENDING)
+    slots = _slots
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=PASSWORD_HASH_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise PasswordHasherBusy()
+    try:
+        if PASSWORD_HASH_WORKERS <= 0:
+            return await asyncio.to_thread(fn, *args)
+        if _executor is None:
+            start_pool()
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+    finally:
+        slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(get_password_hash, password)
+
+
+async def verify_and_update_async(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return await _run(verify_and_update, plain, hashed)
@@ -0,0 +1,132 @@
+# backend/app/services/principal_cache.py
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+# Bounded in-process cache of verified access token -> principal row.
+# Entries live for at most PRINCIPAL_CACHE_TTL_SECONDS (and never past the
+# token's own exp), so a logout handled by another worker is picked up
+# within one TTL. Set PRINCIPAL_CACHE_SIZE=0 to disable.
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+
+
+class PrincipalCache:
+    """
+    Thread-safe TTL + LRU map: token -> (kind, principal_id, column values).
+
+    Only plain column values are stored, never ORM instances, so cached
+    entries are safe to share between requests and sessions; restore()
+    rebuilds a session-bound instance without issuing SQL.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str, kind: str):
+        """
+        Returns the cached column values for token if it belongs to a
+        principal of this kind ("vendor" / "user") and has not expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, entry_kind, _, attrs = entry
+            if expires_at <= now:
+                del self._entries[token]
+                self.misses += 1
+                return None
+            if entry_kind != kind:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return attrs
+
+    def put(self, token: str, kind: str, principal, token_exp=None):
+        """
+        Cache principal (an ORM instance) for token. token_exp is the JWT
+        "exp" claim (unix seconds) and caps the entry lifetime.
+        """
+        if self.maxsize <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if token_exp is not None:
+            expires_at = min(expires_at, float(token_exp))
+
+        attrs = snapshot(principal)
+        principal_id = inspect(principal).identity
+        with self._lock:
+            self._entries[token] = (expires_at, kind, principal_id, attrs)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, token: str):
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def invalidate_principal(self, kind: str, principal_id):
+        """
+        Drop every cached token of one principal (e.g. after a password change).
+        """
+        identity = (principal_id,)
+        with self._lock:
+            stale = [
+                token for token, (_, entry_kind, entry_id, _) in self._entries.items()
+                if entry_kind == kind and entry_id == identity
+            ]
+            for token in stale:
+                del self._entries[token]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def snapshot(obj) -> dict:
+    """Column values of a loaded ORM instance."""
+    mapper = inspect(obj).mapper
+    return {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+
+
+async def restore(db: AsyncSession, model, attrs: dict):
+    """
+    Rebuild a persistent instance of model from snapshot() values and attach
+    it to db without a SELECT.
+    """
+    obj = model(**attrs)
+    make_transient_to_detached(obj)
+    return await db.merge(obj, load=False)
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS)
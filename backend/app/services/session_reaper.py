@@ -0,0 +1,163 @@
+# backend/app/services/session_reaper.py
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, func, or_, select, text
+
+from .. import models
+from app import db
+from .session_store import get_store
+from .token_service import ACCESS_TOKEN_EXPIRE_MINUTES
+
+logger = logging.getLogger("app.session_reaper")
+
+# Background deletion of expired sessions, started from the app lifespan.
+# Rows go in batches of SESSION_REAPER_BATCH_SIZE, each in its own short
+# transaction, with SESSION_REAPER_BATCH_PAUSE seconds between batches so
+# the reaper never holds locks for long or saturates the DB. Several
+# workers may run it at once: batches skip rows another reaper has locked.
+# Only runs with SESSION_STORE=sql; the memory and redis stores expire
+# sessions themselves.
+SESSION_REAPER_ENABLED = os.getenv("SESSION_REAPER_ENABLED", "true").strip().lower() in ("1", "true", "yes", "on")
+SESSION_REAPER_INTERVAL_SECONDS = float(os.getenv("SESSION_REAPER_INTERVAL_SECONDS", "300"))
+SESSION_REAPER_BATCH_SIZE = int(os.getenv("SESSION_REAPER_BATCH_SIZE", "1000"))
+SESSION_REAPER_BATCH_PAUSE = float(os.getenv("SESSION_REAPER_BATCH_PAUSE", "0.05"))
+# Legacy rows without expires_at are removed once older than a token lifetime.
+LEGACY_SESSION_MAX_AGE = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
+class ReaperStats:
+    """Progress counters, read by the metrics collector and /internal/stats."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.errors = 0
+        self.deleted_total = 0
+        self.last_deleted = 0
+        self.last_run_at = None
+        self.last_duration = 0.0
+        self.table_rows = None
+
+    def record_run(self, deleted: int, duration: float, table_rows):
+        with self._lock:
+            self.runs += 1
+            self.deleted_total += deleted
+            self.last_deleted = deleted
+            self.last_run_at = time.time()
+            self.last_duration = duration
+            self.table_rows = table_rows
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "errors": self.errors,
+                "deleted_total": self.deleted_total,
+                "last_deleted": self.last_deleted,
+                "last_run_at": self.last_run_at,
+                "last_duration_s": round(self.last_duration, 3),
+                "table_rows": self.table_rows,
+            }
+
+
+reaper_stats = ReaperStats()
+_task: asyncio.Task | None = None
+
+
+def _expired(now: datetime):
+    S = models.SessionToken
+    return or_(
+        S.expires_at < now,
+        and_(S.expires_at.is_(None), S.created_at < now - LEGACY_SESSION_MAX_AGE),
+    )
+
+
+async def delete_expired_batch(batch_size: int = SESSION_REAPER_BATCH_SIZE) -> int:
+    """Delete up to batch_size expired sessions in one short transaction."""
+    S = models.SessionToken
+    victims = (
+        select(S.id)
+        .where(_expired(datetime.utcnow()))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)  # no-op on SQLite
+    )
+    async with db.AsyncSessionLocal() as session:
+        result = await session.execute(
+            delete(S).where(S.id.in_(victims)).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount or 0
+
+
+async def sessions_table_rows():
+    """Row count of sessions: the planner estimate on Postgres (no full scan)."""
+    async with db.AsyncSessionLocal() as session:
+        if session.bind.dialect.name == "postgresql":
+            estimate = (
+                await session.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'sessions'"))
+            ).scalar()
+            # -1 until the table has been vacuumed/analyzed once
+            if estimate is not None and estimate >= 0:
+                return estimate
+        return (await session.execute(select(func.count()).select_from(models.SessionToken))).scalar()
+
+
+async def reap_expired_sessions(
+    batch_size: int = SESSION_REAPER_BATCH_SIZE,
+    pause: float = SESSION_REAPER_BATCH_PAUSE,
+) -> int:
+    """Delete every expired session, batch by batch. Returns the number deleted."""
+    start = time.perf_counter()
+    deleted = 0
+    while True:
+        count = await delete_expired_batch(batch_size)
+        deleted += count
+        if count < batch_size:
+            break
+        await asyncio.sleep(pause)
+    reaper_stats.record_run(deleted, time.perf_counter() - start, await sessions_table_rows())
+    if deleted:
+        logger.info("deleted %d expired sessions in %.2fs", deleted, time.perf_counter() - start)
+    return deleted
+
+
+async def _loop():
+    # spread the first run of several workers instead of all reaping at boot
+    await asyncio.sleep(random.uniform(0, min(SESSION_REAPER_INTERVAL_SECONDS, 60)))
+    while True:
+        try:
+            await reap_expired_sessions()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            reaper_stats.record_error()
+            logger.exception("session reaper run failed")
+        await asyncio.sleep(SESSION_REAPER_INTERVAL_SECONDS)
+
+
+def start():
+    """Start the reaper task on the running loop (from the app lifespan)."""
+    global _task
+    if SESSION_REAPER_ENABLED and _task is None and get_store().reaped:
+        _task = asyncio.get_running_loop().create_task(_loop(), name="session-reaper")
+
+
+async def stop():
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
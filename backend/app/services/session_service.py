@@ -1,37 +1,34 @@
 # backend/app/services/session_service.py
-from sqlalchemy.orm import Session
-from .. import models  # app.models
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from .principal_cache import principal_cache
+from .session_store import SessionRecord, get_store, session_is_live  # noqa: F401 (re-exported)
+from .token_service import token_key
 
-def persist_token(
-    db: Session,
+
+async def persist_token(
+    db: AsyncSession,
     token: str,
     user_id: int | None = None,
     vendor_id: int | None = None,
     expires_at=None,
 ):
-    session = models.SessionToken(
-        token=token,
+    # sessions are keyed by token_key(); the JWT itself is never stored
+    record = SessionRecord(
+        key=token_key(token),
         user_id=user_id,
         vendor_id=vendor_id,
         expires_at=expires_at,
     )
-    db.add(session)
-    db.commit()
-    db.refresh(session)
-    return session
+    return await get_store().save(db, record)
 
 
-def remove_token(db: Session, token: str):
-    db.query(models.SessionToken).filter(
-        models.SessionToken.token == token
-    ).delete()
-    db.commit()
+async def remove_token(db: AsyncSession, token: str):
+    # drop the cached principal first so logout sticks even if the delete fails
+    principal_cache.invalidate(token)
+    await get_store().delete(db, token_key(token))
 
 
-def get_session(db: Session, token: str):
-    return (
-        db.query(models.SessionToken)
-        .filter(models.SessionToken.token == token)
-        .first()
-    )
+async def get_session(db: AsyncSession, token: str, claims: dict | None = None):
+    """Live session for token; pass claims if the token was already decoded."""
+    return await get_store().get(db, token_key(token, claims))
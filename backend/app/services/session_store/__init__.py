@@ -0,0 +1,64 @@
+# backend/app/services/session_store/__init__.py
+import os
+
+from .base import SessionRecord, SessionStore
+from .memory_store import MemorySessionStore
+from .redis_store import RedisSessionStore
+from .sql_store import SqlSessionStore, session_is_live
+
+# Which backend holds server-side sessions:
+#   SESSION_STORE=sql     the sessions table (default; expired rows removed
+#                         by the session reaper)
+#   SESSION_STORE=memory  in-process LRU, single worker only; at most
+#                         SESSION_STORE_MEMORY_SIZE sessions
+#   SESSION_STORE=redis   Redis-protocol server at SESSION_REDIS_URL, keys
+#                         prefixed with SESSION_REDIS_PREFIX
+SESSION_STORE = os.getenv("SESSION_STORE", "sql").strip().lower()
+SESSION_STORE_MEMORY_SIZE = int(os.getenv("SESSION_STORE_MEMORY_SIZE", "100000"))
+SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL", "redis://localhost:6379/0")
+SESSION_REDIS_PREFIX = os.getenv("SESSION_REDIS_PREFIX", "session:")
+
+_store: SessionStore | None = None
+
+
+def make_store(backend: str) -> SessionStore:
+    if backend == "sql":
+        return SqlSessionStore()
+    if backend == "memory":
+        return MemorySessionStore(SESSION_STORE_MEMORY_SIZE)
+    if backend == "redis":
+        return RedisSessionStore(SESSION_REDIS_URL, prefix=SESSION_REDIS_PREFIX)
+    raise ValueError(f"Unknown SESSION_STORE {backend!r} (expected sql, memory or redis)")
+
+
+def get_store() -> SessionStore:
+    """The configured store, created on first use."""
+    global _store
+    if _store is None:
+        _store = make_store(SESSION_STORE)
+    return _store
+
+
+def set_store(store: SessionStore | None):
+    """Swap the store (benchmarks, tests); None goes back to SESSION_STORE."""
+    global _store
+    _store = store
+
+
+async def close_store():
+    if _store is not None:
+        await _store.close()
+
+
+__all__ = [
+    "SessionRecord",
+    "SessionStore",
+    "SqlSessionStore",
+    "MemorySessionStore",
+    "RedisSessionStore",
+    "session_is_live",
+    "make_store",
+    "get_store",
+    "set_store",
+    "close_store",
+]
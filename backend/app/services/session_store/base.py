@@ -0,0 +1,96 @@
+# backend/app/services/session_store/base.py
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..token_service import ACCESS_TOKEN_EXPIRE_MINUTES
+
+# Lifetime given to sessions saved without expires_at by the stores that
+# expire entries themselves (memory, redis): one token lifetime.
+DEFAULT_SESSION_TTL = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
+class SessionRecord:
+    """
+    One server-side session. key is token_key() of the JWT; expires_at is
+    naive UTC like everywhere else in token_service / the sessions table.
+    """
+
+    __slots__ = ("key", "user_id", "vendor_id", "expires_at", "created_at")
+
+    def __init__(
+        self,
+        key: str,
+        user_id: int | None = None,
+        vendor_id: int | None = None,
+        expires_at: datetime | None = None,
+        created_at: datetime | None = None,
+    ):
+        self.key = key
+        self.user_id = user_id
+        self.vendor_id = vendor_id
+        self.expires_at = expires_at
+        self.created_at = created_at or datetime.utcnow()
+
+    def is_live(self, now: datetime | None = None) -> bool:
+        return self.expires_at is None or self.expires_at > (now or datetime.utcnow())
+
+    def deadline(self) -> datetime:
+        """When a store with native expiry should drop the record."""
+        return self.expires_at or self.created_at + DEFAULT_SESSION_TTL
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "user_id": self.user_id,
+            "vendor_id": self.vendor_id,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionRecord":
+        return cls(
+            key=data["key"],
+            user_id=data.get("user_id"),
+            vendor_id=data.get("vendor_id"),
+            expires_at=datetime.fromisoformat(data["expires_at"]) if data.get("expires_at") else None,
+            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, SessionRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"SessionRecord(key={self.key!r}, user_id={self.user_id}, vendor_id={self.vendor_id}, expires_at={self.expires_at})"
+
+
+class SessionStore:
+    """
+    Where sessions live. Every method takes the request's AsyncSession: the
+    SQL store writes through it, the others ignore it.
+
+    get() returns only live sessions. delete() of an unknown key is a no-op.
+    reaped tells whether expired entries pile up until the background reaper
+    removes them (SQL) or the backend drops them by itself (memory, redis).
+    """
+
+    name = "base"
+    reaped = False
+
+    async def save(self, db: AsyncSession, record: SessionRecord) -> SessionRecord:
+        raise NotImplementedError
+
+    async def get(self, db: AsyncSession, key: str) -> SessionRecord | None:
+        raise NotImplementedError
+
+    async def delete(self, db: AsyncSession, key: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release connections (app shutdown)."""
+
+    def stats(self) -> dict:
+        return {"backend": self.name}
@@ -0,0 +1,57 @@
+# backend/app/services/session_store/memory_store.py
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import SessionRecord, SessionStore
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Bounded in-process TTL + LRU map of sessions.
+
+    Only for a single worker process (dev, tests, one-box deployments):
+    other workers never see these sessions, and everything is lost on
+    restart. When full, the least recently used session is evicted, which
+    logs that client out.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    async def save(self, db: AsyncSession, record: SessionRecord) -> SessionRecord:
+        with self._lock:
+            self._entries[record.key] = record
+            self._entries.move_to_end(record.key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return record
+
+    async def get(self, db: AsyncSession, key: str) -> SessionRecord | None:
+        now = datetime.utcnow()
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None:
+                return None
+            if record.deadline() <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return record
+
+    async def delete(self, db: AsyncSession, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        return {"backend": self.name, "size": size, "maxsize": self.maxsize, "evictions": self.evictions}
@@ -0,0 +1,63 @@
+# backend/app/services/session_store/redis_store.py
+import json
+import math
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import SessionRecord, SessionStore
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Sessions as JSON strings under "<prefix><token_key>", each SET with an
+    expiry at the session's deadline so Redis drops them itself. Works with
+    anything speaking the Redis protocol (Redis, Valkey, KeyDB, fakeredis).
+
+    The redis package is only imported when this store is used; pass client
+    to supply an already configured redis.asyncio-compatible client.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "session:", client=None):
+        self.url = url
+        self.prefix = prefix
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError as exc:
+                raise RuntimeError("SESSION_STORE=redis needs the 'redis' package (pip install redis)") from exc
+            self._client = redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    async def save(self, db: AsyncSession, record: SessionRecord) -> SessionRecord:
+        ttl = (record.deadline() - datetime.utcnow()).total_seconds()
+        if ttl <= 0:
+            # already expired: nothing a later get() could return
+            return record
+        await self.client.set(self.prefix + record.key, json.dumps(record.to_dict()), ex=max(1, math.ceil(ttl)))
+        return record
+
+    async def get(self, db: AsyncSession, key: str) -> SessionRecord | None:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        record = SessionRecord.from_dict(json.loads(raw))
+        # EX is rounded up to whole seconds; don't serve the tail end
+        return record if record.is_live() else None
+
+    async def delete(self, db: AsyncSession, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        return {"backend": self.name, "prefix": self.prefix}
@@ -0,0 +1,61 @@
+# backend/app/services/session_store/sql_store.py
+from datetime import datetime
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ... import models
+from .base import SessionRecord, SessionStore
+
+
+def session_is_live(now: datetime | None = None):
+    """
+    SQL condition for a session that has not expired. expires_at is naive
+    UTC (see token_service); legacy rows without one are bounded by the
+    JWT's own exp instead.
+    """
+    now = now or datetime.utcnow()
+    return or_(models.SessionToken.expires_at.is_(None), models.SessionToken.expires_at > now)
+
+
+def _record(row: models.SessionToken) -> SessionRecord:
+    return SessionRecord(
+        key=row.token_key,
+        user_id=row.user_id,
+        vendor_id=row.vendor_id,
+        expires_at=row.expires_at,
+        created_at=row.created_at,
+    )
+
+
+class SqlSessionStore(SessionStore):
+    """The sessions table, written in the request's own DB session."""
+
+    name = "sql"
+    reaped = True
+
+    async def save(self, db: AsyncSession, record: SessionRecord) -> SessionRecord:
+        # only the fixed-size key is stored; the JWT itself never hits the table
+        db.add(
+            models.SessionToken(
+                token_key=record.key,
+                user_id=record.user_id,
+                vendor_id=record.vendor_id,
+                created_at=record.created_at,
+                expires_at=record.expires_at,
+            )
+        )
+        await db.commit()
+        return record
+
+    async def get(self, db: AsyncSession, key: str) -> SessionRecord | None:
+        row = (
+            await db.execute(
+                select(models.SessionToken).where(models.SessionToken.token_key == key, session_is_live())
+            )
+        ).scalars().first()
+        return _record(row) if row is not None else None
+
+    async def delete(self, db: AsyncSession, key: str) -> None:
+        await db.execute(delete(models.SessionToken).where(models.SessionToken.token_key == key))
+        await db.commit()
@@ -1,5 +1,7 @@
 # backend/app/services/token_service.py
+import hashlib
 import os
+import uuid
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 
@@ -13,7 +15,8 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     expire = datetime.utcnow() + (
         expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
-    to_encode.update({"exp": expire})
+    # jti: random id that keys the server-side session row (see token_key)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt, expire
 
@@ -24,3 +27,22 @@ def decode_token(token: str):
         return payload
     except JWTError:
         return None
+
+
+def token_key(token: str, claims: dict | None = None) -> str:
+    """
+    Fixed-size key of the sessions row for token: its jti claim, or the
+    SHA-256 hex digest of the whole token for tokens issued before jti.
+    claims, if the caller already decoded the token, saves a second decode;
+    otherwise the signature is checked (expiry is not, so logging out with
+    an expired token still finds its row).
+    """
+    if claims is None:
+        try:
+            claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False})
+        except JWTError:
+            claims = {}
+    jti = claims.get("jti")
+    if isinstance(jti, str) and jti:
+        return jti
+    return hashlib.sha256(token.encode()).hexdigest()
@@ -0,0 +1,347 @@
+# backend/benchmarks/bench_endpoints.py
+#
+# Endpoint benchmark for the vendor API. Boots the FastAPI app in-process
+# (httpx ASGITransport, no network hop) against DATABASE_URL, seeds
+# vendors x assessments x candidates, then drives each endpoint at several
+# concurrency levels and reports throughput and latency percentiles.
+#
+#   cd backend
+#   DATABASE_URL=postgresql://... python benchmarks/bench_endpoints.py \
+#       --vendors 20 --assessments 10 --candidates 50 \
+#       --concurrency 1,8,32 --requests 400 --output bench.json
+#
+# Seeded rows are tagged with a run id and deleted afterwards (--keep to
+# leave them). Compare two runs with:
+#   python benchmarks/bench_endpoints.py --compare before.json after.json
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import delete, insert, select  # noqa: E402
+
+from app import models  # noqa: E402
+from app import repository as crud  # noqa: E402
+from app import services as auth  # noqa: E402
+from app.db import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+BENCH_PASSWORD = "bench-password"
+STATUSES = ("invited", "interviewed", "shortlisted", "rejected")
+
+
+# ────────────────────────────────────────────────────────────
+# Seeding
+# ────────────────────────────────────────────────────────────
+
+def seed(run_id: str, vendors: int, assessments: int, candidates: int, seed_value: int) -> dict:
+    """
+    Insert the data shape in bulk (sync engine, executemany) and return what
+    the scenarios need: vendor emails, assessment ids and linked candidates.
+    """
+    rng = random.Random(seed_value)
+    password_hash = auth.get_password_hash(BENCH_PASSWORD)  # one hash for every vendor
+    with SessionLocal() as session:
+        vendor_rows = [
+            {"company_name": f"Bench {run_id} #{v}", "email": f"bench-{run_id}-{v}@bench.example.com", "password_hash": password_hash}
+            for v in range(vendors)
+        ]
+        session.execute(insert(models.Vendor), vendor_rows)
+        vendor_ids = dict(
+            session.execute(
+                select(models.Vendor.email, models.Vendor.id).where(models.Vendor.email.like(f"bench-{run_id}-%"))
+            ).all()
+        )
+
+        shape = {"vendors": []}
+        for row in vendor_rows:
+            vendor_id = vendor_ids[row["email"]]
+            assessment_rows, candidate_rows, link_rows, owned = [], [], [], []
+            for a in range(assessments):
+                assessment_id = uuid.uuid4()
+                # counters as the app would have maintained them
+                assessment_row = {
+                    "assessment_id": assessment_id,
+                    "title": f"Bench assessment {a}",
+                    "description": "benchmark",
+                    "vendor_id": vendor_id,
+                    "candidates_total": candidates,
+                    **dict.fromkeys(crud.STATUS_COUNTER_COLUMNS.values(), 0),
+                }
+                assessment_rows.append(assessment_row)
+                linked = []
+                for c in range(candidates):
+                    candidate_uuid = uuid.uuid4()
+                    link_status = rng.choice(STATUSES)
+                    candidate_rows.append({
+                        "candidate_uuid": candidate_uuid,
+                        "name": f"Candidate {c}",
+                        "email": f"c-{candidate_uuid.hex}@bench-{run_id}.local",
+                    })
+                    link_rows.append({
+                        "assessment_candidate_id": uuid.uuid4(),
+                        "assessment_id": assessment_id,
+                        "candidate_uuid": candidate_uuid,
+                        "status": link_status,
+                    })
+                    assessment_row[crud.STATUS_COUNTER_COLUMNS[link_status]] += 1
+                    linked.append(str(candidate_uuid))
+                owned.append({"assessment_id": str(assessment_id), "candidates": linked})
+            session.execute(insert(models.Assessment), assessment_rows)
+            if candidate_rows:
+                session.execute(insert(models.Candidate), candidate_rows)
+                session.execute(insert(models.AssessmentCandidate), link_rows)
+            session.commit()
+            shape["vendors"].append({"id": vendor_id, "email": row["email"], "assessments": owned})
+    return shape
+
+
+def cleanup(run_id: str):
+    with SessionLocal() as session:
+        vendor_ids = select(models.Vendor.id).where(models.Vendor.email.like(f"bench-{run_id}-%"))
+        assessment_ids = select(models.Assessment.assessment_id).where(models.Assessment.vendor_id.in_(vendor_ids))
+        session.execute(delete(models.AssessmentCandidate).where(models.AssessmentCandidate.assessment_id.in_(assessment_ids)))
+        session.execute(delete(models.Candidate).where(models.Candidate.email.like(f"%@bench-{run_id}.local")))
+        session.execute(delete(models.Assessment).where(models.Assessment.vendor_id.in_(vendor_ids)))
+        session.execute(delete(models.SessionToken).where(models.SessionToken.vendor_id.in_(vendor_ids)))
+        session.execute(delete(models.Vendor).where(models.Vendor.email.like(f"bench-{run_id}-%")))
+        session.commit()
+
+
+# ────────────────────────────────────────────────────────────
+# Scenarios
+# ────────────────────────────────────────────────────────────
+# Each scenario builds one request for a logged-in vendor client:
+# (method, path, json body or None).
+
+def _pick_assessment(rng, vendor):
+    return rng.choice(vendor["assessments"])
+
+
+def scenario_vendor_login(rng, vendor, run_id):
+    return "POST", "/auth/vendor/login", {"email": vendor["email"], "password": BENCH_PASSWORD}
+
+
+def scenario_dashboard(rng, vendor, run_id):
+    return "GET", "/vendor/dashboard", None
+
+
+def scenario_assessment_detail(rng, vendor, run_id):
+    assessment = _pick_assessment(rng, vendor)
+    return "GET", f"/vendor/assessment/{assessment['assessment_id']}", None
+
+
+def scenario_add_candidate(rng, vendor, run_id):
+    assessment = _pick_assessment(rng, vendor)
+    body = {"name": "Bench Added", "email": f"added-{uuid.uuid4().hex}@bench-{run_id}.local"}
+    return "POST", f"/vendor/assessment/{assessment['assessment_id']}/add-candidate", body
+
+
+def scenario_candidate_status(rng, vendor, run_id):
+    assessment = _pick_assessment(rng, vendor)
+    candidate = rng.choice(assessment["candidates"])
+    path = f"/vendor/assessment/{assessment['assessment_id']}/candidate/{candidate}/status"
+    return "POST", path, {"status": rng.choice(STATUSES)}
+
+
+SCENARIOS = {
+    "vendor_login": scenario_vendor_login,
+    "dashboard": scenario_dashboard,
+    "assessment_detail": scenario_assessment_detail,
+    "add_candidate": scenario_add_candidate,
+    "candidate_status": scenario_candidate_status,
+}
+
+
+# ────────────────────────────────────────────────────────────
+# Runner
+# ────────────────────────────────────────────────────────────
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies: list, errors: int, wall: float) -> dict:
+    values = sorted(latencies)
+    ms = lambda s: round(s * 1000, 3)  # noqa: E731
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(values) / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "min": ms(values[0]) if values else 0.0,
+            "mean": ms(sum(values) / len(values)) if values else 0.0,
+            "p50": ms(percentile(values, 50)),
+            "p90": ms(percentile(values, 90)),
+            "p95": ms(percentile(values, 95)),
+            "p99": ms(percentile(values, 99)),
+            "max": ms(values[-1]) if values else 0.0,
+        },
+    }
+
+
+async def login(client: httpx.AsyncClient, vendor: dict):
+    r = await client.post("/auth/vendor/login", json={"email": vendor["email"], "password": BENCH_PASSWORD})
+    r.raise_for_status()
+
+
+async def run_level(clients, shape, run_id, scenario, concurrency: int, total: int, seed_value: int) -> dict:
+    """Fire total requests from concurrency workers; each worker sticks to one vendor."""
+    remaining = total
+    latencies, errors, error_samples = [], 0, {}
+
+    async def worker(index: int):
+        nonlocal remaining, errors
+        rng = random.Random(seed_value * 1000 + index)
+        vendor_index = index % len(shape["vendors"])
+        vendor, client = shape["vendors"][vendor_index], clients[vendor_index]
+        while remaining > 0:
+            remaining -= 1
+            method, path, body = scenario(rng, vendor, run_id)
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+                error_samples.setdefault(response.status_code, response.text[:200])
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    result = summarize(latencies, errors, time.perf_counter() - wall_start)
+    if error_samples:
+        result["error_samples"] = {str(k): v for k, v in error_samples.items()}
+    return result
+
+
+async def run(args, shape, run_id) -> list:
+    # ASGITransport doesn't send lifespan events; run start-up/shutdown ourselves
+    async with app.router.lifespan_context(app):
+        return await _run_clients(args, shape, run_id)
+
+
+async def _run_clients(args, shape, run_id) -> list:
+    transport = httpx.ASGITransport(app=app)
+    clients = [httpx.AsyncClient(transport=transport, base_url="http://bench") for _ in shape["vendors"]]
+    results = []
+    try:
+        for client, vendor in zip(clients, shape["vendors"]):
+            await login(client, vendor)
+        for name in args.endpoints:
+            scenario = SCENARIOS[name]
+            for concurrency in args.concurrency:
+                if args.warmup:
+                    await run_level(clients, shape, run_id, scenario, concurrency, args.warmup, args.seed)
+                measured = await run_level(clients, shape, run_id, scenario, concurrency, args.requests, args.seed)
+                result = {"endpoint": name, "concurrency": concurrency, **measured}
+                results.append(result)
+                lat = result["latency_ms"]
+                print(
+                    f"{name:<20} c={concurrency:<4} {result['throughput_rps']:>9.1f} req/s  "
+                    f"p50={lat['p50']:>8.2f}ms p95={lat['p95']:>8.2f}ms p99={lat['p99']:>8.2f}ms  "
+                    f"errors={result['errors']}"
+                )
+    finally:
+        for client in clients:
+            await client.aclose()
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(before_path: str, after_path: str):
+    """Print p50/p95/throughput deltas for (endpoint, concurrency) pairs found in both files."""
+    with open(before_path) as f:
+        before = {(r["endpoint"], r["concurrency"]): r for r in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = {(r["endpoint"], r["concurrency"]): r for r in json.load(f)["results"]}
+    for key in sorted(before.keys() & after.keys()):
+        b, a = before[key], after[key]
+        delta = lambda old, new: (new - old) / old * 100 if old else 0.0  # noqa: E731
+        print(
+            f"{key[0]:<20} c={key[1]:<4} "
+            f"rps {b['throughput_rps']:>8.1f} -> {a['throughput_rps']:>8.1f} ({delta(b['throughput_rps'], a['throughput_rps']):+6.1f}%)  "
+            f"p95 {b['latency_ms']['p95']:>8.2f} -> {a['latency_ms']['p95']:>8.2f}ms ({delta(b['latency_ms']['p95'], a['latency_ms']['p95']):+6.1f}%)"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the vendor API endpoints.")
+    parser.add_argument("--vendors", type=int, default=10)
+    parser.add_argument("--assessments", type=int, default=10, help="assessments per vendor")
+    parser.add_argument("--candidates", type=int, default=50, help="candidates per assessment")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per endpoint and level")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests before each level")
+    parser.add_argument("--endpoints", default=",".join(SCENARIOS), help="comma-separated subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_endpoints.json")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded rows in the database")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+    args.concurrency = [int(c) for c in args.concurrency.split(",") if c]
+    args.endpoints = [e for e in args.endpoints.split(",") if e]
+    unknown = set(args.endpoints) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    run_id = uuid.uuid4().hex[:8]
+    print(f"Seeding {args.vendors} vendors x {args.assessments} assessments x {args.candidates} candidates (run {run_id})")
+    started = time.perf_counter()
+    shape = seed(run_id, args.vendors, args.assessments, args.candidates, args.seed)
+    print(f"Seeded in {time.perf_counter() - started:.1f}s")
+    try:
+        results = asyncio.run(run(args, shape, run_id))
+    finally:
+        if not args.keep:
+            cleanup(run_id)
+            engine.dispose()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": engine.url.get_backend_name(),
+            "shape": {"vendors": args.vendors, "assessments": args.assessments, "candidates": args.candidates},
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# backend/benchmarks/bench_indexes.py
+#
+# Before/after comparison for the hot-filter indexes of migration 0002.
+# Drops those indexes, measures the dashboard / candidate page / status
+# update / session queries (plan + latency), recreates the indexes and
+# measures again. Use a throwaway database loaded with
+# scripts/generate_data.py; the indexes are always recreated at the end.
+#
+#   cd backend
+#   DATABASE_URL=postgresql://... python benchmarks/bench_indexes.py --runs 50 --output indexes.json
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.db import engine  # noqa: E402
+
+MIGRATION = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations", "versions", "0002_hot_filter_indexes.py")
+
+
+def load_indexes():
+    spec = importlib.util.spec_from_file_location("hot_filter_indexes", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.INDEXES
+
+
+# name -> (SQL, needs a rollback because it writes)
+QUERIES = {
+    "dashboard_assessments": (
+        "SELECT assessment_id, title, created_at FROM assessment WHERE vendor_id = :vendor_id ORDER BY created_at",
+        False,
+    ),
+    "dashboard_candidate_counts": (
+        "SELECT ac.assessment_id, count(*) FROM assessment_candidate ac "
+        "JOIN assessment a ON a.assessment_id = ac.assessment_id "
+        "WHERE a.vendor_id = :vendor_id GROUP BY ac.assessment_id",
+        False,
+    ),
+    "candidate_page": (
+        "SELECT * FROM assessment_candidate WHERE assessment_id = :assessment_id "
+        "ORDER BY invited_date, assessment_candidate_id LIMIT 50",
+        False,
+    ),
+    "status_update_lookup": (
+        "SELECT ac.assessment_candidate_id, a.vendor_id FROM assessment_candidate ac "
+        "JOIN assessment a ON a.assessment_id = ac.assessment_id "
+        "WHERE ac.assessment_id = :assessment_id AND ac.candidate_uuid = :candidate_uuid",
+        False,
+    ),
+    "status_update": (
+        "UPDATE assessment_candidate SET status = 'shortlisted' "
+        "WHERE assessment_id = :assessment_id AND candidate_uuid = :candidate_uuid",
+        True,
+    ),
+    "candidate_assessments": (
+        "SELECT assessment_id, status FROM assessment_candidate WHERE candidate_uuid = :candidate_uuid",
+        False,
+    ),
+    "vendor_sessions": ("SELECT id FROM sessions WHERE vendor_id = :vendor_id", False),
+    "expired_sessions": ("SELECT count(*) FROM sessions WHERE expires_at < CURRENT_TIMESTAMP", False),
+}
+
+
+def pick_params(conn) -> dict:
+    """The busiest vendor and assessment, so the 'before' scans are realistic worst cases."""
+    vendor_id = conn.execute(
+        text("SELECT vendor_id FROM assessment GROUP BY vendor_id ORDER BY count(*) DESC LIMIT 1")
+    ).scalar()
+    assessment_id, candidate_uuid = conn.execute(
+        text(
+            "SELECT assessment_id, min(candidate_uuid) FROM assessment_candidate "
+            "GROUP BY assessment_id ORDER BY count(*) DESC LIMIT 1"
+        )
+    ).first() or (None, None)
+    if vendor_id is None or assessment_id is None:
+        raise SystemExit("No data: load some with scripts/generate_data.py first")
+    return {"vendor_id": vendor_id, "assessment_id": assessment_id, "candidate_uuid": candidate_uuid}
+
+
+def explain(conn, sql: str, params: dict) -> list:
+    if conn.dialect.name == "postgresql":
+        rows = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params).scalars().all()
+    else:
+        rows = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)]
+    return rows
+
+
+def measure(conn, runs: int, params: dict) -> dict:
+    results = {}
+    for name, (sql, writes) in QUERIES.items():
+        used = {k: v for k, v in params.items() if f":{k}" in sql}
+        transaction = conn.begin()
+        try:
+            plan = explain(conn, sql, used)
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                result = conn.execute(text(sql), used)
+                if not writes:
+                    result.all()
+                timings.append(time.perf_counter() - start)
+        finally:
+            # reads and writes alike: leave the data untouched
+            transaction.rollback()
+        timings.sort()
+        results[name] = {
+            "plan": plan,
+            "median_ms": round(statistics.median(timings) * 1000, 3),
+            "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)] * 1000, 3),
+        }
+    return results
+
+
+def set_indexes(indexes, present: bool):
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for name, table, columns in indexes:
+            if present:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+            else:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        # refresh planner statistics after the change
+        conn.execute(text("ANALYZE"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare query plans and latency without/with the hot-filter indexes.")
+    parser.add_argument("--runs", type=int, default=30, help="timed executions per query")
+    parser.add_argument("--output", default="bench_indexes.json")
+    args = parser.parse_args()
+
+    indexes = load_indexes()
+    with engine.connect() as conn:
+        params = pick_params(conn)
+    try:
+        set_indexes(indexes, present=False)
+        with engine.connect() as conn:
+            before = measure(conn, args.runs, params)
+    finally:
+        set_indexes(indexes, present=True)
+    with engine.connect() as conn:
+        after = measure(conn, args.runs, params)
+
+    for name in QUERIES:
+        b, a = before[name], after[name]
+        speedup = b["median_ms"] / a["median_ms"] if a["median_ms"] else 0.0
+        print(f"{name:<28} {b['median_ms']:>9.3f}ms -> {a['median_ms']:>9.3f}ms  (x{speedup:.1f})")
+        for label, plan in (("before", b["plan"]), ("after", a["plan"])):
+            # top of the plan is enough to spot Seq Scan vs Index Scan
+            print(f"    {label + ':':<8}" + "\n              ".join(line.strip() for line in plan[:3]))
+
+    report = {
+        "database": engine.url.get_backend_name(),
+        "params": {k: str(v) for k, v in params.items()},
+        "runs": args.runs,
+        "before": before,
+        "after": after,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
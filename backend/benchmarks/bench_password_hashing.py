@@ -0,0 +1,97 @@
+# backend/benchmarks/bench_password_hashing.py
+#
+# Login-path hashing throughput: password verifications per second with the
+# work on threads (the old asyncio.to_thread path) versus the process pool at
+# 1..N workers, plus how much a verify storm delays the event loop (i.e.
+# every other route). No database needed.
+#
+#   cd backend
+#   python benchmarks/bench_password_hashing.py --verifies 400 --rounds 29000 --output hashing.json
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+async def loop_lag(stop: asyncio.Event, samples: list):
+    """Oversleep of a 5ms timer: how long a ready request handler would wait."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        samples.append(time.perf_counter() - start - 0.005)
+
+
+async def storm(executor, verifies: int, concurrency: int, stored_hash: str) -> dict:
+    from app.services.password_service import verify_and_update
+
+    loop = asyncio.get_running_loop()
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with gate:
+            ok, _ = await loop.run_in_executor(executor, verify_and_update, "bench-password", stored_hash)
+            assert ok
+
+    stop, lag = asyncio.Event(), []
+    probe = asyncio.create_task(loop_lag(stop, lag))
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(verifies)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    lag.sort()
+    return {
+        "verifies_per_s": round(verifies / elapsed, 1),
+        "loop_lag_ms_p50": round(statistics.median(lag) * 1000, 3) if lag else 0.0,
+        "loop_lag_ms_p99": round(lag[min(int(len(lag) * 0.99), len(lag) - 1)] * 1000, 3) if lag else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Password verify throughput: threads vs process pool.")
+    parser.add_argument("--verifies", type=int, default=200, help="verifications per configuration")
+    parser.add_argument("--rounds", type=int, default=int(os.getenv("PASSWORD_HASH_ROUNDS", "29000")))
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    # set before the import so the workers (spawned, re-importing the module) agree
+    os.environ["PASSWORD_HASH_ROUNDS"] = str(args.rounds)
+    from app.services.password_service import get_password_hash
+
+    stored_hash = get_password_hash("bench-password")
+    levels = sorted({1, 2, 4, 8, 16, args.max_workers} & set(range(1, args.max_workers + 1)))
+    results = []
+    for mode in ("thread", "process"):
+        for workers in levels:
+            if mode == "thread":
+                executor = ThreadPoolExecutor(max_workers=workers)
+            else:
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+                # spawn + import outside the measured window
+                for f in [executor.submit(get_password_hash, "warm") for _ in range(workers)]:
+                    f.result()
+            try:
+                measured = asyncio.run(storm(executor, args.verifies, workers * 2, stored_hash))
+            finally:
+                executor.shutdown()
+            results.append({"mode": mode, "workers": workers, **measured})
+            print(
+                f"{mode:<8} workers={workers:<3} {measured['verifies_per_s']:>8.1f} verifies/s  "
+                f"loop lag p50={measured['loop_lag_ms_p50']:.2f}ms p99={measured['loop_lag_ms_p99']:.2f}ms"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"rounds": args.rounds, "cpu_count": os.cpu_count(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
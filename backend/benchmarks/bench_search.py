@@ -0,0 +1,133 @@
+# backend/benchmarks/bench_search.py
+#
+# Latency of the vendor search queries (repository.search, migration 0007)
+# for the busiest vendor: exact words, prefixes and one-letter typos taken
+# from that vendor's own candidates and assessments. Prints p50/p95 per
+# query kind and, on Postgres, the plan of the first query of each kind.
+# Load data first, e.g. a million candidates:
+#
+#   cd backend
+#   DATABASE_URL=postgresql://... python scripts/generate_data.py --candidates 1000000 --links 4000000
+#   DATABASE_URL=postgresql://... python benchmarks/bench_search.py --runs 20 --output search.json
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, func, select  # noqa: E402
+
+from app import db, models  # noqa: E402
+from app import repository as crud  # noqa: E402
+
+
+def typo(word: str, rng: random.Random) -> str:
+    """Swap two adjacent letters in the middle of word."""
+    if len(word) < 5:
+        return word
+    i = rng.randrange(1, len(word) - 2)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+async def pick_queries(session, rng: random.Random, per_kind: int):
+    A = models.Assessment
+    vendor_id = (
+        await session.execute(select(A.vendor_id).group_by(A.vendor_id).order_by(func.count().desc()).limit(1))
+    ).scalar()
+    if vendor_id is None:
+        raise SystemExit("No data: load some with scripts/generate_data.py first")
+
+    names = [r[0] for r in (await session.execute(
+        select(models.Candidate.name)
+        .join(models.AssessmentCandidate, models.AssessmentCandidate.candidate_uuid == models.Candidate.candidate_uuid)
+        .join(A, A.assessment_id == models.AssessmentCandidate.assessment_id)
+        .where(A.vendor_id == vendor_id)
+        .limit(500)
+    )).all()]
+    titles = [r[0] for r in (await session.execute(select(A.title).where(A.vendor_id == vendor_id).limit(500))).all()]
+    words = [w for n in names for w in n.lower().split() if len(w) >= 3] or ["none"]
+    title_words = [w for t in titles for w in t.lower().split() if len(w) >= 3] or ["none"]
+
+    queries = {
+        "candidate_word": [rng.choice(words) for _ in range(per_kind)],
+        "candidate_prefix": [rng.choice(words)[:3] for _ in range(per_kind)],
+        "candidate_typo": [typo(rng.choice(words), rng) for _ in range(per_kind)],
+        "assessment_word": [rng.choice(title_words) for _ in range(per_kind)],
+        "assessment_prefix": [rng.choice(title_words)[:3] for _ in range(per_kind)],
+    }
+    return vendor_id, queries
+
+
+async def explain(session, kind: str, vendor_id: int, q: str) -> list:
+    """EXPLAIN ANALYZE of the statement the search function runs for q (Postgres only)."""
+    if session.get_bind().dialect.name != "postgresql":
+        return []
+    search = crud.search_candidates if kind.startswith("candidate") else crud.search_assessments
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await search(session, vendor_id, q, limit=21)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = captured[-1]
+    conn = await session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+    return result.scalars().all()
+
+
+async def run(args) -> dict:
+    rng = random.Random(args.seed)
+    async with db.AsyncSessionLocal() as session:
+        vendor_id, queries = await pick_queries(session, rng, args.runs)
+        results = {}
+        for kind, qs in queries.items():
+            search = crud.search_candidates if kind.startswith("candidate") else crud.search_assessments
+            timings, hits = [], []
+            for q in qs:
+                start = time.perf_counter()
+                rows = await search(session, vendor_id, q, limit=21)
+                timings.append(time.perf_counter() - start)
+                hits.append(len(rows))
+            timings.sort()
+            results[kind] = {
+                "p50_ms": round(statistics.median(timings) * 1000, 3),
+                "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)] * 1000, 3),
+                "mean_hits": round(statistics.mean(hits), 1),
+                "sample": qs[:3],
+                "plan": await explain(session, kind, vendor_id, qs[0]),
+            }
+    await db.dispose_engines()
+    return {"vendor_id": vendor_id, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vendor search latency (p50/p95) per query kind.")
+    parser.add_argument("--runs", type=int, default=20, help="queries per kind")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(f"vendor {report['vendor_id']} ({db.engine.url.get_backend_name()})")
+    for kind, r in report["results"].items():
+        print(f"  {kind:<18} p50 {r['p50_ms']:>8.2f}ms  p95 {r['p95_ms']:>8.2f}ms  hits {r['mean_hits']:>5}  e.g. {r['sample']}")
+        for line in r["plan"][:4]:
+            print(f"      {line}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
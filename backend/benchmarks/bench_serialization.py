@@ -0,0 +1,180 @@
+# backend/benchmarks/bench_serialization.py
+#
+# Serialization cost of a /vendor/dashboard body, without the database:
+#
+#   dict     the old path: hand-built dicts with str(uuid), then FastAPI's
+#            jsonable_encoder + json.dumps (what JSONResponse does)
+#   orjson   the same dicts through orjson.dumps (if orjson is installed)
+#   typed    the response models built by the router, validated and dumped
+#            by pydantic-core as FastAPI does for a response_model
+#
+# Every path must produce the same JSON; the script checks that first.
+#
+#   cd backend
+#   python benchmarks/bench_serialization.py --assessments 50 --candidates 200 --runs 20 --output ser.json
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app import models, schemas  # noqa: E402
+from app.routers import vendor_router  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def build_graph(assessments: int, candidates: int):
+    """Transient ORM objects shaped like a vendor's dashboard."""
+    vendor = models.Vendor(id=1, company_name="Bench Co", email="bench@bench.example.com")
+    now = datetime.now(timezone.utc)
+    out = []
+    for a in range(assessments):
+        assessment = models.Assessment(
+            assessment_id=uuid.uuid4(),
+            title=f"Assessment {a}",
+            description="Benchmark assessment " * 5,
+            skills="python, sql, kubernetes",
+            duration=60,
+            work_experience="3-5 years",
+            vendor_id=vendor.id,
+            status="draft",
+            required_candidates=5,
+            created_at=now,
+            candidates_total=candidates,
+            invited_count=candidates,
+            interviewed_count=0,
+            shortlisted_count=0,
+            rejected_count=0,
+        )
+        for c in range(candidates):
+            candidate = models.Candidate(
+                id=a * candidates + c,
+                candidate_uuid=uuid.uuid4(),
+                name=f"Candidate {c}",
+                email=f"c{a}-{c}@example.com",
+                phone="+1 555 0100",
+                resume_path=f"/uploads/resumes/{a}-{c}.pdf",
+            )
+            assessment.candidates.append(models.AssessmentCandidate(candidate=candidate, status="invited"))
+        out.append(assessment)
+    return vendor, out
+
+
+def legacy_dict(vendor, assessments) -> dict:
+    """The dashboard body as the router built it before typed models."""
+    items = []
+    for a in assessments:
+        items.append({
+            "id": str(a.assessment_id),
+            "assessment_id": str(a.assessment_id),
+            "title": a.title,
+            "description": a.description,
+            "skills": a.skills,
+            "duration": a.duration,
+            "work_experience": a.work_experience,
+            "vendor_id": a.vendor_id,
+            "status": a.status,
+            "required_candidates": int(a.required_candidates or 0),
+            "candidates_count": a.candidates_total,
+            "candidates": [
+                {
+                    "id": ac.candidate.id,
+                    "candidate_uuid": str(ac.candidate.candidate_uuid),
+                    "name": ac.candidate.name,
+                    "email": ac.candidate.email,
+                    "phone": ac.candidate.phone,
+                    "resume_path": ac.candidate.resume_path,
+                    "status": ac.status,
+                }
+                for ac in a.candidates
+            ],
+        })
+    return {
+        "vendor": {"id": vendor.id, "company_name": vendor.company_name, "email": vendor.email},
+        "assessments": items,
+    }
+
+
+def typed_model(vendor, assessments) -> schemas.DashboardOut:
+    """The dashboard body as the router builds it now."""
+    items = []
+    for a in assessments:
+        item = vendor_router._assessment_values(a, vendor_router.DASHBOARD_FIELDS)
+        item["candidates"] = [vendor_router._candidate_out(ac) for ac in a.candidates]
+        items.append(schemas.DashboardAssessmentOut.model_construct(**item))
+    return schemas.DashboardOut.model_construct(
+        vendor=schemas.DashboardVendorOut.model_construct(
+            id=vendor.id, company_name=vendor.company_name, email=vendor.email
+        ),
+        assessments=items,
+    )
+
+
+def dumps_like_jsonresponse(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard serialization: dict + json vs typed models.")
+    parser.add_argument("--assessments", type=int, default=50)
+    parser.add_argument("--candidates", type=int, default=100, help="candidates per assessment")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    vendor, assessments = build_graph(args.assessments, args.candidates)
+    adapter = TypeAdapter(schemas.DashboardOut)
+
+    paths = {
+        "dict": lambda: dumps_like_jsonresponse(jsonable_encoder(legacy_dict(vendor, assessments))),
+        "typed": lambda: adapter.dump_json(
+            adapter.validate_python(typed_model(vendor, assessments)), exclude_unset=True
+        ),
+    }
+    if orjson is not None:
+        paths["orjson"] = lambda: orjson.dumps(legacy_dict(vendor, assessments))
+
+    reference = json.loads(paths["dict"]())
+    for name, path in paths.items():
+        if json.loads(path()) != reference:
+            raise SystemExit(f"{name} output differs from the dict path")
+
+    results = {}
+    for name, path in paths.items():
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            body = path()
+            timings.append(time.perf_counter() - start)
+        results[name] = {
+            "median_ms": round(statistics.median(timings) * 1000, 3),
+            "min_ms": round(min(timings) * 1000, 3),
+            "bytes": len(body),
+        }
+
+    base = results["dict"]["median_ms"]
+    print(f"{args.assessments} assessments x {args.candidates} candidates")
+    for name, r in results.items():
+        print(f"  {name:<7} median {r['median_ms']:>9.2f}ms  min {r['min_ms']:>9.2f}ms  "
+              f"{r['bytes']:>10,} bytes  (x{base / r['median_ms']:.1f} vs dict)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"assessments": args.assessments, "candidates": args.candidates, "runs": args.runs,
+                       "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# backend/benchmarks/bench_session_store.py
+#
+# Session store backends side by side: save / get (hit) / get (miss) /
+# delete latency for each — the per-request cost of the session check is
+# the get hit. That the backends behave alike is checked by
+# tests/test_session_store.py.
+#
+#   cd backend
+#   DATABASE_URL=postgresql://... SESSION_REDIS_URL=redis://localhost:6379/0 \
+#       python benchmarks/bench_session_store.py --ops 2000 --output session_store.json
+#
+# The sql backend needs the sessions table (alembic upgrade head). Without
+# SESSION_REDIS_URL the redis backend runs against fakeredis if installed
+# (in-process, so it measures the client code path, not the network).
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select  # noqa: E402
+
+from app import db, models  # noqa: E402
+from app.services import session_store  # noqa: E402
+
+
+def build_store(backend: str):
+    """The store to measure, or (None, reason) when it can't run here."""
+    if backend == "redis" and not os.getenv("SESSION_REDIS_URL"):
+        try:
+            from fakeredis import FakeAsyncRedis
+        except ImportError:
+            return None, "set SESSION_REDIS_URL or install fakeredis"
+        return session_store.RedisSessionStore("fakeredis://", client=FakeAsyncRedis(decode_responses=True)), None
+    return session_store.make_store(backend), None
+
+
+def summarize(timings: list) -> dict:
+    timings.sort()
+    return {
+        "median_us": round(statistics.median(timings) * 1e6, 1),
+        "p99_us": round(timings[min(int(len(timings) * 0.99), len(timings) - 1)] * 1e6, 1),
+    }
+
+
+async def measure(store, session, ops: int, vendor_id) -> dict:
+    expires_at = datetime.utcnow() + timedelta(minutes=5)
+    records = [
+        session_store.SessionRecord(uuid.uuid4().hex, vendor_id=vendor_id, expires_at=expires_at)
+        for _ in range(ops)
+    ]
+    timings = {"save": [], "get_hit": [], "get_miss": [], "delete": []}
+
+    async def timed(name, call):
+        start = time.perf_counter()
+        result = await call
+        timings[name].append(time.perf_counter() - start)
+        return result
+
+    for record in records:
+        await timed("save", store.save(session, record))
+    for record in records:
+        assert await timed("get_hit", store.get(session, record.key)) is not None
+        await timed("get_miss", store.get(session, uuid.uuid4().hex))
+    for record in records:
+        await timed("delete", store.delete(session, record.key))
+    return {name: summarize(values) for name, values in timings.items()}
+
+
+async def run(backends: list, ops: int) -> dict:
+    report = {}
+    async with db.AsyncSessionLocal() as session:
+        vendor_id = (await session.execute(select(models.Vendor.id).limit(1))).scalar() if "sql" in backends else None
+        for backend in backends:
+            store, skipped = build_store(backend)
+            if store is None:
+                print(f"{backend:<7} skipped: {skipped}")
+                report[backend] = {"skipped": skipped}
+                continue
+            try:
+                results = await measure(store, session, ops, vendor_id)
+            finally:
+                await store.close()
+            report[backend] = {"latency": results}
+            print(backend)
+            for name, values in results.items():
+                print(f"    {name:<9} median {values['median_us']:>9.1f}us  p99 {values['p99_us']:>9.1f}us")
+    await db.dispose_engines()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency of each session store backend.")
+    parser.add_argument("--backends", default="sql,memory,redis", help="comma-separated: sql, memory, redis")
+    parser.add_argument("--ops", type=int, default=1000, help="sessions saved, read and deleted per backend")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    backends = [name.strip() for name in args.backends.split(",") if name.strip()]
+    report = asyncio.run(run(backends, args.ops))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"ops": args.ops, "backends": report}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
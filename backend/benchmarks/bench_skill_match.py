@@ -0,0 +1,137 @@
+# backend/benchmarks/bench_skill_match.py
+#
+# Latency of skill matching (repository.match_assessments, migration 0008)
+# on a database loaded with scripts/generate_data.py. Generated assessments
+# have no skills, so --seed-skills first gives every assessment without
+# any 2-6 skills from a fixed vocabulary (Zipf-weighted, so a few skills
+# have long posting lists) and indexes them with the backfill.
+# Then times random 1-4 skill queries for the busiest and a median-sized
+# vendor and across all vendors, with and without require_all.
+#
+#   cd backend
+#   DATABASE_URL=postgresql://... python scripts/generate_data.py --assessments 300000
+#   DATABASE_URL=postgresql://... python benchmarks/bench_skill_match.py --seed-skills --runs 50
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, text, update  # noqa: E402
+
+from app import db, models  # noqa: E402
+from app import repository as crud  # noqa: E402
+
+VOCABULARY = (
+    "python", "sql", "javascript", "java", "kubernetes", "docker", "aws", "react", "go", "typescript",
+    "postgresql", "terraform", "node.js", "c#", "linux", "django", "spark", "kafka", "redis", "gcp",
+    "machine learning", "rust", "c++", "graphql", "airflow", "scala", "swift", "kotlin", "php", "ruby",
+)
+
+
+async def seed_skills(session, rng: random.Random, batch_size: int) -> int:
+    A = models.Assessment
+    weights = [1 / (i + 1) for i in range(len(VOCABULARY))]
+    seeded = 0
+    last_id = None
+    while True:
+        stmt = select(A.assessment_id).where(A.skills.is_(None))
+        if last_id is not None:
+            stmt = stmt.where(A.assessment_id > last_id)
+        ids = (await session.execute(stmt.order_by(A.assessment_id).limit(batch_size))).scalars().all()
+        if not ids:
+            break
+        # ORM bulk UPDATE by primary key: one executemany per batch
+        await session.execute(update(A), [
+            {
+                "assessment_id": aid,
+                "skills": ", ".join(sorted(set(rng.choices(VOCABULARY, weights=weights, k=rng.randint(2, 6))))),
+            }
+            for aid in ids
+        ])
+        await session.commit()
+        seeded += len(ids)
+        last_id = ids[-1]
+    return seeded
+
+
+async def run(args) -> dict:
+    rng = random.Random(args.seed)
+    async with db.AsyncSessionLocal() as session:
+        if args.seed_skills:
+            start = time.perf_counter()
+            seeded = await seed_skills(session, rng, args.batch_size)
+            indexed = await crud.backfill_assessment_skills(session, batch_size=args.batch_size)
+            for table in ("assessment", "skill", "assessment_skill"):
+                await session.execute(text(f"ANALYZE {table}"))
+            await session.commit()
+            print(f"seeded {seeded} and indexed {indexed} assessments in {time.perf_counter() - start:.1f}s")
+
+        A = models.Assessment
+        by_size = (
+            await session.execute(select(A.vendor_id).group_by(A.vendor_id).order_by(func.count().desc()))
+        ).scalars().all()
+        if not by_size:
+            raise SystemExit("No data: load some with scripts/generate_data.py first")
+        vendor_id, median_vendor_id = by_size[0], by_size[len(by_size) // 2]
+        links = (await session.execute(select(func.count()).select_from(models.AssessmentSkill))).scalar()
+
+        cases = {
+            "vendor_any": {"vendor_id": vendor_id},
+            "vendor_all": {"vendor_id": vendor_id, "require_all": True},
+            "median_vendor_any": {"vendor_id": median_vendor_id},
+            "global_any": {"vendor_id": None},
+            "global_all": {"vendor_id": None, "require_all": True},
+        }
+        results = {}
+        for name, case in cases.items():
+            timings, hits = [], []
+            for _ in range(args.runs):
+                skills = rng.sample(VOCABULARY, rng.randint(1, 4))
+                start = time.perf_counter()
+                rows = await crud.match_assessments(
+                    session,
+                    skills,
+                    vendor_id=case["vendor_id"],
+                    min_overlap=len(skills) if case.get("require_all") else 1,
+                    limit=21,
+                )
+                timings.append(time.perf_counter() - start)
+                hits.append(len(rows))
+            timings.sort()
+            results[name] = {
+                "p50_ms": round(statistics.median(timings) * 1000, 3),
+                "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)] * 1000, 3),
+                "mean_hits": round(statistics.mean(hits), 1),
+            }
+    await db.dispose_engines()
+    return {"vendor_id": vendor_id, "assessment_skill_rows": links, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill-match latency (p50/p95) over the assessment_skill index.")
+    parser.add_argument("--runs", type=int, default=50, help="queries per case")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--seed-skills", action="store_true", help="give assessments without skills random ones first")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(f"vendor {report['vendor_id']}, {report['assessment_skill_rows']:,} assessment_skill rows "
+          f"({db.engine.url.get_backend_name()})")
+    for name, r in report["results"].items():
+        print(f"  {name:<17} p50 {r['p50_ms']:>8.2f}ms  p95 {r['p95_ms']:>8.2f}ms  hits {r['mean_hits']:>5}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# backend/benchmarks/bench_startup.py
+#
+# Cold-start budget check. Each run is a fresh interpreter that imports
+# app.main and then runs the app's lifespan start-up/shutdown, so the numbers
+# include everything a new worker pays before serving. Exits 1 when the
+# median exceeds a budget, so CI can gate on it:
+#
+#   cd backend
+#   python benchmarks/bench_startup.py --runs 5 --import-budget-ms 1500 --startup-budget-ms 500
+#
+# Importing app.main must not touch the database: run it with an unreachable
+# DATABASE_URL to check (start-up still succeeds unless DB_CREATE_ALL or
+# DB_WARMUP_CONNECTIONS ask for a connection).
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+from app.main import app
+t1 = time.perf_counter()
+
+async def cycle():
+    async with app.router.lifespan_context(app):
+        t2 = time.perf_counter()
+    return t2
+
+t2 = asyncio.run(cycle())
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "startup_ms": (t2 - t1) * 1000}))
+"""
+
+
+def probe(importtime: bool = False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    proc = subprocess.run(cmd + ["-c", PROBE], cwd=BACKEND_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"start-up probe failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def slowest_imports(stderr: str, top: int) -> list:
+    """Top two import levels by cumulative time, from -X importtime output."""
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw = line[len("import time:"):].split("|")
+        name = raw.strip()
+        # " name" at level 0, then two more spaces per nesting level
+        if raw.startswith("    "):
+            continue
+        totals[name] = max(totals.get(name, 0), int(cumulative))
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure app import and lifespan start-up time in fresh interpreters.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "2000")))
+    parser.add_argument("--startup-budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "1000")))
+    parser.add_argument("--top", type=int, default=10, help="show the N slowest top-level imports")
+    parser.add_argument("--output", help="write the measurements as JSON")
+    args = parser.parse_args()
+
+    runs = [probe()[0] for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    startup_ms = statistics.median(r["startup_ms"] for r in runs)
+    print(f"import  median {import_ms:8.1f}ms  (budget {args.import_budget_ms:.0f}ms)")
+    print(f"startup median {startup_ms:8.1f}ms  (budget {args.startup_budget_ms:.0f}ms)")
+
+    slowest = []
+    if args.top:
+        slowest = slowest_imports(probe(importtime=True)[1], args.top)
+        print("slowest imports (cumulative):")
+        for name, micros in slowest:
+            print(f"  {name:<30} {micros / 1000:8.1f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "runs": runs,
+                "import_ms_median": import_ms,
+                "startup_ms_median": startup_ms,
+                "slowest_imports_us": slowest,
+            }, f, indent=2)
+
+    over = []
+    if import_ms > args.import_budget_ms:
+        over.append("import")
+    if startup_ms > args.startup_budget_ms:
+        over.append("startup")
+    if over:
+        print(f"over budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
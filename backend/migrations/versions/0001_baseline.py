@@ -0,0 +1,130 @@
+"""baseline schema
+
+The schema Base.metadata.create_all produced before migrations existed.
+Tables that already exist are left alone. A database created by the old
+start-up create_all may lack the unique indexes on candidate.email and
+(assessment_id, candidate_uuid) the upserts need; 0010 cleans up the
+duplicates and adds them, so `alembic upgrade head` brings it up to date.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _invite_expiry_default():
+    if op.get_bind().dialect.name == "sqlite":
+        return sa.text("(datetime('now', '+10 days'))")
+    return sa.text("(now() + interval '10 days')")
+
+
+def upgrade():
+    # offline (--sql) mode has no connection to inspect: emit every table
+    existing = set() if op.get_context().as_sql else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("email", sa.String, nullable=False),
+            sa.Column("password_hash", sa.String, nullable=False),
+            sa.Column("created_at", sa.DateTime),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if "vendors" not in existing:
+        op.create_table(
+            "vendors",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("company_name", sa.String, nullable=False),
+            sa.Column("email", sa.String, nullable=False),
+            sa.Column("password_hash", sa.String, nullable=False),
+            sa.Column("created_at", sa.DateTime),
+        )
+        op.create_index("ix_vendors_id", "vendors", ["id"])
+        op.create_index("ix_vendors_email", "vendors", ["email"], unique=True)
+
+    if "sessions" not in existing:
+        op.create_table(
+            "sessions",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("token", sa.String, nullable=False),
+            sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id")),
+            sa.Column("vendor_id", sa.Integer, sa.ForeignKey("vendors.id")),
+            sa.Column("created_at", sa.DateTime),
+            sa.Column("expires_at", sa.DateTime),
+        )
+        op.create_index("ix_sessions_id", "sessions", ["id"])
+        op.create_index("ix_sessions_token", "sessions", ["token"], unique=True)
+
+    if "assessment" not in existing:
+        op.create_table(
+            "assessment",
+            sa.Column("assessment_id", UUID(as_uuid=True), primary_key=True),
+            sa.Column("title", sa.String, nullable=False),
+            sa.Column("description", sa.Text),
+            sa.Column("vendor_id", sa.Integer, sa.ForeignKey("vendors.id"), nullable=False),
+            sa.Column("created_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column("user_id", sa.String(10)),
+            sa.Column("skills", sa.Text),
+            sa.Column("duration", sa.Integer, nullable=False, server_default="0"),
+            sa.Column("work_experience", sa.String),
+            sa.Column("status", sa.String, nullable=False, server_default="draft"),
+            sa.Column("updated_at", sa.TIMESTAMP(timezone=True)),
+            sa.Column("required_candidates", sa.Integer, nullable=False),
+        )
+
+    if "candidate" not in existing:
+        op.create_table(
+            "candidate",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("name", sa.String, nullable=False),
+            sa.Column("email", sa.String, nullable=False),
+            sa.Column("candidate_uuid", UUID(as_uuid=True), nullable=False, unique=True),
+            sa.Column("phone", sa.String(30)),
+            sa.Column("resume_path", sa.Text),
+            sa.Column("created_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_candidate_id", "candidate", ["id"])
+        op.create_index("ix_candidate_email", "candidate", ["email"], unique=True)
+
+    if "assessment_candidate" not in existing:
+        op.create_table(
+            "assessment_candidate",
+            sa.Column("assessment_candidate_id", UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "assessment_id",
+                UUID(as_uuid=True),
+                sa.ForeignKey("assessment.assessment_id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column(
+                "candidate_uuid",
+                UUID(as_uuid=True),
+                sa.ForeignKey("candidate.candidate_uuid", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("status", sa.String(50), nullable=False, server_default="invited"),
+            sa.Column("score", sa.Float),
+            sa.Column("submitted_at", sa.TIMESTAMP(timezone=True)),
+            sa.Column("is_feedback", sa.Text),
+            sa.Column("invited_date", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.Column("session_jti", sa.String(255)),
+            sa.Column("invite_token", sa.String(255), unique=True),
+            sa.Column("invite_expiry", sa.TIMESTAMP(timezone=True), nullable=False, server_default=_invite_expiry_default()),
+            sa.UniqueConstraint("assessment_id", "candidate_uuid", name="uq_assessment_candidate_link"),
+        )
+
+
+def downgrade():
+    for table in ("assessment_candidate", "candidate", "assessment", "sessions", "vendors", "users"):
+        op.drop_table(table)
@@ -0,0 +1,84 @@
+"""indexes for hot filters
+
+Built with CREATE INDEX CONCURRENTLY on Postgres, outside the migration
+transaction, so assessment/assessment_candidate/sessions stay writable
+while they build. A concurrent build that failed part-way leaves an INVALID
+index behind; it is dropped and rebuilt rather than skipped by IF NOT EXISTS.
+
+Not added because an existing index already serves the lookup:
+  assessment_candidate(assessment_id, ...)  leading column of the new
+      (assessment_id, invited_date, assessment_candidate_id) index and of
+      uq_assessment_candidate_link
+  assessment_candidate(invite_token)  unique constraint, already indexed
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns) -- kept in step with the models' index definitions
+INDEXES = (
+    # dashboard: a vendor's assessments, oldest first
+    ("ix_assessment_vendor_id_created_at", "assessment", ("vendor_id", "created_at")),
+    # candidate pages / export: keyset order within an assessment
+    (
+        "ix_assessment_candidate_assessment_invited",
+        "assessment_candidate",
+        ("assessment_id", "invited_date", "assessment_candidate_id"),
+    ),
+    # candidate -> assessments, and the FK's ON DELETE CASCADE from candidate
+    ("ix_assessment_candidate_candidate_uuid", "assessment_candidate", ("candidate_uuid",)),
+    ("ix_sessions_vendor_id", "sessions", ("vendor_id",)),
+    ("ix_sessions_user_id", "sessions", ("user_id",)),
+    # expired-session sweeps
+    ("ix_sessions_expires_at", "sessions", ("expires_at",)),
+)
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _drop_if_invalid(name: str):
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True)
+
+
+def upgrade():
+    if not _is_postgres():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, list(columns), if_not_exists=True)
+        return
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            _drop_if_invalid(name)
+            op.create_index(name, table, list(columns), postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade():
+    if not _is_postgres():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, if_exists=True)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,58 @@
+"""sessions.token_key
+
+Adds the fixed-size session key (jti, or sha256 of legacy tokens) with its
+unique index, built CONCURRENTLY on Postgres, and makes the old full-JWT
+token column nullable since new rows no longer store it.
+
+Rollout:
+  1. alembic upgrade 0003
+  2. python scripts/fill_sessions_token_key.py   (existing rows)
+  3. deploy the code that reads/writes token_key
+  4. python scripts/fill_sessions_token_key.py   (rows old workers wrote meanwhile)
+  5. alembic upgrade head                        (0004 drops the token index)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("sessions", sa.Column("token_key", sa.String(64), nullable=True))
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index("ix_sessions_token_key", "sessions", ["token_key"], unique=True)
+        with op.batch_alter_table("sessions") as batch:
+            batch.alter_column("token", existing_type=sa.String, nullable=True)
+        return
+
+    op.alter_column("sessions", "token", existing_type=sa.String, nullable=True)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_sessions_token_key",
+            "sessions",
+            ["token_key"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        op.drop_index("ix_sessions_token_key", table_name="sessions")
+        op.drop_column("sessions", "token_key")
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_sessions_token_key", table_name="sessions", postgresql_concurrently=True, if_exists=True)
+    # rows created without a token can't satisfy NOT NULL again
+    op.execute("DELETE FROM sessions WHERE token IS NULL")
+    op.alter_column("sessions", "token", existing_type=sa.String, nullable=False)
+    op.drop_column("sessions", "token_key")
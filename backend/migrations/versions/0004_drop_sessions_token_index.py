@@ -0,0 +1,48 @@
+"""drop the full-JWT sessions.token index
+
+Sessions are looked up by token_key since 0003; the unique index over whole
+JWTs is dead weight. Refuses to run while rows still lack token_key (run
+scripts/fill_sessions_token_key.py first), since those sessions would
+become unreachable.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not op.get_context().as_sql:
+        missing = op.get_bind().execute(sa.text("SELECT count(*) FROM sessions WHERE token_key IS NULL")).scalar()
+        if missing:
+            raise RuntimeError(
+                f"{missing} sessions have no token_key; run scripts/fill_sessions_token_key.py first"
+            )
+
+    if op.get_bind().dialect.name != "postgresql":
+        op.drop_index("ix_sessions_token", table_name="sessions", if_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_sessions_token", table_name="sessions", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index("ix_sessions_token", "sessions", ["token"], unique=True, if_not_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_sessions_token",
+            "sessions",
+            ["token"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,27 @@
+"""assessment.version
+
+Change counter behind the ETags of /vendor/dashboard and
+/vendor/assessment/{id}: bumped by every write to an assessment, its
+candidate links or a linked candidate. A constant default makes the
+column add metadata-only on Postgres 11+ (no table rewrite).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("assessment", sa.Column("version", sa.Integer, nullable=False, server_default="1"))
+
+
+def downgrade():
+    with op.batch_alter_table("assessment") as batch:
+        batch.drop_column("version")
@@ -0,0 +1,50 @@
+"""assessment candidate counters
+
+Per-assessment totals of linked candidates (all, and per status) so the
+dashboard and /vendor/assessments/summary never count assessment_candidate
+rows. The columns are backfilled with one set-based UPDATE; on very large
+tables, upgrade with COUNTERS_BACKFILL=0 and run
+scripts/reconcile_assessment_counters.py instead (it works in batches).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+COUNTERS = {
+    "candidates_total": None,
+    "invited_count": "invited",
+    "interviewed_count": "interviewed",
+    "shortlisted_count": "shortlisted",
+    "rejected_count": "rejected",
+}
+
+
+def upgrade():
+    for column in COUNTERS:
+        op.add_column("assessment", sa.Column(column, sa.Integer, nullable=False, server_default="0"))
+
+    if os.getenv("COUNTERS_BACKFILL", "1").strip().lower() not in ("1", "true", "yes", "on"):
+        return
+    assignments = []
+    for column, status in COUNTERS.items():
+        where = "ac.assessment_id = assessment.assessment_id"
+        if status:
+            where += f" AND ac.status = '{status}'"
+        assignments.append(f"{column} = (SELECT count(*) FROM assessment_candidate ac WHERE {where})")
+    op.execute(f"UPDATE assessment SET {', '.join(assignments)}")
+
+
+def downgrade():
+    with op.batch_alter_table("assessment") as batch:
+        for column in reversed(list(COUNTERS)):
+            batch.drop_column(column)
@@ -0,0 +1,134 @@
+"""search indexes
+
+Indexes behind /vendor/search/candidates and /vendor/search/assessments
+(repository.search).
+
+PostgreSQL: pg_trgm GIN indexes, which serve both ILIKE '%q%' and the
+fuzzy word-similarity operator (<%). Built CONCURRENTLY outside the
+migration transaction, like 0002; an INVALID leftover from a failed build
+is dropped and rebuilt. CREATE EXTENSION needs a role allowed to create
+it (pg_trgm is a trusted extension from Postgres 13 on).
+
+SQLite (local testing): FTS5 tables kept in step with candidate and
+assessment by triggers. candidate_fts uses candidate.id as its rowid;
+assessment has no integer key (its implicit rowid may change on VACUUM),
+so assessment_fts indexes assessment_id as a column and its triggers
+find the old row with an indexed MATCH on it; searches are restricted
+to the text columns.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# (name, table, column) -- trigram GIN index per searched column
+TRGM_INDEXES = (
+    ("ix_candidate_name_trgm", "candidate", "name"),
+    ("ix_candidate_email_trgm", "candidate", "email"),
+    ("ix_candidate_phone_trgm", "candidate", "phone"),
+    ("ix_assessment_title_trgm", "assessment", "title"),
+    ("ix_assessment_skills_trgm", "assessment", "skills"),
+    ("ix_assessment_description_trgm", "assessment", "description"),
+)
+
+SQLITE_UPGRADE = (
+    "CREATE VIRTUAL TABLE candidate_fts USING fts5("
+    "name, email, phone, tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER candidate_fts_ai AFTER INSERT ON candidate BEGIN "
+    "INSERT INTO candidate_fts (rowid, name, email, phone) VALUES (new.id, new.name, new.email, new.phone); END",
+    "CREATE TRIGGER candidate_fts_ad AFTER DELETE ON candidate BEGIN "
+    "DELETE FROM candidate_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER candidate_fts_au AFTER UPDATE OF id, name, email, phone ON candidate BEGIN "
+    "DELETE FROM candidate_fts WHERE rowid = old.id; "
+    "INSERT INTO candidate_fts (rowid, name, email, phone) VALUES (new.id, new.name, new.email, new.phone); END",
+    "INSERT INTO candidate_fts (rowid, name, email, phone) SELECT id, name, email, phone FROM candidate",
+    "CREATE VIRTUAL TABLE assessment_fts USING fts5("
+    "assessment_id, title, description, skills, tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER assessment_fts_ai AFTER INSERT ON assessment BEGIN "
+    "INSERT INTO assessment_fts (assessment_id, title, description, skills) "
+    "VALUES (new.assessment_id, new.title, new.description, new.skills); END",
+    "CREATE TRIGGER assessment_fts_ad AFTER DELETE ON assessment BEGIN "
+    "DELETE FROM assessment_fts WHERE assessment_fts MATCH 'assessment_id:\"' || old.assessment_id || '\"'; END",
+    "CREATE TRIGGER assessment_fts_au AFTER UPDATE OF assessment_id, title, description, skills ON assessment BEGIN "
+    "DELETE FROM assessment_fts WHERE assessment_fts MATCH 'assessment_id:\"' || old.assessment_id || '\"'; "
+    "INSERT INTO assessment_fts (assessment_id, title, description, skills) "
+    "VALUES (new.assessment_id, new.title, new.description, new.skills); END",
+    "INSERT INTO assessment_fts (assessment_id, title, description, skills) "
+    "SELECT assessment_id, title, description, skills FROM assessment",
+)
+
+SQLITE_DOWNGRADE = (
+    "DROP TRIGGER IF EXISTS assessment_fts_au",
+    "DROP TRIGGER IF EXISTS assessment_fts_ad",
+    "DROP TRIGGER IF EXISTS assessment_fts_ai",
+    "DROP TABLE IF EXISTS assessment_fts",
+    "DROP TRIGGER IF EXISTS candidate_fts_au",
+    "DROP TRIGGER IF EXISTS candidate_fts_ad",
+    "DROP TRIGGER IF EXISTS candidate_fts_ai",
+    "DROP TABLE IF EXISTS candidate_fts",
+)
+
+
+def _dialect() -> str:
+    return op.get_bind().dialect.name
+
+
+def _drop_if_invalid(name: str):
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True)
+
+
+def upgrade():
+    dialect = _dialect()
+    if dialect == "sqlite":
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+        return
+    if dialect != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column in TRGM_INDEXES:
+            _drop_if_invalid(name)
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    dialect = _dialect()
+    if dialect == "sqlite":
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+        return
+    if dialect != "postgresql":
+        return
+
+    # pg_trgm itself is left installed: other schemas may use it
+    with op.get_context().autocommit_block():
+        for name, table, _ in TRGM_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
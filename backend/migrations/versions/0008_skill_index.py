@@ -0,0 +1,53 @@
+"""normalized skill index
+
+skill: the normalized skill vocabulary. assessment_skill: which skills each
+assessment needs, keyed (assessment_id, skill_id) with a (skill_id,
+assessment_id) index as the inverted index for /vendor/assessments/match.
+assessment.skill_count: distinct skills per assessment, for the Jaccard
+score. New tables and a constant-default column: no table rewrite.
+
+Existing assessments are not indexed here; the free-text skills need the
+application's parser and alias table. Run
+scripts/backfill_assessment_skills.py after upgrading.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "skill",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False, unique=True),
+    )
+    op.create_table(
+        "assessment_skill",
+        sa.Column(
+            "assessment_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("assessment.assessment_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("skill_id", sa.Integer, sa.ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True),
+    )
+    op.create_index("ix_assessment_skill_skill_id", "assessment_skill", ["skill_id", "assessment_id"])
+    op.add_column("assessment", sa.Column("skill_count", sa.Integer, nullable=False, server_default="0"))
+
+
+def downgrade():
+    # not batch mode: rebuilding assessment on SQLite would drop the 0007
+    # FTS triggers (native DROP COLUMN needs SQLite 3.35+)
+    op.drop_column("assessment", "skill_count")
+    op.drop_index("ix_assessment_skill_skill_id", table_name="assessment_skill")
+    op.drop_table("assessment_skill")
+    op.drop_table("skill")
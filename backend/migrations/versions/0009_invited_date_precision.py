@@ -0,0 +1,33 @@
+"""invited_date precision (SQLite)
+
+On SQLite, links inserted with the server default got invited_date from
+CURRENT_TIMESTAMP ('YYYY-MM-DD HH:MM:SS'), while the keyset cursor binds
+its bound with microseconds ('... HH:MM:SS.ffffff'). Compared as text the
+shorter value sorts first, so rows sharing the cursor's second were
+skipped. Pad those values to the format SQLAlchemy writes; the
+application now sets invited_date itself. Nothing to do on PostgreSQL.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute(
+        "UPDATE assessment_candidate SET invited_date = invited_date || '.000000' "
+        "WHERE length(invited_date) = 19"
+    )
+
+
+def downgrade():
+    # the padded values are equal timestamps; nothing to undo
+    pass
@@ -0,0 +1,177 @@
+"""unique candidate email and assessment link
+
+The add-candidate and import upserts rely on two unique indexes:
+  ix_candidate_email            UNIQUE (email)
+  uq_assessment_candidate_link  UNIQUE (assessment_id, candidate_uuid)
+A database created by 0001 has both; one created by the old start-up
+create_all (whose tables 0001 leaves alone) may have neither, and may hold
+emails that differ only in case or surrounding spaces and duplicate links.
+
+So, in the migration transaction: candidates sharing a normalized email
+are merged into the one with the lowest id (their links move to it),
+emails are trimmed and lower-cased, duplicate links are dropped (the
+earliest invite stays), and the counters (0006) of every assessment
+touched are recounted and its version bumped. Then the indexes are built;
+on Postgres CONCURRENTLY outside the transaction like 0002, dropping an
+INVALID leftover of a failed build, or a non-unique index of the same
+name, first.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns)
+UNIQUE_INDEXES = (
+    ("ix_candidate_email", "candidate", ("email",)),
+    ("uq_assessment_candidate_link", "assessment_candidate", ("assessment_id", "candidate_uuid")),
+)
+
+# kept in step with 0006
+COUNTERS = {
+    "candidates_total": None,
+    "invited_count": "invited",
+    "interviewed_count": "interviewed",
+    "shortlisted_count": "shortlisted",
+    "rejected_count": "rejected",
+}
+
+# later of two links to the same (assessment, candidate)
+_DUPLICATE_LINK = (
+    "o.assessment_id = ac.assessment_id AND o.candidate_uuid = ac.candidate_uuid "
+    "AND (ac.invited_date, ac.assessment_candidate_id) > (o.invited_date, o.assessment_candidate_id)"
+)
+
+POSTGRES_CLEANUP = (
+    # candidates sharing a normalized email -> the one with the lowest id wins
+    "CREATE TEMP TABLE candidate_merge ON COMMIT DROP AS "
+    "SELECT c.candidate_uuid AS loser, k.candidate_uuid AS keeper FROM candidate c JOIN ("
+    "SELECT DISTINCT ON (lower(trim(email))) lower(trim(email)) AS norm, candidate_uuid FROM candidate "
+    "ORDER BY lower(trim(email)), id"
+    ") k ON k.norm = lower(trim(c.email)) WHERE c.candidate_uuid <> k.candidate_uuid",
+    "CREATE TEMP TABLE touched_assessment (assessment_id uuid PRIMARY KEY) ON COMMIT DROP",
+    "INSERT INTO touched_assessment SELECT DISTINCT ac.assessment_id "
+    "FROM assessment_candidate ac JOIN candidate_merge m ON ac.candidate_uuid = m.loser",
+    # a merged candidate's link to an assessment its keeper is already on
+    "DELETE FROM assessment_candidate ac USING candidate_merge m, assessment_candidate k "
+    "WHERE ac.candidate_uuid = m.loser AND k.candidate_uuid = m.keeper AND k.assessment_id = ac.assessment_id",
+    "UPDATE assessment_candidate ac SET candidate_uuid = m.keeper FROM candidate_merge m "
+    "WHERE ac.candidate_uuid = m.loser",
+    "DELETE FROM candidate c USING candidate_merge m WHERE c.candidate_uuid = m.loser",
+    "UPDATE candidate SET email = lower(trim(email)) WHERE email <> lower(trim(email))",
+    "INSERT INTO touched_assessment SELECT DISTINCT ac.assessment_id "
+    f"FROM assessment_candidate ac JOIN assessment_candidate o ON {_DUPLICATE_LINK} ON CONFLICT DO NOTHING",
+    f"DELETE FROM assessment_candidate ac USING assessment_candidate o WHERE {_DUPLICATE_LINK}",
+)
+
+SQLITE_CLEANUP = (
+    "CREATE TEMP TABLE candidate_merge AS "
+    "SELECT c.candidate_uuid AS loser, ("
+    "SELECT k.candidate_uuid FROM candidate k WHERE lower(trim(k.email)) = lower(trim(c.email)) "
+    "ORDER BY k.id LIMIT 1"
+    ") AS keeper FROM candidate c WHERE EXISTS ("
+    "SELECT 1 FROM candidate k WHERE lower(trim(k.email)) = lower(trim(c.email)) AND k.id < c.id)",
+    "CREATE TEMP TABLE touched_assessment (assessment_id PRIMARY KEY)",
+    "INSERT OR IGNORE INTO touched_assessment SELECT ac.assessment_id "
+    "FROM assessment_candidate ac JOIN candidate_merge m ON ac.candidate_uuid = m.loser",
+    "DELETE FROM assessment_candidate WHERE EXISTS ("
+    "SELECT 1 FROM candidate_merge m JOIN assessment_candidate k ON k.candidate_uuid = m.keeper "
+    "WHERE m.loser = assessment_candidate.candidate_uuid AND k.assessment_id = assessment_candidate.assessment_id)",
+    "UPDATE assessment_candidate SET candidate_uuid = ("
+    "SELECT keeper FROM candidate_merge WHERE loser = assessment_candidate.candidate_uuid"
+    ") WHERE candidate_uuid IN (SELECT loser FROM candidate_merge)",
+    "DELETE FROM candidate WHERE candidate_uuid IN (SELECT loser FROM candidate_merge)",
+    "UPDATE candidate SET email = lower(trim(email)) WHERE email <> lower(trim(email))",
+    "INSERT OR IGNORE INTO touched_assessment SELECT ac.assessment_id FROM assessment_candidate ac "
+    f"WHERE EXISTS (SELECT 1 FROM assessment_candidate o WHERE {_DUPLICATE_LINK})",
+    "DELETE FROM assessment_candidate AS ac "
+    f"WHERE EXISTS (SELECT 1 FROM assessment_candidate o WHERE {_DUPLICATE_LINK})",
+)
+
+
+def _recount_touched() -> str:
+    assignments = ["version = version + 1"]
+    for column, status in COUNTERS.items():
+        where = "ac.assessment_id = assessment.assessment_id"
+        if status:
+            where += f" AND ac.status = '{status}'"
+        assignments.append(f"{column} = (SELECT count(*) FROM assessment_candidate ac WHERE {where})")
+    return (
+        f"UPDATE assessment SET {', '.join(assignments)} "
+        "WHERE assessment_id IN (SELECT assessment_id FROM touched_assessment)"
+    )
+
+
+def _index_state(name: str):
+    """(valid, unique) of the Postgres index name, or None if there is none."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid, i.indisunique FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name"
+        ),
+        {"name": name},
+    ).first()
+
+
+def _postgres_indexes():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in UNIQUE_INDEXES:
+            if not op.get_context().as_sql:
+                state = _index_state(name)
+                if state is not None and not (state.indisvalid and state.indisunique):
+                    op.drop_index(name, postgresql_concurrently=True)
+            op.create_index(
+                name, table, list(columns), unique=True, postgresql_concurrently=True, if_not_exists=True
+            )
+        # the link index also backs the named constraint of 0001's schema
+        op.execute(
+            "DO $$ BEGIN "
+            "IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_assessment_candidate_link') THEN "
+            "ALTER TABLE assessment_candidate "
+            "ADD CONSTRAINT uq_assessment_candidate_link UNIQUE USING INDEX uq_assessment_candidate_link; "
+            "END IF; END $$"
+        )
+
+
+def _sqlite_indexes():
+    inspector = None if op.get_context().as_sql else sa.inspect(op.get_bind())
+    for name, table, columns in UNIQUE_INDEXES:
+        if inspector is not None:
+            # 0001's link constraint is an unnamed sqlite_autoindex
+            unique = [tuple(u["column_names"]) for u in inspector.get_unique_constraints(table)]
+            unique += [tuple(i["column_names"]) for i in inspector.get_indexes(table) if i["unique"]]
+            if tuple(columns) in unique:
+                continue
+            if any(i["name"] == name for i in inspector.get_indexes(table)):
+                op.drop_index(name, table_name=table)
+        op.create_index(name, table, list(columns), unique=True, if_not_exists=True)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRES_CLEANUP:
+            op.execute(statement)
+        op.execute(_recount_touched())
+        _postgres_indexes()
+    elif dialect == "sqlite":
+        for statement in SQLITE_CLEANUP:
+            op.execute(statement)
+        op.execute(_recount_touched())
+        op.execute("DROP TABLE candidate_merge")
+        op.execute("DROP TABLE touched_assessment")
+        _sqlite_indexes()
+
+
+def downgrade():
+    # merged candidates cannot be split again, and 0001's schema has both
+    # indexes: nothing to undo
+    pass
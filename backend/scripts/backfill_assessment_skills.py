@@ -0,0 +1,51 @@
+# backend/scripts/backfill_assessment_skills.py
+#
+# Build the normalized skill index (migration 0008) for assessments created
+# before it existed: parses assessment.skills, adds unknown skills to the
+# vocabulary and writes assessment_skill rows, in batches, one transaction
+# each. Assessments already indexed are skipped, so it is safe to stop and
+# re-run; --all re-indexes everything (e.g. after changing SKILL_ALIASES).
+# Finishes with ANALYZE so the planner can start vendor-scoped matches from
+# the vendor's assessments instead of whole posting lists.
+#
+#   cd backend
+#   python scripts/backfill_assessment_skills.py --batch-size 500
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from app import db  # noqa: E402
+from app import repository as crud  # noqa: E402
+
+
+async def run(batch_size: int, only_missing: bool) -> int:
+    try:
+        async with db.AsyncSessionLocal() as session:
+            indexed = await crud.backfill_assessment_skills(session, batch_size=batch_size, only_missing=only_missing)
+            for table in ("skill", "assessment_skill"):
+                await session.execute(text(f"ANALYZE {table}"))
+            await session.commit()
+            return indexed
+    finally:
+        await db.dispose_engines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index assessment skills into skill / assessment_skill.")
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("BATCH_SIZE", "500")))
+    parser.add_argument("--all", action="store_true", help="re-index assessments that already have skill rows")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    indexed = asyncio.run(run(args.batch_size, only_missing=not args.all))
+    print(f"Indexed {indexed} assessments in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# backend/scripts/reconcile_assessment_counters.py
+#
+# Repair drift in the per-assessment candidate counters (migration 0006):
+# recounts assessment_candidate in batches and rewrites only the counters
+# that disagree. Safe while the app is serving (see
+# repository.reconcile_candidate_counters for the locking) and safe to
+# re-run; schedule it from cron, e.g. nightly:
+#
+#   cd backend
+#   python scripts/reconcile_assessment_counters.py --batch-size 500
+#   python scripts/reconcile_assessment_counters.py --assessment <uuid> --assessment <uuid>
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import db  # noqa: E402
+from app import repository as crud  # noqa: E402
+
+
+async def run(assessment_ids, batch_size: int) -> int:
+    try:
+        async with db.AsyncSessionLocal() as session:
+            return await crud.reconcile_candidate_counters(session, assessment_ids, batch_size=batch_size)
+    finally:
+        await db.dispose_engines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recount assessment candidate counters and fix drift.")
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("BATCH_SIZE", "500")))
+    parser.add_argument("--assessment", action="append", type=uuid.UUID, help="only this assessment (repeatable)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    repaired = asyncio.run(run(args.assessment, args.batch_size))
+    print(f"Repaired {repaired} assessments in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
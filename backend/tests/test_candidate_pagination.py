@@ -0,0 +1,51 @@
+# backend/tests/test_candidate_pagination.py
+import pytest
+
+from conftest import create_assessment, import_candidates
+
+pytestmark = pytest.mark.anyio
+
+
+async def _walk(client, url: str, limit: int) -> list:
+    """Follow next_cursor to the end; returns every page's candidates in order."""
+    seen, cursor = [], None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert len(body["candidates"]) <= limit
+        seen.extend(body["candidates"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+async def test_pages_return_every_candidate_exactly_once(client, vendor):
+    assessment_id = await create_assessment(client)
+    # several imports, so links share an invited_date within and across batches
+    emails = []
+    for _ in range(3):
+        emails += await import_candidates(client, assessment_id, 17)
+
+    for limit in (1, 5, 50):
+        seen = await _walk(client, f"/vendor/assessment/{assessment_id}/candidates", limit)
+        assert sorted(c["email"] for c in seen) == sorted(emails)
+        uuids = [c["candidate_uuid"] for c in seen]
+        assert len(set(uuids)) == len(uuids) == len(emails)
+
+
+async def test_paginated_assessment_detail_walks_all_pages(client, vendor):
+    assessment_id = await create_assessment(client)
+    emails = await import_candidates(client, assessment_id, 23)
+
+    seen = await _walk(client, f"/vendor/assessment/{assessment_id}", 4)
+    assert sorted(c["email"] for c in seen) == sorted(emails)
+
+
+async def test_malformed_cursor_is_rejected(client, vendor):
+    assessment_id = await create_assessment(client)
+    response = await client.get(f"/vendor/assessment/{assessment_id}/candidates", params={"cursor": "nope"})
+    assert response.status_code == 400
@@ -0,0 +1,126 @@
+# backend/tests/test_candidate_status.py
+#
+# POST /vendor/assessment/{id}/candidates/status: per-item outcomes, the
+# counters and version it moves, and the limits on the batch.
+import uuid
+
+import pytest
+
+from conftest import create_assessment, fetch_assessment, import_candidates, register_vendor
+
+pytestmark = pytest.mark.anyio
+
+
+async def _candidates(client, assessment_id: str) -> list:
+    response = await client.get(f"/vendor/assessment/{assessment_id}/candidates", params={"limit": 100})
+    assert response.status_code == 200, response.text
+    return response.json()["candidates"]
+
+
+async def _batch(client, assessment_id: str, updates: list):
+    return await client.post(f"/vendor/assessment/{assessment_id}/candidates/status", json={"updates": updates})
+
+
+async def test_mixed_batch_reports_each_item_and_moves_counters(client, vendor):
+    # a candidate linked only to another vendor's assessment
+    await register_vendor(client)
+    theirs = await create_assessment(client, "Their role")
+    await import_candidates(client, theirs, 1)
+    foreign = (await _candidates(client, theirs))[0]["candidate_uuid"]
+
+    await register_vendor(client)
+    assessment_id = await create_assessment(client)
+    await import_candidates(client, assessment_id, 4)
+    a, b, c, d = [row["candidate_uuid"] for row in await _candidates(client, assessment_id)]
+    detail = f"/vendor/assessment/{assessment_id}"
+    etag = (await client.get(detail)).headers["ETag"]
+    before = await fetch_assessment(assessment_id)
+
+    response = await _batch(client, assessment_id, [
+        {"candidate_uuid": a, "status": "shortlisted"},
+        {"candidate_uuid": b, "status": " Interview "},
+        {"candidate_uuid": c, "status": "invited"},
+        {"candidate_uuid": a, "status": "rejected"},
+        {"candidate_uuid": d, "status": "hired"},
+        {"candidate_uuid": "not-a-uuid", "status": "rejected"},
+        {"candidate_uuid": str(uuid.uuid4()), "status": "rejected"},
+        {"candidate_uuid": foreign, "status": "rejected"},
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [r["outcome"] for r in body["results"]] == [
+        "updated", "updated", "unchanged", "duplicate", "error", "error", "not_found", "not_found",
+    ]
+    assert body["results"][1]["status"] == "interviewed"
+    assert body["results"][1]["previous_status"] == "invited"
+    assert body["summary"] == {
+        "total": 8, "updated": 2, "unchanged": 1, "not_found": 2, "duplicates": 1, "errors": 2,
+    }
+
+    statuses = {row["candidate_uuid"]: row["status"] for row in await _candidates(client, assessment_id)}
+    assert statuses == {a: "shortlisted", b: "interviewed", c: "invited", d: "invited"}
+
+    after = await fetch_assessment(assessment_id)
+    assert after.candidates_total == before.candidates_total == 4
+    assert after.invited_count == before.invited_count - 2 == 2
+    assert after.interviewed_count == before.interviewed_count + 1
+    assert after.shortlisted_count == before.shortlisted_count + 1
+    assert after.rejected_count == before.rejected_count == 0
+    # one version bump for the whole batch
+    assert after.version == before.version + 1
+    response = await client.get(detail, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # the other vendor's link is untouched
+    other = await fetch_assessment(theirs)
+    assert (other.invited_count, other.rejected_count) == (1, 0)
+
+
+async def test_batch_without_changes_keeps_version(client, vendor):
+    assessment_id = await create_assessment(client)
+    await import_candidates(client, assessment_id, 2)
+    uuids = [row["candidate_uuid"] for row in await _candidates(client, assessment_id)]
+    before = await fetch_assessment(assessment_id)
+
+    response = await _batch(client, assessment_id, [{"candidate_uuid": u, "status": "invited"} for u in uuids])
+    assert response.status_code == 200, response.text
+    assert response.json()["summary"]["unchanged"] == 2
+
+    assert (await fetch_assessment(assessment_id)).version == before.version
+
+
+async def test_batch_on_another_vendors_assessment_is_not_found(client, vendor):
+    theirs = await create_assessment(client, "Their role")
+    await import_candidates(client, theirs, 1)
+    candidate = (await _candidates(client, theirs))[0]["candidate_uuid"]
+    before = await fetch_assessment(theirs)
+
+    await register_vendor(client)
+    response = await _batch(client, theirs, [{"candidate_uuid": candidate, "status": "rejected"}])
+    assert response.status_code == 404
+
+    after = await fetch_assessment(theirs)
+    assert (after.version, after.rejected_count) == (before.version, 0)
+
+
+async def test_batch_size_limits(client, vendor):
+    from app.routers.vendor_router import MAX_STATUS_UPDATES
+
+    assessment_id = await create_assessment(client)
+    await import_candidates(client, assessment_id, 1)
+    candidate = (await _candidates(client, assessment_id))[0]["candidate_uuid"]
+
+    response = await _batch(client, assessment_id, [])
+    assert response.status_code == 400
+
+    too_many = [{"candidate_uuid": candidate, "status": "rejected"}] * (MAX_STATUS_UPDATES + 1)
+    response = await _batch(client, assessment_id, too_many)
+    assert response.status_code == 413
+    assert (await fetch_assessment(assessment_id)).rejected_count == 0
+
+    # the limit itself is accepted (the repeats are duplicates)
+    response = await _batch(client, assessment_id, too_many[:MAX_STATUS_UPDATES])
+    assert response.status_code == 200, response.text
+    summary = response.json()["summary"]
+    assert (summary["updated"], summary["duplicates"]) == (1, MAX_STATUS_UPDATES - 1)
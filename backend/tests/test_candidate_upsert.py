@@ -0,0 +1,63 @@
+# backend/tests/test_candidate_upsert.py
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from conftest import create_assessment
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_upsert_writes_only_changed_rows(client):
+    from app import db, models
+    from app.repository.candidates import candidate_upsert_statement
+
+    C = models.Candidate
+    tag = uuid.uuid4().hex[:8]
+    a, b = f"a-{tag}@example.com", f"b-{tag}@example.com"
+
+    async with db.AsyncSessionLocal() as session:
+        # duplicates collapse to the first row; output is in email order
+        stmt = candidate_upsert_statement(session, [
+            {"name": "B", "email": b.upper(), "phone": "1"},
+            {"name": "A", "email": a},
+            {"name": "B again", "email": b, "phone": "2"},
+        ]).returning(C.email, C.name, C.phone)
+        assert sorted((await session.execute(stmt)).all()) == [(a, "A", None), (b, "B", "1")]
+
+        # nothing differs: DO UPDATE is skipped and RETURNING is empty
+        stmt = candidate_upsert_statement(session, [
+            {"name": "A", "email": a},
+            {"name": "B", "email": b, "phone": "1"},
+        ]).returning(C.email)
+        assert (await session.execute(stmt)).all() == []
+
+        stmt = candidate_upsert_statement(session, [
+            {"name": "A", "email": a, "resume_path": "/cv.pdf"},
+            {"name": "B", "email": b, "phone": "1"},
+        ]).returning(C.email)
+        assert (await session.execute(stmt)).scalars().all() == [a]
+        assert (await session.execute(select(C.resume_path).where(C.email == a))).scalar() == "/cv.pdf"
+        await session.rollback()
+
+
+async def test_reimport_of_unchanged_candidates(client, vendor):
+    assessment_id = await create_assessment(client)
+    rows = [{"name": f"C {i}", "email": f"c{i}-{uuid.uuid4().hex[:8]}@example.com"} for i in range(5)]
+    url = f"/vendor/assessment/{assessment_id}/import-candidates"
+
+    first = (await client.post(url, json=rows)).json()["results"]
+    again = (await client.post(url, json=list(reversed(rows)))).json()
+
+    assert again["summary"] == {"total": 5, "created": 0, "updated": 5, "duplicates": 0, "errors": 0, "linked": 0}
+    # results stay in input order, with the existing candidates' uuids
+    by_email = {r["email"]: r["candidate_uuid"] for r in first}
+    assert [r["email"] for r in again["results"]] == [r["email"] for r in reversed(rows)]
+    assert all(r["candidate_uuid"] == by_email[r["email"]] for r in again["results"])
+
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/add-candidate", json={"name": "C 0", "email": rows[0]["email"]}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["candidate"]["candidate_uuid"] == by_email[rows[0]["email"]]
@@ -0,0 +1,131 @@
+# backend/tests/test_counters.py
+#
+# Per-assessment candidate counters (migration 0006) and the version bump
+# that comes with every link / status write.
+import uuid
+
+import pytest
+
+from conftest import create_assessment, fetch_assessment, import_candidates
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_link_and_status_writes_keep_updated_at(client, vendor):
+    assessment_id = await create_assessment(client)
+    created = await fetch_assessment(assessment_id)
+
+    await import_candidates(client, assessment_id, 3)
+    page = (await client.get(f"/vendor/assessment/{assessment_id}/candidates")).json()["candidates"]
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/candidate/{page[0]['candidate_uuid']}/status",
+        json={"status": "shortlisted"},
+    )
+    assert response.status_code == 200, response.text
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/candidates/status",
+        json={"updates": [{"candidate_uuid": page[1]["candidate_uuid"], "status": "rejected"}]},
+    )
+    assert response.status_code == 200, response.text
+
+    stored = await fetch_assessment(assessment_id)
+    assert stored.version > created.version
+    # links and statuses are not edits of the assessment
+    assert stored.updated_at == created.updated_at
+
+
+async def _assert_counters_match_links(assessment_id: str):
+    from sqlalchemy import func, select
+
+    from app import db, models
+
+    AC = models.AssessmentCandidate
+    async with db.AsyncSessionLocal() as session:
+        counted = dict(
+            (await session.execute(
+                select(AC.status, func.count())
+                .where(AC.assessment_id == uuid.UUID(assessment_id))
+                .group_by(AC.status)
+            )).all()
+        )
+    stored = await fetch_assessment(assessment_id)
+    assert stored.candidates_total == sum(counted.values())
+    for status in ("invited", "interviewed", "shortlisted", "rejected"):
+        assert getattr(stored, f"{status}_count") == counted.get(status, 0), status
+
+
+async def test_counters_equal_link_counts_after_each_write(client, vendor):
+    assessment_id = await create_assessment(client)
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/add-candidate",
+        json={"name": "Solo", "email": f"solo-{uuid.uuid4().hex[:8]}@example.com"},
+    )
+    assert response.status_code == 200, response.text
+    await _assert_counters_match_links(assessment_id)
+
+    emails = await import_candidates(client, assessment_id, 5)
+    # importing the same rows again links nothing new
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/import-candidates",
+        json=[{"name": "Again", "email": email} for email in emails[:2]],
+    )
+    assert response.status_code == 200, response.text
+    await _assert_counters_match_links(assessment_id)
+    assert (await fetch_assessment(assessment_id)).candidates_total == 6
+
+    page = (await client.get(f"/vendor/assessment/{assessment_id}/candidates")).json()["candidates"]
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/candidate/{page[0]['candidate_uuid']}/status",
+        json={"status": "interviewed"},
+    )
+    assert response.status_code == 200, response.text
+    await _assert_counters_match_links(assessment_id)
+
+    response = await client.post(
+        f"/vendor/assessment/{assessment_id}/candidates/status",
+        json={"updates": [
+            {"candidate_uuid": page[0]["candidate_uuid"], "status": "shortlisted"},
+            {"candidate_uuid": page[1]["candidate_uuid"], "status": "rejected"},
+            {"candidate_uuid": page[2]["candidate_uuid"], "status": "rejected"},
+        ]},
+    )
+    assert response.status_code == 200, response.text
+    await _assert_counters_match_links(assessment_id)
+    stored = await fetch_assessment(assessment_id)
+    assert (stored.invited_count, stored.shortlisted_count, stored.rejected_count) == (3, 1, 2)
+
+
+async def test_reconcile_repairs_drifted_counters(client, vendor):
+    from sqlalchemy import update
+
+    from app import db, models
+    from app import repository as crud
+
+    drifted = await create_assessment(client, "Drifted")
+    await import_candidates(client, drifted, 3)
+    intact = await create_assessment(client, "Intact")
+    await import_candidates(client, intact, 2)
+    ids = [uuid.UUID(drifted), uuid.UUID(intact)]
+
+    A = models.Assessment
+    async with db.AsyncSessionLocal() as session:
+        await session.execute(
+            update(A)
+            .where(A.assessment_id == ids[0])
+            .values(candidates_total=7, invited_count=0, rejected_count=4, updated_at=A.updated_at)
+        )
+        await session.commit()
+    before = {aid: await fetch_assessment(aid) for aid in (drifted, intact)}
+
+    async with db.AsyncSessionLocal() as session:
+        assert await crud.reconcile_candidate_counters(session, ids, batch_size=1) == 1
+    await _assert_counters_match_links(drifted)
+    repaired = await fetch_assessment(drifted)
+    assert repaired.version == before[drifted].version + 1
+    assert repaired.updated_at == before[drifted].updated_at
+    assert (await fetch_assessment(intact)).version == before[intact].version
+
+    # a second pass (over every assessment) finds nothing to do for these
+    async with db.AsyncSessionLocal() as session:
+        await crud.reconcile_candidate_counters(session)
+    assert (await fetch_assessment(drifted)).version == repaired.version
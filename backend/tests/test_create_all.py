@@ -0,0 +1,43 @@
+# backend/tests/test_create_all.py
+#
+# DB_CREATE_ALL builds the schema with Base.metadata.create_all instead of
+# migrations; on SQLite that must work and the app must run on it (search
+# without the FTS tables falls back to LIKE scans).
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_all_schema_on_sqlite(tmp_path):
+    from app import models
+    from app import repository as crud
+    from app.db import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'create_all.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            vendor = await crud.create_vendor(session, "Acme", "acme@example.com", "s3cret-pass")
+            assessment = models.Assessment(title="Backend Engineer", vendor_id=vendor.id)
+            session.add(assessment)
+            await session.commit()
+
+            candidate, linked = await crud.add_candidate_to_assessment(
+                session, assessment.assessment_id, "Jo Smith", "jo@example.com"
+            )
+            assert linked
+
+            link = (await session.execute(select(models.AssessmentCandidate))).scalar_one()
+            validity = link.invite_expiry - link.invited_date
+            assert abs(validity - models.assessment_candidate.INVITE_VALIDITY) < timedelta(seconds=5)
+
+            found = await crud.search_candidates(session, vendor.id, "smith")
+            assert [c.candidate_uuid for c, _ in found] == [candidate.candidate_uuid]
+    finally:
+        await engine.dispose()
@@ -0,0 +1,67 @@
+# backend/tests/test_etags.py
+import pytest
+
+from conftest import create_assessment, fetch_assessment, import_candidates, register_vendor
+
+pytestmark = pytest.mark.anyio
+
+
+async def _etag(client, url: str) -> str:
+    response = await client.get(url)
+    assert response.status_code == 200, response.text
+    return response.headers["ETag"]
+
+
+async def _import(client, assessment_id: str, rows: list):
+    response = await client.post(f"/vendor/assessment/{assessment_id}/import-candidates", json=rows)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_unchanged_shared_candidate_leaves_other_vendors_etags(client, vendor):
+    # another vendor has the same candidate on its assessment
+    other = await register_vendor(client)
+    theirs = await create_assessment(client, "Their role")
+    email = (await import_candidates(client, theirs, 1))[0]
+    their_detail = f"/vendor/assessment/{theirs}"
+    dashboard = await _etag(client, "/vendor/dashboard")
+    detail = await _etag(client, their_detail)
+
+    await register_vendor(client)
+    ours = await create_assessment(client, "Our role")
+    # linking (same name, no new phone / resume) does not change the candidate
+    await _import(client, ours, [{"name": "Candidate 0", "email": email}])
+    response = await client.post(
+        f"/vendor/assessment/{ours}/add-candidate", json={"name": "Candidate 0", "email": email}
+    )
+    assert response.status_code == 200, response.text
+
+    assert await _etag(client, their_detail) == detail
+    await client.post("/auth/vendor/login", json={"email": other["email"], "password": "s3cret-pass"})
+    assert await _etag(client, "/vendor/dashboard") == dashboard
+
+
+async def test_changed_shared_candidate_bumps_every_linked_assessment(client, vendor):
+    theirs = await create_assessment(client, "Their role")
+    email = (await import_candidates(client, theirs, 1))[0]
+    their_detail = f"/vendor/assessment/{theirs}"
+    before = await _etag(client, their_detail)
+    stored = await fetch_assessment(theirs)
+    # linking candidates is not an edit of the assessment
+    assert stored.updated_at is None
+
+    await register_vendor(client)
+    ours = await create_assessment(client, "Our role")
+    await _import(client, ours, [{"name": "Candidate 0", "email": email, "phone": "+1 555 0100"}])
+
+    after = await client.get(their_detail)
+    assert after.headers["ETag"] != before
+    assert after.json()["candidates"][0]["phone"] == "+1 555 0100"
+    # a candidate change is not an edit of the assessment
+    touched = await fetch_assessment(theirs)
+    assert touched.version > stored.version
+    assert touched.updated_at is None
+
+    # the same values again change nothing
+    await _import(client, ours, [{"name": "Candidate 0", "email": email, "phone": "+1 555 0100"}])
+    assert await _etag(client, their_detail) == after.headers["ETag"]
@@ -0,0 +1,75 @@
+# backend/tests/test_export.py
+#
+# GET /vendor/export: the streamed candidate pipeline, CSV and NDJSON.
+import csv
+import io
+import json
+
+import pytest
+
+from conftest import create_assessment, import_candidates, register_vendor
+
+pytestmark = pytest.mark.anyio
+
+
+async def _export(client, **params):
+    response = await client.get("/vendor/export", params=params)
+    assert response.status_code == 200, response.text
+    return response
+
+
+async def test_csv_export_has_header_and_one_row_per_link(client, vendor):
+    from app import repository as crud
+
+    first = await create_assessment(client, "First role")
+    second = await create_assessment(client, "Second role")
+    first_emails = await import_candidates(client, first, 2)
+    second_emails = await import_candidates(client, second, 1)
+
+    response = await _export(client, format="csv")
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == crud.PIPELINE_EXPORT_COLUMNS
+
+    records = [dict(zip(rows[0], row)) for row in rows[1:]]
+    assert sorted((r["assessment_title"], r["email"]) for r in records) == sorted(
+        [("First role", email) for email in first_emails] + [("Second role", email) for email in second_emails]
+    )
+    assert {r["assessment_id"] for r in records} == {first, second}
+    assert all(r["status"] == "invited" and r["name"].startswith("Candidate ") for r in records)
+
+    response = await _export(client, format="CSV", assessment_id=second)
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert [row[rows[0].index("email")] for row in rows[1:]] == second_emails
+
+
+async def test_export_spans_several_batches(client, vendor, monkeypatch):
+    from app.routers import vendor_router
+
+    # several yield_per batches and flushes for a handful of rows
+    monkeypatch.setattr(vendor_router, "EXPORT_BATCH_SIZE", 2)
+    assessment_id = await create_assessment(client)
+    emails = await import_candidates(client, assessment_id, 5)
+
+    response = await _export(client)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 5
+    assert sorted(r["email"] for r in records) == sorted(emails)
+    assert len({r["candidate_uuid"] for r in records}) == 5
+
+    rows = list(csv.reader(io.StringIO((await _export(client, format="csv")).text)))
+    assert len(rows) == 6
+
+
+async def test_export_of_another_vendors_assessment_is_not_found(client, vendor):
+    theirs = await create_assessment(client, "Their role")
+    await import_candidates(client, theirs, 1)
+
+    await register_vendor(client)
+    response = await client.get("/vendor/export", params={"format": "csv", "assessment_id": theirs})
+    assert response.status_code == 404
+
+    response = await client.get("/vendor/export", params={"assessment_id": "not-a-uuid"})
+    assert response.status_code == 400
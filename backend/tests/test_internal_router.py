@@ -0,0 +1,27 @@
+# backend/tests/test_internal_router.py
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+PATHS = ("/internal/stats", "/internal/db-pool", "/internal/metrics")
+
+
+@pytest.mark.parametrize("path", PATHS)
+async def test_forbidden_without_configured_token(client, monkeypatch, path):
+    from app.routers import internal_router
+
+    monkeypatch.setattr(internal_router, "INTERNAL_API_TOKEN", None)
+    response = await client.get(path)
+    assert response.status_code == 403
+    response = await client.get(path, headers={"X-Internal-Token": ""})
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("path", PATHS)
+async def test_token_required(client, monkeypatch, path):
+    from app.routers import internal_router
+
+    monkeypatch.setattr(internal_router, "INTERNAL_API_TOKEN", "s3cret")
+    assert (await client.get(path)).status_code == 403
+    assert (await client.get(path, headers={"X-Internal-Token": "wrong"})).status_code == 403
+    assert (await client.get(path, headers={"X-Internal-Token": "s3cret"})).status_code == 200
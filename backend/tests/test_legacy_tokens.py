@@ -0,0 +1,76 @@
+# backend/tests/test_legacy_tokens.py
+#
+# Tokens issued before the jti claim: their sessions row is keyed by the
+# SHA-256 of the whole JWT (migration 0003, scripts/fill_sessions_token_key.py)
+# and must keep working, and logging out, once 0004 drops the index on the
+# full token.
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def _legacy_session(vendor_id: int) -> str:
+    """A pre-jti token with its sessions row as the fill script leaves it."""
+    from jose import jwt
+
+    from app import db, models
+    from app.services import token_service
+
+    expire = datetime.utcnow() + timedelta(hours=1)
+    token = jwt.encode(
+        {"sub": f"vendor:{vendor_id}", "exp": expire}, token_service.SECRET_KEY, algorithm=token_service.ALGORITHM
+    )
+    key = hashlib.sha256(token.encode()).hexdigest()
+    assert token_service.token_key(token) == key
+    async with db.AsyncSessionLocal() as session:
+        session.add(models.SessionToken(token_key=key, token=token, vendor_id=vendor_id))
+        await session.commit()
+    return token
+
+
+async def _session_exists(token: str) -> bool:
+    from sqlalchemy import select
+
+    from app import db, models
+
+    key = hashlib.sha256(token.encode()).hexdigest()
+    async with db.AsyncSessionLocal() as session:
+        row = await session.execute(select(models.SessionToken.id).where(models.SessionToken.token_key == key))
+        return row.first() is not None
+
+
+@pytest.mark.parametrize("logout_path", ["/vendor/logout", "/auth/logout"])
+async def test_legacy_token_logs_in_and_out(client, vendor, logout_path):
+    token = await _legacy_session(vendor["id"])
+    client.cookies.set("access_token", token)
+
+    response = await client.get("/vendor/dashboard")
+    assert response.status_code == 200, response.text
+    assert response.json()["vendor"]["email"] == vendor["email"]
+
+    response = await client.post(logout_path)
+    assert response.status_code == 200, response.text
+    assert not await _session_exists(token)
+
+    client.cookies.set("access_token", token)
+    assert (await client.get("/vendor/dashboard")).status_code == 401
+
+
+async def test_sessions_are_found_by_token_key_after_0004(client):
+    from sqlalchemy import inspect, text
+
+    from app import db
+
+    async with db.async_engine.connect() as conn:
+        indexes = await conn.run_sync(lambda sync: inspect(sync).get_indexes("sessions"))
+        by_name = {index["name"]: index for index in indexes}
+        assert "ix_sessions_token" not in by_name
+        assert by_name["ix_sessions_token_key"]["unique"]
+
+        plan = (await conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT id FROM sessions WHERE token_key = :key"), {"key": "0" * 64}
+        )).all()
+    assert any("ix_sessions_token_key" in row[-1] for row in plan), plan
@@ -0,0 +1,20 @@
+# backend/tests/test_logout.py
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_logout_logs_a_failed_session_delete(client, vendor, monkeypatch, caplog):
+    from app import services as auth
+    from app.routers import vendor_router
+
+    async def broken_remove(database, token):
+        raise RuntimeError("session store down")
+
+    monkeypatch.setattr(auth, "remove_token", broken_remove)
+    with caplog.at_level("ERROR", logger=vendor_router.logger.name):
+        response = await client.post("/vendor/logout")
+    assert response.status_code == 200
+    assert "access_token" not in client.cookies
+    [failure] = [r for r in caplog.records if r.name == vendor_router.logger.name]
+    assert failure.exc_info[0] is RuntimeError
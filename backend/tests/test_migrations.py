@@ -0,0 +1,126 @@
+# backend/tests/test_migrations.py
+#
+# Migrations run in a subprocess: migrations/env.py takes its URL from
+# app.db, which is fixed for this process.
+import os
+import sqlite3
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+
+def _alembic(url: str, *args: str):
+    env = {**os.environ, "DATABASE_URL": url}
+    env.pop("ASYNC_DATABASE_URL", None)
+    proc = subprocess.run(
+        [sys.executable, "-m", "alembic", *args], cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def _hex() -> str:
+    return uuid.uuid4().hex
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """
+    A database as the old start-up create_all left it: no unique index on
+    candidate.email or on the links, emails as typed, duplicate links.
+    """
+    path = tmp_path / "legacy.db"
+    url = f"sqlite:///{path}"
+    _alembic(url, "upgrade", "0001")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        DROP INDEX ix_candidate_email;
+        CREATE INDEX ix_candidate_email ON candidate (email);
+        DROP TABLE assessment_candidate;
+        CREATE TABLE assessment_candidate (
+            assessment_candidate_id CHAR(32) PRIMARY KEY,
+            assessment_id CHAR(32) NOT NULL REFERENCES assessment (assessment_id) ON DELETE CASCADE,
+            candidate_uuid CHAR(32) NOT NULL REFERENCES candidate (candidate_uuid) ON DELETE CASCADE,
+            status VARCHAR(50) NOT NULL DEFAULT 'invited',
+            score FLOAT,
+            submitted_at TIMESTAMP,
+            is_feedback TEXT,
+            invited_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            session_jti VARCHAR(255),
+            invite_token VARCHAR(255) UNIQUE,
+            invite_expiry TIMESTAMP NOT NULL DEFAULT (datetime('now', '+10 days'))
+        );
+    """)
+    conn.close()
+    return path, url
+
+
+def test_unique_indexes_on_a_legacy_database(legacy_db):
+    path, url = legacy_db
+    a1, a2 = _hex(), _hex()
+    jo, jo_upper, ann = _hex(), _hex(), _hex()
+    conn = sqlite3.connect(path)
+    conn.executescript(f"""
+        INSERT INTO vendors (id, company_name, email, password_hash) VALUES (1, 'Acme', 'acme@example.com', 'x');
+        INSERT INTO assessment (assessment_id, title, vendor_id, required_candidates)
+            VALUES ('{a1}', 'One', 1, 1), ('{a2}', 'Two', 1, 1);
+        INSERT INTO candidate (id, name, email, candidate_uuid) VALUES
+            (1, 'Jo', 'jo@example.com', '{jo}'),
+            (2, 'Jo', ' Jo@Example.com', '{jo_upper}'),
+            (3, 'Ann', 'Ann@Example.com', '{ann}');
+        INSERT INTO assessment_candidate (assessment_candidate_id, assessment_id, candidate_uuid, status, invited_date)
+        VALUES
+            ('{_hex()}', '{a1}', '{jo}', 'invited', '2026-01-01 00:00:00'),
+            ('{_hex()}', '{a1}', '{jo_upper}', 'shortlisted', '2026-01-02 00:00:00'),
+            ('{_hex()}', '{a2}', '{jo_upper}', 'rejected', '2026-01-02 00:00:00'),
+            ('{_hex()}', '{a1}', '{ann}', 'invited', '2026-01-01 00:00:00'),
+            ('{_hex()}', '{a1}', '{ann}', 'interviewed', '2026-01-03 00:00:00');
+    """)
+    conn.commit()
+    conn.close()
+
+    _alembic(url, "upgrade", "head")
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT email, candidate_uuid FROM candidate ORDER BY id").fetchall() == [
+            ("jo@example.com", jo),
+            ("ann@example.com", ann),
+        ]
+        links = conn.execute(
+            "SELECT assessment_id, candidate_uuid, status FROM assessment_candidate ORDER BY assessment_id, status"
+        ).fetchall()
+        assert sorted(links) == sorted([(a1, jo, "invited"), (a1, ann, "invited"), (a2, jo, "rejected")])
+        counters = dict(
+            (aid, rest) for aid, *rest in conn.execute(
+                "SELECT assessment_id, candidates_total, invited_count, shortlisted_count, "
+                "interviewed_count, rejected_count FROM assessment"
+            )
+        )
+        assert counters == {a1: [2, 2, 0, 0, 0], a2: [1, 0, 0, 0, 1]}
+
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO candidate (name, email, candidate_uuid) VALUES ('X', 'ann@example.com', ?)", (_hex(),))
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(
+                "INSERT INTO assessment_candidate (assessment_candidate_id, assessment_id, candidate_uuid) VALUES (?, ?, ?)",
+                (_hex(), a2, jo),
+            )
+    finally:
+        conn.close()
+
+
+def test_fresh_database_keeps_its_constraints(tmp_path):
+    path = tmp_path / "fresh.db"
+    _alembic(f"sqlite:///{path}", "upgrade", "head")
+    conn = sqlite3.connect(path)
+    try:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        # the link constraint stays the table's own; no second index on top
+        assert "uq_assessment_candidate_link" not in names
+        assert "ix_candidate_email" in names
+    finally:
+        conn.close()
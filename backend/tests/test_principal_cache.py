@@ -0,0 +1,62 @@
+# backend/tests/test_principal_cache.py
+#
+# The in-process cache of verified tokens must never outlive the session:
+# a token is refused on the very next request after logout or a password
+# change, with no wait for PRINCIPAL_CACHE_TTL_SECONDS.
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def _cached_token(client) -> str:
+    from app import services as auth
+
+    token = client.cookies["access_token"]
+    assert (await client.get("/vendor/dashboard")).status_code == 200
+    assert auth.principal_cache.get(token, "vendor") is not None
+    return token
+
+
+@pytest.mark.parametrize("logout_path", ["/vendor/logout", "/auth/logout"])
+async def test_token_rejected_right_after_logout(client, vendor, logout_path):
+    token = await _cached_token(client)
+
+    assert (await client.post(logout_path)).status_code == 200
+
+    client.cookies.set("access_token", token)
+    assert (await client.get("/vendor/dashboard")).status_code == 401
+
+
+async def test_token_rejected_right_after_password_change(client, vendor):
+    token = await _cached_token(client)
+
+    response = await client.post(
+        "/vendor/change-password", json={"old_password": "s3cret-pass", "new_password": "n3w-secret-pass"}
+    )
+    assert response.status_code == 200, response.text
+
+    client.cookies.set("access_token", token)
+    assert (await client.get("/vendor/dashboard")).status_code == 401
+
+    client.cookies.clear()
+    response = await client.post("/auth/vendor/login", json={"email": vendor["email"], "password": "s3cret-pass"})
+    assert response.status_code == 401
+    response = await client.post("/auth/vendor/login", json={"email": vendor["email"], "password": "n3w-secret-pass"})
+    assert response.status_code == 200, response.text
+    assert (await client.get("/vendor/dashboard")).status_code == 200
+
+
+async def test_password_change_evicts_the_vendors_other_cached_tokens(client, vendor):
+    from app import services as auth
+
+    first = await _cached_token(client)
+    response = await client.post("/auth/vendor/login", json={"email": vendor["email"], "password": "s3cret-pass"})
+    assert response.status_code == 200, response.text
+    second = await _cached_token(client)
+
+    response = await client.post(
+        "/vendor/change-password", json={"old_password": "s3cret-pass", "new_password": "n3w-secret-pass"}
+    )
+    assert response.status_code == 200, response.text
+    assert auth.principal_cache.get(first, "vendor") is None
+    assert auth.principal_cache.get(second, "vendor") is None
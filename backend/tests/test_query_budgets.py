@@ -0,0 +1,67 @@
+# backend/tests/test_query_budgets.py
+#
+# Per-endpoint SQL budgets, authentication included. A failure lists the
+# repeated statement shapes, which is usually the N+1 that crept in.
+import pytest
+
+from conftest import create_assessment, import_candidates
+
+pytestmark = pytest.mark.anyio
+
+BUDGETS = {
+    "dashboard": 4,
+    "dashboard_first_pages": 3,
+    "assessment_detail": 4,
+    "assessment_detail_page": 3,
+    "candidates_page": 2,
+    "status_update": 3,
+    "batch_status_update": 4,
+}
+
+
+@pytest.fixture
+async def seeded(client, vendor):
+    """Two assessments of 30 candidates; returns (assessment_id, first page)."""
+    await import_candidates(client, await create_assessment(client, "Other role"), 30)
+    assessment_id = await create_assessment(client)
+    await import_candidates(client, assessment_id, 30)
+    response = await client.get(f"/vendor/assessment/{assessment_id}/candidates", params={"limit": 10})
+    assert response.status_code == 200, response.text
+    return assessment_id, response.json()
+
+
+def _request(name: str, assessment_id: str, page: dict):
+    first = page["candidates"][0]["candidate_uuid"]
+    return {
+        "dashboard": ("GET", "/vendor/dashboard", {}),
+        "dashboard_first_pages": ("GET", "/vendor/dashboard", {"params": {"candidates_limit": 5}}),
+        "assessment_detail": ("GET", f"/vendor/assessment/{assessment_id}", {}),
+        "assessment_detail_page": ("GET", f"/vendor/assessment/{assessment_id}", {"params": {"limit": 5}}),
+        "candidates_page": (
+            "GET",
+            f"/vendor/assessment/{assessment_id}/candidates",
+            {"params": {"limit": 10, "cursor": page["next_cursor"]}},
+        ),
+        "status_update": (
+            "POST",
+            f"/vendor/assessment/{assessment_id}/candidate/{first}/status",
+            {"json": {"status": "shortlisted"}},
+        ),
+        "batch_status_update": (
+            "POST",
+            f"/vendor/assessment/{assessment_id}/candidates/status",
+            {"json": {"updates": [
+                {"candidate_uuid": c["candidate_uuid"], "status": "rejected"} for c in page["candidates"]
+            ]}},
+        ),
+    }[name]
+
+
+@pytest.mark.parametrize("name", sorted(BUDGETS))
+async def test_endpoint_query_budget(client, seeded, name):
+    from app.db.instrumentation import assert_max_queries
+
+    method, url, kwargs = _request(name, *seeded)
+    with assert_max_queries(BUDGETS[name]):
+        response = await client.request(method, url, **kwargs)
+    assert response.status_code == 200, response.text
@@ -0,0 +1,55 @@
+# backend/tests/test_query_counts.py
+#
+# Statement counts must not grow with the data: the dashboard graph is
+# eager-loaded one level per query (repository.get_assessment_with_candidates).
+import pytest
+
+from conftest import create_assessment, import_candidates, register_vendor
+
+pytestmark = pytest.mark.anyio
+
+
+async def _seed_vendor(client, assessments: int, candidates_each: int) -> int:
+    vendor = await register_vendor(client)
+    for i in range(assessments):
+        assessment_id = await create_assessment(client, f"Role {i}")
+        await import_candidates(client, assessment_id, candidates_each)
+    return vendor["id"]
+
+
+async def test_dashboard_graph_query_count_is_constant(client):
+    from app import db
+    from app import repository as crud
+    from app.db.instrumentation import count_queries
+
+    # N and 10N candidates (both under selectin's 500-key IN batches)
+    small = await _seed_vendor(client, 2, 20)
+    large = await _seed_vendor(client, 10, 40)
+
+    counts = {}
+    for vendor_id, expected in ((small, 40), (large, 400)):
+        async with db.AsyncSessionLocal() as session:
+            with count_queries() as stats:
+                assessments = await crud.get_assessment_with_candidates(session, vendor_id)
+            assert sum(len(a.candidates) for a in assessments) == expected
+            assert all(link.candidate is not None for a in assessments for link in a.candidates)
+        counts[vendor_id] = stats.count
+
+    assert counts[small] == counts[large], counts
+    # assessments, links, candidates
+    assert counts[large] == 3
+
+
+async def test_dashboard_request_query_count_is_constant(client):
+    from app.db.instrumentation import count_queries
+
+    counts = []
+    for assessments, candidates_each in ((2, 20), (10, 40)):
+        await _seed_vendor(client, assessments, candidates_each)  # logs in as the new vendor
+        with count_queries() as stats:
+            response = await client.get("/vendor/dashboard")
+        assert response.status_code == 200, response.text
+        assert sum(len(a["candidates"]) for a in response.json()["assessments"]) == assessments * candidates_each
+        counts.append(stats.count)
+
+    assert counts[0] == counts[1]
@@ -0,0 +1,118 @@
+# backend/tests/test_search.py
+#
+# /vendor/search/candidates and /vendor/search/assessments on SQLite: the
+# FTS5 tables of migration 0007 follow inserts, updates and deletes through
+# their triggers, and results come back best first.
+import uuid
+
+import pytest
+
+from conftest import create_assessment, register_vendor
+
+pytestmark = pytest.mark.anyio
+
+
+def _word() -> str:
+    # a token no other test writes; letters only, so it stays one FTS term
+    return "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:10])
+
+
+async def _search(client, kind: str, q: str) -> list:
+    response = await client.get(f"/vendor/search/{kind}", params={"q": q})
+    assert response.status_code == 200, response.text
+    return response.json()["results"]
+
+
+async def _add(client, assessment_id: str, **candidate):
+    response = await client.post(f"/vendor/assessment/{assessment_id}/add-candidate", json=candidate)
+    assert response.status_code == 200, response.text
+
+
+async def _execute(statement):
+    from app import db
+
+    async with db.AsyncSessionLocal() as session:
+        await session.execute(statement)
+        await session.commit()
+
+
+async def test_candidate_index_follows_inserts_updates_and_deletes(client, vendor):
+    from sqlalchemy import delete
+
+    from app import models
+
+    word = _word()
+    email = f"{word}@example.com"
+    assessment_id = await create_assessment(client)
+    await _add(client, assessment_id, name=f"Ada {word.title()}", email=email, phone="+1 555 013 4711")
+
+    hits = await _search(client, "candidates", word[:5])
+    assert [h["email"] for h in hits] == [email]
+    assert [h["email"] for h in await _search(client, "candidates", "4711")] == [email]
+
+    # a new phone replaces the indexed one
+    await _add(client, assessment_id, name="Ada", email=email, phone="+1 555 013 9822")
+    assert await _search(client, "candidates", "4711") == []
+    assert [h["email"] for h in await _search(client, "candidates", "9822")] == [email]
+
+    AC = models.AssessmentCandidate
+    C = models.Candidate
+    candidate_uuid = uuid.UUID(hits[0]["candidate_uuid"])
+    await _execute(delete(AC).where(AC.candidate_uuid == candidate_uuid))
+    await _execute(delete(C).where(C.candidate_uuid == candidate_uuid))
+    assert await _search(client, "candidates", word) == []
+
+
+async def test_candidates_are_ranked_and_scoped_to_the_vendor(client, vendor):
+    word = _word()
+    assessment_id = await create_assessment(client)
+    await _add(client, assessment_id, name=f"{word} {word}", email=f"twice-{uuid.uuid4().hex[:8]}@example.com")
+    await _add(client, assessment_id, name=f"{word} Longer Name Here", email=f"once-{uuid.uuid4().hex[:8]}@example.com")
+
+    await register_vendor(client)
+    theirs = await create_assessment(client)
+    await _add(client, theirs, name=word, email=f"theirs-{uuid.uuid4().hex[:8]}@example.com")
+    assert [h["name"] for h in await _search(client, "candidates", word)] == [word]
+
+    await client.post("/auth/vendor/login", json={"email": vendor["email"], "password": "s3cret-pass"})
+    hits = await _search(client, "candidates", word)
+    assert [h["name"] for h in hits] == [f"{word} {word}", f"{word} Longer Name Here"]
+    assert hits[0]["score"] == 1.0
+    assert 0 < hits[1]["score"] < 1.0
+
+    # a term in every candidate still scores (bm25 alone gives ~1e-6 here)
+    hits = await _search(client, "candidates", "example")
+    assert len(hits) == 2
+    assert hits[0]["score"] == 1.0
+    assert all(h["score"] > 0 for h in hits)
+
+
+async def test_assessment_index_follows_updates_and_deletes(client, vendor):
+    from sqlalchemy import delete, update
+
+    from app import models
+
+    word, renamed = _word(), _word()
+    assessment_id = await create_assessment(client, f"{word} Engineer", description="Builds things")
+    assert [h["assessment_id"] for h in await _search(client, "assessments", word)] == [assessment_id]
+
+    A = models.Assessment
+    aid = uuid.UUID(assessment_id)
+    await _execute(update(A).where(A.assessment_id == aid).values(title=f"{renamed} Engineer"))
+    assert await _search(client, "assessments", word) == []
+    assert [h["assessment_id"] for h in await _search(client, "assessments", renamed)] == [assessment_id]
+
+    await _execute(delete(A).where(A.assessment_id == aid))
+    assert await _search(client, "assessments", renamed) == []
+
+
+async def test_assessments_rank_title_over_skills_over_description(client, vendor):
+    word = _word()
+    in_description = await create_assessment(client, "Role one", description=f"Uses {word} daily")
+    in_skills = await create_assessment(client, "Role two", skills=f"{word}, SQL")
+    in_title = await create_assessment(client, f"{word} Lead")
+
+    hits = await _search(client, "assessments", word)
+    assert [h["assessment_id"] for h in hits] == [in_title, in_skills, in_description]
+    assert hits[0]["score"] == 1.0
+    assert hits[0]["score"] > hits[1]["score"] > hits[2]["score"] > 0
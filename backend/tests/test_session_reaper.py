@@ -0,0 +1,80 @@
+# backend/tests/test_session_reaper.py
+#
+# Expired rows of the sessions table (SESSION_STORE=sql): rejected on use,
+# and deleted batch by batch by the session reaper.
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def _add_sessions(vendor_id: int, count: int, **fields) -> list:
+    from app import db, models
+
+    keys = [uuid.uuid4().hex for _ in range(count)]
+    async with db.AsyncSessionLocal() as session:
+        session.add_all(models.SessionToken(token_key=key, vendor_id=vendor_id, **fields) for key in keys)
+        await session.commit()
+    return keys
+
+
+async def _existing(keys: list) -> set:
+    from sqlalchemy import select
+
+    from app import db, models
+
+    S = models.SessionToken
+    async with db.AsyncSessionLocal() as session:
+        return set((await session.execute(select(S.token_key).where(S.token_key.in_(keys)))).scalars())
+
+
+async def test_expired_session_is_rejected(client, vendor):
+    from sqlalchemy import update
+
+    from app import db, models
+    from app import services as auth
+
+    assert (await client.get("/vendor/dashboard")).status_code == 200
+
+    S = models.SessionToken
+    async with db.AsyncSessionLocal() as session:
+        await session.execute(
+            update(S).where(S.vendor_id == vendor["id"]).values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        await session.commit()
+    # a verified token is trusted for up to PRINCIPAL_CACHE_TTL_SECONDS
+    auth.principal_cache.clear()
+
+    response = await client.get("/vendor/dashboard")
+    assert response.status_code == 401
+
+
+async def test_reaper_deletes_expired_sessions_in_batches(client, vendor, monkeypatch):
+    from app.services import session_reaper
+
+    # expired rows other tests left behind
+    await session_reaper.reap_expired_sessions(pause=0)
+
+    now = datetime.utcnow()
+    old = now - session_reaper.LEGACY_SESSION_MAX_AGE - timedelta(minutes=1)
+    expired = await _add_sessions(vendor["id"], 5, expires_at=now - timedelta(minutes=1))
+    expired += await _add_sessions(vendor["id"], 2, created_at=old, expires_at=None)
+    live = await _add_sessions(vendor["id"], 3, expires_at=now + timedelta(hours=1))
+    live += await _add_sessions(vendor["id"], 1, created_at=now, expires_at=None)
+
+    batches = []
+    delete_batch = session_reaper.delete_expired_batch
+
+    async def recording_batch(batch_size):
+        batches.append(await delete_batch(batch_size))
+        return batches[-1]
+
+    monkeypatch.setattr(session_reaper, "delete_expired_batch", recording_batch)
+    assert await session_reaper.reap_expired_sessions(batch_size=3, pause=0) == 7
+
+    assert batches == [3, 3, 1]
+    assert await _existing(expired) == set()
+    assert await _existing(live) == set(live)
+    assert session_reaper.reaper_stats.last_deleted == 7
@@ -0,0 +1,91 @@
+# backend/tests/test_session_store.py
+#
+# Behaviour every SessionStore must share, so switching SESSION_STORE never
+# changes who is logged in. The redis backend runs against fakeredis.
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def _new_key() -> str:
+    return uuid.uuid4().hex
+
+
+@pytest.fixture(params=["sql", "memory", "redis"])
+async def store(request, client):
+    from app.services import session_store
+
+    if request.param == "redis":
+        fakeredis = pytest.importorskip("fakeredis")
+        store = session_store.RedisSessionStore("fakeredis://", client=fakeredis.FakeAsyncRedis(decode_responses=True))
+    else:
+        store = session_store.make_store(request.param)
+    yield store
+    await store.close()
+
+
+@pytest.fixture
+async def session(client):
+    from app import db
+
+    async with db.AsyncSessionLocal() as s:
+        yield s
+
+
+@pytest.fixture
+def record(vendor):
+    """Makes sessions for the test vendor, expiring expires_in from now (None: never)."""
+    from app.services.session_store import SessionRecord
+
+    def make(expires_in=timedelta(minutes=5)):
+        expires_at = datetime.utcnow() + expires_in if expires_in is not None else None
+        return SessionRecord(_new_key(), vendor_id=vendor["id"], expires_at=expires_at)
+
+    return make
+
+
+async def test_round_trip(store, session, record):
+    saved = record()
+    await store.save(session, saved)
+    found = await store.get(session, saved.key)
+    assert found is not None
+    assert (found.key, found.user_id, found.vendor_id) == (saved.key, None, saved.vendor_id)
+    assert abs((found.expires_at - saved.expires_at).total_seconds()) < 1
+
+
+async def test_unknown_key(store, session):
+    assert await store.get(session, _new_key()) is None
+
+
+async def test_delete_removes(store, session, record):
+    saved = record()
+    await store.save(session, saved)
+    await store.delete(session, saved.key)
+    assert await store.get(session, saved.key) is None
+
+
+async def test_delete_unknown_key_is_a_no_op(store, session):
+    await store.delete(session, _new_key())
+
+
+async def test_expired_session_is_hidden(store, session, record):
+    expired = record(expires_in=timedelta(seconds=-1))
+    await store.save(session, expired)
+    assert await store.get(session, expired.key) is None
+
+
+async def test_session_without_expiry_is_live(store, session, record):
+    saved = record(expires_in=None)
+    await store.save(session, saved)
+    assert await store.get(session, saved.key) is not None
+
+
+async def test_keys_are_isolated(store, session, record):
+    a, b = record(), record()
+    await store.save(session, a)
+    await store.save(session, b)
+    await store.delete(session, a.key)
+    assert await store.get(session, b.key) is not None
@@ -0,0 +1,186 @@
+# backend/tests/test_skills.py
+#
+# Skill parsing, the assessment_skill index (migration 0008) and matching.
+import uuid
+
+import pytest
+
+from conftest import create_assessment, fetch_assessment, register_vendor
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_skill_index_writes_keep_updated_at(client, vendor):
+    from app import db
+    from app import repository as crud
+
+    assessment_id = await create_assessment(client, skills="Python, SQL")
+    created = await fetch_assessment(assessment_id)
+    assert created.skill_count == 2
+
+    async with db.AsyncSessionLocal() as session:
+        await crud.backfill_assessment_skills(session, only_missing=False)
+
+    stored = await fetch_assessment(assessment_id)
+    assert stored.skill_count == 2
+    assert stored.updated_at == created.updated_at is None
+
+
+async def _match(client, *skills, **params) -> dict:
+    response = await client.get("/vendor/assessments/match", params={"skills": list(skills), **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def _execute(*statements):
+    from app import db
+
+    async with db.AsyncSessionLocal() as session:
+        for statement in statements:
+            await session.execute(statement)
+        await session.commit()
+
+
+def test_parse_skills_resolves_aliases():
+    from app import repository as crud
+
+    assert crud.parse_skills(" K8s; C#, c sharp | CPP\nC++, Python3, python ") == [
+        "kubernetes", "c#", "c++", "python",
+    ]
+    assert crud.parse_skills(["Node", "nodejs", "(Go)", "golang", " - "]) == ["node.js", "go"]
+    assert crud.normalize_skill("  Amazon   Web Services ") == "aws"
+
+
+async def test_match_resolves_aliases(client, vendor):
+    cluster = await create_assessment(client, skills="K8s, C#, cpp")
+    plain_c = await create_assessment(client, skills="C")
+
+    body = await _match(client, "kubernetes")
+    assert body["skills"] == ["kubernetes"]
+    assert [h["assessment_id"] for h in body["results"]] == [cluster]
+    for query in ("csharp", "c#", "c++", "CPP"):
+        assert [h["assessment_id"] for h in (await _match(client, query))["results"]] == [cluster], query
+    assert [h["assessment_id"] for h in (await _match(client, "c"))["results"]] == [plain_c]
+
+
+async def test_match_orders_by_overlap_then_jaccard(client, vendor):
+    word = uuid.uuid4().hex[:8]
+    a, b, c, d = (f"{name}-{word}" for name in "abcd")
+    exact = await create_assessment(client, skills=f"{a}, {b}")
+    superset = await create_assessment(client, skills=f"{a}, {b}, {c}, {d}")
+    single = await create_assessment(client, skills=a)
+    diluted = await create_assessment(client, skills=f"{a}, {c}, {d}")
+    await create_assessment(client, skills=c)
+
+    body = await _match(client, f"{a},{b}", f"unknown-{word}")
+    assert body["unknown_skills"] == [f"unknown-{word}"]
+    hits = [(h["assessment_id"], h["matched_skills"], h["score"]) for h in body["results"]]
+    # Q has three skills, one of them unknown
+    assert hits == [
+        (exact, 2, round(2 / 3, 4)),
+        (superset, 2, round(2 / 5, 4)),
+        (single, 1, round(1 / 3, 4)),
+        (diluted, 1, round(1 / 5, 4)),
+    ]
+
+    body = await _match(client, a, b, require_all="true")
+    assert [h["assessment_id"] for h in body["results"]] == [exact, superset]
+    assert (await _match(client, a, f"unknown-{word}", require_all="true"))["results"] == []
+
+
+async def test_match_filters_by_vendor_and_status(client, vendor):
+    from sqlalchemy import update
+
+    from app import db, models
+    from app import repository as crud
+
+    skill = f"skill-{uuid.uuid4().hex[:8]}"
+    draft = await create_assessment(client, skills=skill)
+    opened = await create_assessment(client, skills=skill)
+    A = models.Assessment
+    await _execute(update(A).where(A.assessment_id == uuid.UUID(opened)).values(status="open"))
+
+    other = await register_vendor(client)
+    theirs = await create_assessment(client, skills=skill)
+    assert [h["assessment_id"] for h in (await _match(client, skill))["results"]] == [theirs]
+
+    async with db.AsyncSessionLocal() as session:
+        everyone = await crud.match_assessments(session, [skill])
+        assert {str(a.assessment_id) for a, _, _ in everyone} == {draft, opened, theirs}
+        mine = await crud.match_assessments(session, [skill], vendor_id=vendor["id"])
+        assert {str(a.assessment_id) for a, _, _ in mine} == {draft, opened}
+        theirs_only = await crud.match_assessments(session, [skill], vendor_id=other["id"], status="open")
+        assert theirs_only == []
+
+    await client.post("/auth/vendor/login", json={"email": vendor["email"], "password": "s3cret-pass"})
+    assert [h["assessment_id"] for h in (await _match(client, skill, status=" Open "))["results"]] == [opened]
+
+
+async def test_match_without_backfilled_skill_count(client, vendor):
+    from sqlalchemy import update
+
+    from app import db, models
+    from app import repository as crud
+
+    word = uuid.uuid4().hex[:8]
+    a, b, c = (f"{name}-{word}" for name in "abc")
+    assessment_id = await create_assessment(client, skills=f"{a}, {b}, {c}")
+    A = models.Assessment
+    # skill rows written, skill_count not (yet)
+    await _execute(update(A).where(A.assessment_id == uuid.UUID(assessment_id)).values(skill_count=0))
+
+    # |A ∪ Q| falls back to |Q|
+    assert (await _match(client, a, b))["results"][0]["score"] == 1.0
+
+    async with db.AsyncSessionLocal() as session:
+        assert await crud.backfill_assessment_skills(session) >= 1
+    assert (await fetch_assessment(assessment_id)).skill_count == 3
+    assert (await _match(client, a, b))["results"][0]["score"] == round(2 / 3, 4)
+
+
+async def test_interrupted_backfill_restarts_with_only_missing(client, vendor):
+    from sqlalchemy import delete, func, select, update
+
+    from app import db, models
+    from app import repository as crud
+
+    word = uuid.uuid4().hex[:8]
+    ids = [await create_assessment(client, skills=f"x-{word}, y-{word}, K8s") for _ in range(3)]
+    uuids = [uuid.UUID(aid) for aid in ids]
+    A = models.Assessment
+    AS = models.AssessmentSkill
+    # as before migration 0008: free text only
+    await _execute(
+        delete(AS).where(AS.assessment_id.in_(uuids)),
+        update(A).where(A.assessment_id.in_(uuids)).values(skill_count=0),
+    )
+
+    class Interrupted(Exception):
+        pass
+
+    async with db.AsyncSessionLocal() as session:
+        commit = session.commit
+
+        async def commit_then_fail():
+            # the first batch lands, the run dies before the second
+            await commit()
+            session.commit = interrupted
+
+        async def interrupted():
+            raise Interrupted
+
+        session.commit = commit_then_fail
+        with pytest.raises(Interrupted):
+            await crud.backfill_assessment_skills(session, batch_size=1)
+        await session.rollback()
+
+    counts = [(await fetch_assessment(aid)).skill_count for aid in ids]
+    assert sorted(counts) == [0, 0, 3]
+
+    async with db.AsyncSessionLocal() as session:
+        assert await crud.backfill_assessment_skills(session, batch_size=1) == 2
+        rows = (await session.execute(
+            select(AS.assessment_id, func.count()).where(AS.assessment_id.in_(uuids)).group_by(AS.assessment_id)
+        )).all()
+    assert sorted(n for _, n in rows) == [3, 3, 3]
+    assert [(await fetch_assessment(aid)).skill_count for aid in ids] == [3, 3, 3]
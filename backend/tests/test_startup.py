@@ -0,0 +1,44 @@
+# backend/tests/test_startup.py
+#
+# Cold-start budget: app.main is imported, and its lifespan run, in fresh
+# interpreters by the probe of benchmarks/bench_startup.py. The database
+# URL points into a directory that does not exist, so any connection made
+# during import or start-up fails the probe.
+import importlib.util
+import os
+import statistics
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "2000"))
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1000"))
+RUNS = 3
+
+
+def _load_bench():
+    path = os.path.join(BACKEND_DIR, "benchmarks", "bench_startup.py")
+    spec = importlib.util.spec_from_file_location("bench_startup", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_import_and_startup_within_budget(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'missing' / 'app.db'}")
+    monkeypatch.delenv("ASYNC_DATABASE_URL", raising=False)
+    monkeypatch.delenv("DB_CREATE_ALL", raising=False)
+    monkeypatch.delenv("DB_WARMUP_CONNECTIONS", raising=False)
+    monkeypatch.setenv("UPLOADS_DIR", str(tmp_path / "uploads"))
+
+    bench = _load_bench()
+    try:
+        runs = [bench.probe()[0] for _ in range(RUNS)]
+    except SystemExit as exc:
+        pytest.fail(str(exc))
+
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    startup_ms = statistics.median(r["startup_ms"] for r in runs)
+    assert import_ms <= IMPORT_BUDGET_MS, f"import took {import_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+    assert startup_ms <= STARTUP_BUDGET_MS, f"start-up took {startup_ms:.0f}ms (budget {STARTUP_BUDGET_MS:.0f}ms)"
@@ -39,9 +39,24 @@ export function vendorLogout() {
   return request(`${BASE}/auth/logout`, { method: "POST" });
 }
 
+// Build "?a=1&b=2" from an object, skipping empty values
+function queryString(params = {}) {
+  const qs = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== "") {
+      qs.append(key, value);
+    }
+  });
+  const s = qs.toString();
+  return s ? `?${s}` : "";
+}
+
 // ----------- Vendor ----------
-export function getVendorDashboard() {
-  return request(`${BASE}/vendor/dashboard`);
+// candidatesLimit: return only the first page of candidates per assessment
+// (each assessment then carries next_cursor for getAssessmentCandidates)
+export function getVendorDashboard({ candidatesLimit, status } = {}) {
+  const qs = queryString({ candidates_limit: candidatesLimit, status });
+  return request(`${BASE}/vendor/dashboard${qs}`);
 }
 
 export function changeVendorPassword(oldPassword, newPassword) {
@@ -63,6 +78,12 @@ export function getAssessment(assessmentId) {
   return request(`${BASE}/vendor/assessment/${assessmentId}`);
 }
 
+// Keyset-paginated candidates: pass the previous response's next_cursor
+export function getAssessmentCandidates(assessmentId, { cursor, limit, status } = {}) {
+  const qs = queryString({ cursor, limit, status });
+  return request(`${BASE}/vendor/assessment/${assessmentId}/candidates${qs}`);
+}
+
 // ----------- Candidates ----------
 export function addCandidateToAssessment(assessmentId, name, email, phone, resume_url) {
   const payload = { name, email, phone, resume_url };
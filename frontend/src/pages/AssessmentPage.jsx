@@ -38,7 +38,8 @@ export default function AssessmentPage() {
 
   async function fetchVendor() {
     try {
-      const body = await getVendorDashboard(); // already unwrapped in api.js
+      // only the vendor block is used here, so keep the candidate pages tiny
+      const body = await getVendorDashboard({ candidatesLimit: 1 });
       setVendor(body.vendor || null);
     } catch (err) {
       console.warn("Failed to load vendor", err);
@@ -54,13 +54,13 @@ export default function SettingsPage() {
       // new api.js: changeVendorPassword throws on error, returns JSON on success
       await changeVendorPassword(oldPwd, newPwd);
 
-      setSuccess("Password updated successfully.");
+      setSuccess("Password updated. Please log in again.");
       setOldPwd("");
       setNewPwd("");
       setConfirmPwd("");
 
-      // Optional: navigate back after success
-      // setTimeout(() => navigate("/vendor/dashboard"), 1000);
+      // the password change ended this session
+      setTimeout(() => navigate("/vendor/login"), 1000);
     } catch (err) {
       console.error("Password change failed:", err);
       setError(err.message || "Failed to update password. Please try again.");
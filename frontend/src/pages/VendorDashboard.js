@@ -6,6 +6,10 @@ import AssessmentItem from "../components/AssessmentItem";
 import Header from "../components/Header";
 import { getVendorDashboard } from "../api/api";
 
+// The list only shows counts, so ask for a small first page of candidates;
+// the rest can be fetched per assessment with getAssessmentCandidates.
+const DASHBOARD_CANDIDATES_LIMIT = 10;
+
 export default function VendorDashboard() {
   const navigate = useNavigate();
 
@@ -20,7 +24,10 @@ export default function VendorDashboard() {
       setError(null);
 
       try {
-        const data = await getVendorDashboard(); // plain JSON: { vendor, assessments }
+        // plain JSON: { vendor, assessments }
+        const data = await getVendorDashboard({
+          candidatesLimit: DASHBOARD_CANDIDATES_LIMIT,
+        });
 
         if (!data || !data.vendor) {
           // no vendor in session – send to login